@@ -13,6 +13,7 @@ from api.v1.routers.project import router as project_router
 from api.v1.routers.logs import router as logs_router
 from api.v1.routers.working_directory import router as working_directory_router
 from api.v1.routers.static_files import router as static_files_router
+from api.v1.routers.static_files import mount_static_files
 from api.v1.routers.directory import router as directory_router
 
 # List of all routers to register
@@ -41,5 +42,6 @@ __all__ = [
     "logs_router",
     "working_directory_router",
     "static_files_router",
+    "mount_static_files",
     "directory_router",
 ]
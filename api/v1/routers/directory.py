@@ -1,60 +1,150 @@
-from pathlib import Path
-from fastapi import APIRouter, Query, HTTPException
-
-from core import  get_directory_lister, get_git_manager
-from core.config import get_settings
+import asyncio
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Iterator, List, Optional, Set
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, HTTPException
+from fastapi.responses import Response, StreamingResponse
+
+from core import get_git_manager, require_directory_lister
+from code_tools.git_manager import GitManager
+from semantic_search.directory_lister import DirectoryLister, DirItem
+from semantic_search.tree_renderer import (
+    dirty_directories,
+    render_enhanced,
+    render_enhanced_line,
+    render_tree,
+    render_tree_bytes,
+)
+from core.config import Settings, get_settings
+from schemas.requests import DirListParams, EnhancedTreeParams
 from utils import (
-    create_success_response,
+    ORJSONResponse,
+    create_orjson_success_response,
     create_error_response,
     create_detailed_error_response,
     validate_file_path,
+    etag_matches,
+    create_not_modified_response,
+    accepts_text,
 )
-router =APIRouter(prefix="/directory")
+router =APIRouter(prefix="/directory", default_response_class=ORJSONResponse)
+
+# Directory walks are blocking (scandir + stat + gitignore matching), so they
+# run on a dedicated pool to keep the event loop free for other requests.
+_DIR_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dirlist")
+
+# Items per chunk when streaming the enhanced tree as NDJSON
+_STREAM_BATCH_SIZE = 256
+
+
+def _stream_enhanced_tree(
+    tree_info: dict,
+    dir_items: List[DirItem],
+    git_status: dict,
+    dirty_dirs: Set[str],
+    show_sizes: bool,
+    show_git_status: bool,
+) -> Iterator[bytes]:
+    """
+    Yield the enhanced tree as NDJSON
+
+    The first line carries the tree summary; each following line is one
+    item ({"path", "line"}). Lines are flushed in batches so large trees
+    are never joined into a single string.
+    """
+    yield orjson.dumps(tree_info) + b"\n"
+
+    batch = []
+    for item in dir_items:
+        line = render_enhanced_line(
+            item, git_status, dirty_dirs, show_sizes, show_git_status
+        )
+        batch.append(orjson.dumps({"path": item.path, "line": line}))
+        if len(batch) >= _STREAM_BATCH_SIZE:
+            yield b"\n".join(batch) + b"\n"
+            batch = []
+    if batch:
+        yield b"\n".join(batch) + b"\n"
+
+
+async def _run_listing(directory_lister, **options):
+    """Run a (cached) directory listing on the directory executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _DIR_EXECUTOR,
+        functools.partial(directory_lister.list_directory_cached, **options),
+    )
+
+
+def _listing_etag(directory_lister: DirectoryLister, options: dict, *parts) -> Optional[str]:
+    """
+    ETag for a response derived from a cached listing
+
+    Combines the listing's content fingerprint with the endpoint-specific
+    render inputs in parts. Returns None if the listing is not cached.
+    """
+    fingerprint = directory_lister.cached_listing_fingerprint(**options)
+    if fingerprint is None:
+        return None
+    digest = hashlib.blake2b(
+        f"{fingerprint}:{parts!r}".encode(), digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+async def _collect_git_status(git_manager: GitManager) -> dict:
+    """Map changed file paths to their git status indicator"""
+    try:
+        status_result = await git_manager.get_status()
+        if status_result.success:
+            status_data = status_result.data.get("status", {})
+
+            # Later entries win: staged overrides untracked overrides modified
+            return {
+                **dict.fromkeys(status_data.get("modified_files", ()), "M"),
+                **dict.fromkeys(status_data.get("untracked_files", ()), "?"),
+                **dict.fromkeys(status_data.get("staged_files", ()), "A"),
+            }
+    except Exception:
+        pass
+    return {}
+
 
 @router.get("/list")
 async def list_directory(
-    directory_path: str = Query(
-        ".", description="Directory path relative to working directory"
-    ),
-    max_depth: int = Query(2, description="Maximum depth to traverse", ge=0, le=10),
-    include_hidden: bool = Query(
-        False, description="Include hidden files and directories"
-    ),
-    show_metadata: bool = Query(
-        True, description="Include file metadata (size, lines, etc.)"
-    ),
-    respect_gitignore: bool = Query(
-        True, description="Filter based on .gitignore patterns"
-    ),
-    files_only: bool = Query(False, description="Show only files, not directories"),
-    dirs_only: bool = Query(False, description="Show only directories, not files"),
+    request: Request,
+    params: Annotated[DirListParams, Query()],
+    settings: Settings = Depends(get_settings),
+    directory_lister: DirectoryLister = Depends(require_directory_lister),
 ):
     """List directory contents with configurable depth and filtering"""
     try:
-        directory_lister = get_directory_lister()
-        settings = get_settings()
-
-        if not directory_lister:
-            return create_error_response("Directory lister not initialized", 500)
-
         # Validate directory path
-        if directory_path != ".":
-            await validate_file_path(directory_path, settings.WORKING_DIR)
+        if params.directory_path != ".":
+            await validate_file_path(params.directory_path, settings.WORKING_DIR)
 
-        result = directory_lister.list_directory(
-            directory_path=directory_path,
-            max_depth=max_depth,
-            include_hidden=include_hidden,
-            show_metadata=show_metadata,
-            respect_gitignore=respect_gitignore,
-            files_only=files_only,
-            dirs_only=dirs_only,
-        )
+        options = params.model_dump()
+        etag = _listing_etag(directory_lister, options, "list")
+        if etag_matches(request, etag):
+            return create_not_modified_response(etag)
+
+        result = await _run_listing(directory_lister, **options)
 
         if "error" in result:
             return create_error_response(result["error"], 400)
 
-        return create_success_response(result)
+        # The listing is cached now, so a fresh walk that found nothing
+        # new still answers a conditional request with 304
+        etag = _listing_etag(directory_lister, options, "list")
+        if etag_matches(request, etag):
+            return create_not_modified_response(etag)
+
+        response = create_orjson_success_response(result)
+        if etag:
+            response.headers["ETag"] = etag
+        return response
 
     except HTTPException:
         raise
@@ -64,27 +154,16 @@ async def list_directory(
 
 @router.get("/tree/{directory_path:path}")
 async def get_directory_tree(
+    request: Request,
     directory_path: str,
     max_depth: int = Query(
         3, description="Maximum depth for tree display", ge=1, le=10
     ),
+    settings: Settings = Depends(get_settings),
+    directory_lister: DirectoryLister = Depends(require_directory_lister),
 ):
     """Get directory tree structure for a specific path"""
     try:
-        directory_lister = get_directory_lister()
-        settings = get_settings()
-
-        if not directory_lister:
-            return create_detailed_error_response(
-                "Directory lister not initialized",
-                500,
-                "ServiceNotAvailable",
-                {"service": "DirectoryLister"},
-                "DirectoryLister",
-                "initialization",
-                settings.WORKING_DIR,
-            )
-
         # Clean up path
         if directory_path.endswith("/") and directory_path != "/":
             directory_path = directory_path.rstrip("/")
@@ -105,13 +184,19 @@ async def get_directory_tree(
                 settings.WORKING_DIR,
             )
 
-        result = directory_lister.list_directory(
+        options = dict(
             directory_path=directory_path,
             max_depth=max_depth,
             include_hidden=False,
             show_metadata=True,
             respect_gitignore=True,
         )
+        as_text = accepts_text(request)
+        etag = _listing_etag(directory_lister, options, "tree", as_text)
+        if etag_matches(request, etag):
+            return create_not_modified_response(etag)
+
+        result = await _run_listing(directory_lister, **options)
 
         if "error" in result:
             return create_detailed_error_response(
@@ -128,41 +213,46 @@ async def get_directory_tree(
                 settings.WORKING_DIR,
             )
 
-        # Format as tree structure
-        tree_lines = []
-        for item in result["items"]:
-            prefix = item.get("tree_prefix", "")
-            name = item["name"]
-
-            if item.get("is_directory", False):
-                tree_lines.append(f"{prefix}{name}/  # directory")
-            else:
-                size_info = (
-                    f" [{directory_lister.format_size(item.get('size', 0))}]"
-                    if item.get("size")
-                    else ""
-                )
-                line_info = (
-                    f" ({item.get('line_count', 0)} lines)"
-                    if item.get("line_count")
-                    else ""
-                )
-                tree_lines.append(f"{prefix}{name}{size_info}{line_info}  # file")
-
-        return create_success_response(
+        # The listing is cached now, so a fresh walk that found nothing
+        # new still answers a conditional request with 304
+        etag = _listing_etag(directory_lister, options, "tree", as_text)
+        if etag_matches(request, etag):
+            return create_not_modified_response(etag)
+
+        # Format as tree structure off the event loop
+        dir_items = directory_lister.as_dir_items(result["items"])
+        loop = asyncio.get_running_loop()
+        if as_text:
+            # Plain-text clients get the tree bytes as-is, without the JSON
+            # envelope or an intermediate str
+            body = await loop.run_in_executor(
+                _DIR_EXECUTOR, render_tree_bytes, dir_items, directory_lister.format_size
+            )
+            response = Response(content=body, media_type="text/plain")
+            if etag:
+                response.headers["ETag"] = etag
+            return response
+
+        tree = await loop.run_in_executor(
+            _DIR_EXECUTOR, render_tree, dir_items, directory_lister.format_size
+        )
+
+        response = create_orjson_success_response(
             {
                 "directory": result["directory"],
-                "tree": "\n".join(tree_lines),
+                "tree": tree,
                 "summary": result["summary"],
                 "max_depth": max_depth,
                 "total_items": len(result["items"]),
             }
         )
+        if etag:
+            response.headers["ETag"] = etag
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
-        settings = get_settings()
         return create_detailed_error_response(
             f"Failed to generate directory tree: {str(e)}",
             500,
@@ -180,122 +270,98 @@ async def get_directory_tree(
 
 @router.get("/tree/enhanced/{directory_path:path}")
 async def get_enhanced_directory_tree(
+    request: Request,
     directory_path: str,
-    max_depth: int = Query(3, description="Maximum depth", ge=1, le=10),
-    include_hidden: bool = Query(False, description="Include hidden files"),
-    show_sizes: bool = Query(True, description="Show file sizes"),
-    show_git_status: bool = Query(True, description="Show git status indicators"),
+    params: Annotated[EnhancedTreeParams, Query()],
+    settings: Settings = Depends(get_settings),
+    directory_lister: DirectoryLister = Depends(require_directory_lister),
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
 ):
     """Get enhanced directory tree with git status and file metadata"""
     try:
-        directory_lister = get_directory_lister()
-        git_manager = get_git_manager()
-        settings = get_settings()
-
-        if not directory_lister:
-            return create_error_response("Directory lister not initialized", 500)
-
         # Validate path
         if directory_path != ".":
             await validate_file_path(directory_path, settings.WORKING_DIR)
 
-        # Get directory listing
-        result = directory_lister.list_directory(
+        # Walk the tree and fetch git status concurrently
+        options = dict(
             directory_path=directory_path,
-            max_depth=max_depth,
-            include_hidden=include_hidden,
-            show_metadata=show_sizes,
+            max_depth=params.max_depth,
+            include_hidden=params.include_hidden,
+            show_metadata=params.show_sizes,
             respect_gitignore=True,
         )
+        listing = _run_listing(directory_lister, **options)
+        if params.show_git_status and git_manager:
+            result, git_status = await asyncio.gather(
+                listing, _collect_git_status(git_manager)
+            )
+        else:
+            result, git_status = await listing, {}
 
         if "error" in result:
             return create_error_response(result["error"], 400)
 
-        # Enhanced tree formatting
-        tree_lines = []
-        git_status = {}
-
-        # Get git status if requested
-        if show_git_status and git_manager:
-            try:
-                status_result = await git_manager.get_status()
-                if status_result.success:
-                    status_data = status_result.data.get("status", {})
-
-                    for file in status_data.get("modified_files", []):
-                        git_status[file] = "M"
-                    for file in status_data.get("untracked_files", []):
-                        git_status[file] = "?"
-                    for file in status_data.get("staged_files", []):
-                        git_status[file] = "A"
-            except:
-                pass
-
-        # Build enhanced tree
-        for item in result["items"]:
-            prefix = item.get("tree_prefix", "")
-            name = item["name"]
-            file_path = item.get("path", name)
-
-            git_indicator = ""
-            if show_git_status:
-                status = git_status.get(file_path, "")
-                if status:
-                    git_indicator = f"[{status}] "
-
-            if item.get("is_directory", False):
-                file_count = item.get("file_count", "")
-                count_info = f" ({file_count} items)" if file_count else ""
-                tree_lines.append(f"{prefix}📁 {git_indicator}{name}/{count_info}")
-            else:
-                size_info = ""
-                if show_sizes and item.get("size") is not None:
-                    size = item["size"]
-                    if size > 1024 * 1024:
-                        size_info = f" [{size // (1024*1024)}MB]"
-                    elif size > 1024:
-                        size_info = f" [{size // 1024}KB]"
-                    else:
-                        size_info = f" [{size}B]"
-
-                    if item.get("line_count"):
-                        size_info += f" ({item['line_count']} lines)"
-
-                ext = Path(name).suffix.lower()
-                type_indicators = {
-                    ".py": "🐍",
-                    ".js": "🟨",
-                    ".ts": "🔷",
-                    ".html": "🌐",
-                    ".css": "🎨",
-                    ".json": "📋",
-                    ".md": "📝",
-                    ".txt": "📄",
-                    ".yml": "⚙️",
-                    ".yaml": "⚙️",
-                }
-
-                icon = type_indicators.get(ext, "📄")
-                tree_lines.append(f"{prefix}{icon} {git_indicator}{name}{size_info}")
-
-        enhanced_tree = "\n".join(tree_lines)
-
-        return create_success_response(
-            {
-                "directory": result["directory"],
-                "tree": enhanced_tree,
-                "summary": result["summary"],
-                "max_depth": max_depth,
-                "total_items": len(result["items"]),
-                "git_status_shown": show_git_status and bool(git_status),
-                "options": {
-                    "include_hidden": include_hidden,
-                    "show_sizes": show_sizes,
-                    "show_git_status": show_git_status,
-                },
-            }
+        # The listing is cached by now; git status is part of the rendered
+        # output, so it is folded into the ETag as well
+        etag = None
+        if not params.stream:
+            etag = _listing_etag(
+                directory_lister,
+                options,
+                "enhanced",
+                params.show_sizes,
+                params.show_git_status,
+                sorted(git_status.items()),
+            )
+            if etag_matches(request, etag):
+                return create_not_modified_response(etag)
+
+        dir_items = directory_lister.as_dir_items(result["items"])
+        dirty_dirs = dirty_directories(git_status)
+        tree_info = {
+            "directory": result["directory"],
+            "summary": result["summary"],
+            "max_depth": params.max_depth,
+            "total_items": len(dir_items),
+            "git_status_shown": params.show_git_status and bool(git_status),
+            "options": {
+                "include_hidden": params.include_hidden,
+                "show_sizes": params.show_sizes,
+                "show_git_status": params.show_git_status,
+            },
+        }
+
+        if params.stream:
+            return StreamingResponse(
+                _stream_enhanced_tree(
+                    tree_info,
+                    dir_items,
+                    git_status,
+                    dirty_dirs,
+                    params.show_sizes,
+                    params.show_git_status,
+                ),
+                media_type="application/x-ndjson",
+            )
+
+        # Build enhanced tree off the event loop
+        loop = asyncio.get_running_loop()
+        enhanced_tree = await loop.run_in_executor(
+            _DIR_EXECUTOR,
+            render_enhanced,
+            dir_items,
+            git_status,
+            dirty_dirs,
+            params.show_sizes,
+            params.show_git_status,
         )
 
+        response = create_orjson_success_response({"tree": enhanced_tree, **tree_info})
+        if etag:
+            response.headers["ETag"] = etag
+        return response
+
     except HTTPException:
         raise
     except Exception as e:
@@ -3,47 +3,363 @@ File operation endpoints
 Handles intelligent write, AI-assisted edit, and read operations
 """
 
-from typing import Optional
-from fastapi import APIRouter, Query, HTTPException
-
-from core import get_write_pipeline, get_edit_pipeline, get_search_engine
-from core.config import get_settings
-from schemas.requests import WriteRequest, EditRequestAPI, FileRequest
+import os
+import mmap
+import asyncio
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import Annotated, Any, Dict, Optional, Tuple
+import aiofiles
+import aiofiles.os
+from fastapi import APIRouter, Depends, Query, Request, HTTPException
+from fastapi.responses import FileResponse
+
+from core import (
+    get_write_pipeline,
+    get_directory_lister,
+    require_search_engine,
+    require_write_pipeline,
+    require_edit_pipeline,
+)
+from core.config import Settings, get_settings
+from code_tools import WritePipeline, EditPipeline, EditResult
+from code_tools.write_pipeline import WriteResult
+from semantic_search import SemanticSearchEngine
+from schemas.requests import (
+    WriteRequest,
+    EditRequestAPI,
+    FileRequest,
+    CodeReadParams,
+)
 from code_tools import EditRequest
 from utils import (
-    create_success_response,
+    ORJSONResponse,
+    create_orjson_success_response,
     create_error_response,
     create_detailed_error_response,
+    error_boundary,
     validate_file_path,
+    accepts_text,
+    etag_matches,
+    create_not_modified_response,
 )
 
-router = APIRouter(tags=["files"])
+router = APIRouter(tags=["files"], default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
 
 
-@router.post("/write")
-async def intelligent_write(request: WriteRequest):
-    """Intelligent write operation with formatting and dependency checking"""
+def _invalidate_directory_listings() -> None:
+    """Drop cached directory listings after the tree has been modified"""
+    directory_lister = get_directory_lister()
+    if directory_lister:
+        directory_lister.invalidate_cache()
+
+
+async def _file_etag(
+    file_path: Path,
+    start_line: Optional[int],
+    end_line: Optional[int],
+    with_line_numbers: bool,
+    raw: bool = False,
+) -> Optional[str]:
+    """
+    Weak ETag for a file read, from the file's mtime and size plus the
+    requested view; None if the file cannot be stat'ed
+    """
     try:
-        write_pipeline = get_write_pipeline()
-        settings = get_settings()
-        print("relative filepath:",request.file_path)
-        if not write_pipeline:
-            return create_detailed_error_response(
-                "Write pipeline not initialized",
-                500,
-                "ServiceNotAvailable",
-                {"service": "WritePipeline"},
-                "WritePipeline",
-                "initialization",
-                settings.WORKING_DIR,
-            )
+        stat = await aiofiles.os.stat(file_path)
+    except OSError:
+        return None
+    return (
+        f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}'
+        f'-{start_line}-{end_line}-{int(with_line_numbers)}-{int(raw)}"'
+    )
+
+
+# Chunk size for streaming line counts over large files
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Files at least this large locate line ranges by scanning raw bytes
+_BYTE_SCAN_MIN_SIZE = 1024 * 1024
+
+
+def _count_lines(file_path: Path) -> int:
+    """Count lines the way content.split("\\n") would, reading in chunks"""
+    total = 1
+    with open(file_path, "r", encoding="utf-8") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), ""):
+            total += chunk.count("\n")
+    return total
+
+
+def _read_line_range(
+    file_path: Path, start_line: int, end_line: int
+) -> Tuple[Optional[str], int]:
+    """
+    Read lines start_line..end_line (1-indexed, inclusive) without loading
+    the whole file
+
+    Stops reading at end_line. Line numbering matches content.split("\\n"),
+    so a trailing newline counts as one final empty line. Returns
+    (content, total_lines); content is None when the file is shorter than
+    end_line, in which case total_lines is the file's full line count.
+    """
+    if os.path.getsize(file_path) >= _BYTE_SCAN_MIN_SIZE:
+        result = _read_line_range_bytes(file_path, start_line, end_line)
+        if result is not None:
+            return result
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        lines = list(islice(f, start_line - 1, end_line))
+
+    if not lines:
+        # start_line is past the last newline-terminated line
+        total_lines = _count_lines(file_path)
+    else:
+        lines_read = start_line - 1 + len(lines)
+        if lines_read == end_line:
+            content = "".join(lines)
+            return (content[:-1] if content.endswith("\n") else content), end_line
+        # EOF before end_line; a trailing newline adds one empty line
+        total_lines = lines_read + lines[-1].endswith("\n")
+
+    if end_line > total_lines:
+        return None, total_lines
+    return "".join(lines), total_lines
+
+
+def _skip_lines(data: mmap.mmap, pos: int, count: int) -> int:
+    """
+    Offset just past the count-th newline at or after pos, or -1 if the
+    data has fewer newlines
+
+    Whole chunks are skipped with bytes.count, so only the chunk holding
+    the target newline is walked with find.
+    """
+    while count:
+        chunk = data[pos : pos + _READ_CHUNK_SIZE]
+        if not chunk:
+            return -1
+        newlines = chunk.count(b"\n")
+        if newlines < count:
+            count -= newlines
+            pos += len(chunk)
+            continue
+        index = -1
+        for _ in range(count):
+            index = chunk.find(b"\n", index + 1)
+        return pos + index + 1
+    return pos
+
+
+def _read_line_range_bytes(
+    file_path: Path, start_line: int, end_line: int
+) -> Optional[Tuple[Optional[str], int]]:
+    """
+    Byte-level variant of _read_line_range for large files
+
+    Newlines are located in the memory-mapped file and only the requested
+    slice is decoded, so skipped lines never become str objects. Returns
+    None for files containing carriage returns, whose universal-newline
+    handling is left to the text reader.
+    """
+    with open(file_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        if data.find(b"\r") != -1:
+            return None
+
+        start = _skip_lines(data, 0, start_line - 1)
+        last_line_start = (
+            _skip_lines(data, start, end_line - start_line) if start != -1 else -1
+        )
+        if last_line_start == -1:
+            total_lines = 1
+            for offset in range(0, len(data), _READ_CHUNK_SIZE):
+                total_lines += data[offset : offset + _READ_CHUNK_SIZE].count(b"\n")
+            return None, total_lines
+
+        end = data.find(b"\n", last_line_start)
+        if end == -1:
+            end = len(data)
+        return data[start:end].decode("utf-8"), end_line
+
+
+def _build_write_response(result: WriteResult) -> Dict[str, Any]:
+    """Convert a WriteResult into the /write response payload"""
+    # WriteResult is a dataclass, so the nested results are always present
+    format_result = result.format_result
+    dependency_result = result.dependency_result
+    return {
+        "file_path": result.file_path,
+        "success": result.success,
+        "quality_score": result.quality_score,
+        "summary": result.summary,
+        "formatting": {
+            "success": format_result.success,
+            "changes_made": format_result.changes_made,
+            "errors": format_result.errors,
+            "warnings": format_result.warnings,
+        },
+        "dependencies": {
+            "success": dependency_result.success,
+            "imports_found": len(dependency_result.imports_found),
+            "missing_dependencies": dependency_result.missing_dependencies,
+            "resolved_symbols": dependency_result.resolved_symbols,
+            "duplicate_definitions": dependency_result.duplicate_definitions,
+            "suggestions": dependency_result.suggestions,
+        },
+        "errors": result.errors,
+        "warnings": result.warnings,
+    }
+
+
+def _build_write_failure(result: WriteResult) -> Dict[str, Any]:
+    """Analyze why a write failed its quality checks"""
+    failure_reasons = []
+    suggested_fixes = []
+
+    if not result.format_result.success:
+        failure_reasons.append("Code formatting failed")
+        suggested_fixes.extend(
+            [
+                "Check for syntax errors in the code",
+                "Ensure proper indentation and structure",
+                "Verify the programming language is correctly detected",
+            ]
+        )
+
+    if result.quality_score < 0.6:
+        failure_reasons.append(f"Quality score too low: {result.quality_score:.1%}")
+        suggested_fixes.extend(
+            [
+                "Review code for completeness and correctness",
+                "Add proper documentation and comments",
+                "Ensure all imports and dependencies are included",
+            ]
+        )
+
+    missing_dependencies = result.dependency_result.missing_dependencies
+    if missing_dependencies:
+        failure_reasons.append(
+            f"Missing dependencies: {', '.join(missing_dependencies)}"
+        )
+        suggested_fixes.append("Add required imports or install missing packages")
+
+    if not failure_reasons:
+        failure_reasons.append("Unknown quality issue")
+        suggested_fixes.append("Check write pipeline logs for more details")
+
+    return {
+        "failure_reasons": failure_reasons,
+        "suggested_fixes": suggested_fixes,
+        "quality_threshold": 0.6,
+    }
+
+
+def _build_edit_response(result: EditResult) -> Dict[str, Any]:
+    """Convert an EditResult into the /edit response payload"""
+    # Unequal lengths settle content_changed without touching the text;
+    # only same-length results fall through to a (memcmp) comparison
+    original_length = len(result.original_content)
+    final_length = len(result.final_content)
+    content_changed = (
+        original_length != final_length
+        or result.original_content != result.final_content
+    )
+
+    return {
+        "file_path": result.file_path,
+        "success": result.success,
+        "instructions": result.instructions,
+        "summary": result.summary,
+        "quality_score": result.quality_score,
+        "processing": {
+            "gemini_edit_success": result.gemini_edit_success,
+            "format_success": result.format_success,
+            "error_correction_attempts": result.error_correction_attempts,
+            "total_gemini_calls": result.total_gemini_calls,
+            "processing_time_seconds": result.processing_time_seconds,
+        },
+        "content_info": {
+            "original_length": original_length,
+            "final_length": final_length,
+            "content_changed": content_changed,
+        },
+        "errors": {
+            "gemini_errors": result.gemini_errors,
+            "format_errors": result.format_errors,
+            "warnings": result.warnings,
+        },
+    }
+
+
+def _build_edit_failure(result: EditResult) -> Dict[str, Any]:
+    """Work out at which stage an edit failed and how to fix it"""
+    failure_analysis = {
+        "failure_stage": "unknown",
+        "root_cause": "unknown",
+        "suggested_fixes": [],
+    }
+
+    if not result.gemini_edit_success:
+        failure_analysis["failure_stage"] = "gemini_edit"
+        failure_analysis["root_cause"] = "Gemini API call failed"
+        failure_analysis["suggested_fixes"].append(
+            "Check Gemini API key and rate limits"
+        )
+
+    elif not result.format_success:
+        failure_analysis["failure_stage"] = "formatting_validation"
+        failure_analysis["root_cause"] = "Code formatting or validation failed"
+        failure_analysis["suggested_fixes"].append(
+            "Check for syntax errors in the edit"
+        )
+        failure_analysis["suggested_fixes"].append(
+            "Verify the edit follows proper code structure"
+        )
+
+    elif result.quality_score < 0.6:
+        failure_analysis["failure_stage"] = "quality_check"
+        failure_analysis["root_cause"] = (
+            f"Quality score too low: {result.quality_score:.2f}"
+        )
+        failure_analysis["suggested_fixes"].append(
+            "Review edit instructions for clarity"
+        )
+        failure_analysis["suggested_fixes"].append(
+            "Check if the target file has complex dependencies"
+        )
+
+    return failure_analysis
 
+
+@router.post("/write")
+async def intelligent_write(
+    request: WriteRequest,
+    settings: Settings = Depends(get_settings),
+    write_pipeline: WritePipeline = Depends(require_write_pipeline),
+):
+    """Intelligent write operation with formatting and dependency checking"""
+    async with error_boundary(
+        "WritePipeline",
+        "write_operation",
+        settings.WORKING_DIR,
+        "Unexpected error in write operation",
+        details=lambda error, error_type: {
+            "file_path": request.file_path,
+            "exception_type": error_type,
+            "full_error": error,
+        },
+    ):
+        logger.debug("relative filepath: %s", request.file_path)
         # Validate file path
         try:
             file_path = await validate_file_path(
                 request.file_path, settings.WORKING_DIR
             )
-            print("after file path:",file_path)
+            logger.debug("after file path: %s", file_path)
         except HTTPException as e:
             return create_detailed_error_response(
                 f"Invalid file path: {request.file_path}",
@@ -55,7 +371,8 @@ async def intelligent_write(request: WriteRequest):
                 settings.WORKING_DIR,
             )
 
-        if not request.content.strip():
+        # isspace() stops at the first non-blank char and copies nothing
+        if not request.content or request.content.isspace():
             return create_detailed_error_response(
                 "Empty content provided for write operation",
                 400,
@@ -69,209 +386,78 @@ async def intelligent_write(request: WriteRequest):
                 settings.WORKING_DIR,
             )
 
-        try:
+        async with error_boundary(
+            "WritePipeline",
+            "process_write",
+            settings.WORKING_DIR,
+            "Write pipeline processing failed",
+            "WritePipelineError",
+            details=lambda error, error_type: {
+                "file_path": request.file_path,
+                "content_preview": request.content[:200]
+                + ("..." if len(request.content) > 200 else ""),
+                "language": request.language,
+                "pipeline_error": error,
+                "error_type": error_type,
+            },
+        ):
             result = await write_pipeline.process_write(
                 content=request.content,
-                file_path=str(file_path),
+                file_path=file_path,
                 purpose=request.purpose,
                 language=request.language,
                 save_to_file=request.save_to_file,
             )
-        except Exception as pipeline_error:
-            return create_detailed_error_response(
-                f"Write pipeline processing failed: {str(pipeline_error)}",
-                500,
-                "WritePipelineError",
-                {
-                    "file_path": request.file_path,
-                    "content_preview": (
-                        request.content[:200] + "..."
-                        if len(request.content) > 200
-                        else request.content
-                    ),
-                    "language": request.language,
-                    "pipeline_error": str(pipeline_error),
-                    "error_type": type(pipeline_error).__name__,
-                },
-                "WritePipeline",
-                "process_write",
-                settings.WORKING_DIR,
-            )
-
-        # Convert result to API response format
-        response_data = {
-            "file_path": result.file_path,
-            "success": result.success,
-            "quality_score": result.quality_score,
-            "summary": result.summary,
-            "formatting": {
-                "success": (
-                    result.format_result.success
-                    if hasattr(result, "format_result")
-                    else True
-                ),
-                "changes_made": (
-                    result.format_result.changes_made
-                    if hasattr(result, "format_result")
-                    else []
-                ),
-                "errors": (
-                    result.format_result.errors
-                    if hasattr(result, "format_result")
-                    else []
-                ),
-                "warnings": (
-                    result.format_result.warnings
-                    if hasattr(result, "format_result")
-                    else []
-                ),
-            },
-            "dependencies": {
-                "success": (
-                    result.dependency_result.success
-                    if hasattr(result, "dependency_result")
-                    else True
-                ),
-                "imports_found": (
-                    len(result.dependency_result.imports_found)
-                    if hasattr(result, "dependency_result")
-                    else 0
-                ),
-                "missing_dependencies": (
-                    result.dependency_result.missing_dependencies
-                    if hasattr(result, "dependency_result")
-                    else []
-                ),
-                "resolved_symbols": (
-                    result.dependency_result.resolved_symbols
-                    if hasattr(result, "dependency_result")
-                    else []
-                ),
-                "duplicate_definitions": (
-                    result.dependency_result.duplicate_definitions
-                    if hasattr(result, "dependency_result")
-                    else []
-                ),
-                "suggestions": (
-                    result.dependency_result.suggestions
-                    if hasattr(result, "dependency_result")
-                    else []
-                ),
-            },
-            "errors": result.errors if hasattr(result, "errors") else [],
-            "warnings": result.warnings if hasattr(result, "warnings") else [],
-        }
+            if request.save_to_file:
+                _invalidate_directory_listings()
 
+        response_data = _build_write_response(result)
         if result.success:
-            return create_success_response(response_data)
-        else:
-            # Analyze why it failed
-            failure_reasons = []
-            suggested_fixes = []
-
-            if hasattr(result, "format_result") and not result.format_result.success:
-                failure_reasons.append("Code formatting failed")
-                suggested_fixes.extend(
-                    [
-                        "Check for syntax errors in the code",
-                        "Ensure proper indentation and structure",
-                        "Verify the programming language is correctly detected",
-                    ]
-                )
-
-            if result.quality_score < 0.6:
-                failure_reasons.append(
-                    f"Quality score too low: {result.quality_score:.1%}"
-                )
-                suggested_fixes.extend(
-                    [
-                        "Review code for completeness and correctness",
-                        "Add proper documentation and comments",
-                        "Ensure all imports and dependencies are included",
-                    ]
-                )
+            return create_orjson_success_response(response_data)
 
-            if (
-                hasattr(result, "dependency_result")
-                and result.dependency_result.missing_dependencies
-            ):
-                failure_reasons.append(
-                    f"Missing dependencies: {', '.join(result.dependency_result.missing_dependencies)}"
-                )
-                suggested_fixes.append(
-                    "Add required imports or install missing packages"
-                )
-
-            if not failure_reasons:
-                failure_reasons.append("Unknown quality issue")
-                suggested_fixes.append("Check write pipeline logs for more details")
-
-            response_data["failure_analysis"] = {
-                "failure_reasons": failure_reasons,
-                "suggested_fixes": suggested_fixes,
-                "quality_threshold": 0.6,
-            }
-
-            return create_detailed_error_response(
-                "Write operation failed quality checks",
-                422,
-                "WriteQualityFailure",
-                response_data,
-                "WritePipeline",
-                "quality_validation",
-                settings.WORKING_DIR,
-            )
-
-    except Exception as e:
-        settings = get_settings()
+        response_data["failure_analysis"] = _build_write_failure(result)
         return create_detailed_error_response(
-            f"Unexpected error in write operation: {str(e)}",
-            500,
-            "UnexpectedError",
-            {
-                "file_path": request.file_path if "request" in locals() else "unknown",
-                "exception_type": type(e).__name__,
-                "full_error": str(e),
-            },
+            "Write operation failed quality checks",
+            422,
+            "WriteQualityFailure",
+            response_data,
             "WritePipeline",
-            "write_operation",
+            "quality_validation",
             settings.WORKING_DIR,
         )
 
 
 @router.get("/write/stats")
-async def get_write_stats():
+async def get_write_stats(
+    write_pipeline: WritePipeline = Depends(require_write_pipeline),
+):
     """Get write pipeline statistics"""
     try:
-        write_pipeline = get_write_pipeline()
-        if not write_pipeline:
-            return create_error_response("Write pipeline not initialized", 500)
-
         stats = write_pipeline.get_stats()
-        return create_success_response(stats)
+        return create_orjson_success_response(stats)
 
     except Exception as e:
         return create_error_response(f"Failed to get write stats: {str(e)}", 500)
 
 
 @router.post("/edit")
-async def intelligent_edit(request: EditRequestAPI):
+async def intelligent_edit(
+    request: EditRequestAPI,
+    settings: Settings = Depends(get_settings),
+    edit_pipeline: EditPipeline = Depends(require_edit_pipeline),
+):
     """AI-assisted code editing with comprehensive error reporting"""
-    try:
-        edit_pipeline = get_edit_pipeline()
-        settings = get_settings()
-
-        if not edit_pipeline:
-            return create_detailed_error_response(
-                "Edit pipeline not initialized",
-                500,
-                "ServiceNotAvailable",
-                {"service": "EditPipeline"},
-                "EditPipeline",
-                "initialization",
-                settings.WORKING_DIR,
-            )
-
+    async with error_boundary(
+        "EditPipeline",
+        "edit_operation",
+        settings.WORKING_DIR,
+        "Unexpected error in edit operation",
+        details=lambda error, error_type: {
+            "target_file": request.target_file,
+            "exception_type": error_type,
+            "full_error": error,
+        },
+    ):
         # Validate file path
         try:
             file_path = await validate_file_path(
@@ -289,14 +475,14 @@ async def intelligent_edit(request: EditRequestAPI):
             )
 
         # Check if file exists
-        if not file_path.exists():
+        if not await aiofiles.os.path.exists(file_path):
             return create_detailed_error_response(
                 f"Target file does not exist: {request.target_file}",
                 404,
                 "FileNotFound",
                 {
                     "target_file": request.target_file,
-                    "resolved_path": str(file_path),
+                    "resolved_path": file_path,
                     "suggestion": "Ensure the file exists before attempting to edit it",
                 },
                 "EditPipeline",
@@ -313,136 +499,50 @@ async def intelligent_edit(request: EditRequestAPI):
         )
 
         # Process through edit pipeline
-        try:
+        async with error_boundary(
+            "EditPipeline",
+            "process_edit",
+            settings.WORKING_DIR,
+            "Edit pipeline processing failed",
+            "EditPipelineError",
+            details=lambda error, error_type: {
+                "target_file": request.target_file,
+                "instructions": request.instructions[:100]
+                + ("..." if len(request.instructions) > 100 else ""),
+                "pipeline_error": error,
+                "error_type": error_type,
+            },
+        ):
             result = await edit_pipeline.process_edit(
                 request=edit_request, save_to_file=request.save_to_file
             )
-        except Exception as pipeline_error:
-            return create_detailed_error_response(
-                f"Edit pipeline processing failed: {str(pipeline_error)}",
-                500,
-                "EditPipelineError",
-                {
-                    "target_file": request.target_file,
-                    "instructions": (
-                        request.instructions[:100] + "..."
-                        if len(request.instructions) > 100
-                        else request.instructions
-                    ),
-                    "pipeline_error": str(pipeline_error),
-                    "error_type": type(pipeline_error).__name__,
-                },
-                "EditPipeline",
-                "process_edit",
-                settings.WORKING_DIR,
-            )
-
-        # Create detailed response data
-        response_data = {
-            "file_path": result.file_path,
-            "success": result.success,
-            "instructions": result.instructions,
-            "summary": result.summary,
-            "quality_score": result.quality_score,
-            "processing": {
-                "gemini_edit_success": result.gemini_edit_success,
-                "format_success": result.format_success,
-                "error_correction_attempts": result.error_correction_attempts,
-                "total_gemini_calls": result.total_gemini_calls,
-                "processing_time_seconds": result.processing_time_seconds,
-            },
-            "content_info": {
-                "original_length": len(result.original_content),
-                "final_length": len(result.final_content),
-                "content_changed": result.original_content != result.final_content,
-            },
-            "errors": {
-                "gemini_errors": result.gemini_errors,
-                "format_errors": result.format_errors,
-                "warnings": result.warnings,
-            },
-        }
+            if request.save_to_file:
+                _invalidate_directory_listings()
 
+        response_data = _build_edit_response(result)
         if result.success:
-            return create_success_response(response_data)
-        else:
-            # Edit failed - provide detailed analysis
-            failure_analysis = {
-                "failure_stage": "unknown",
-                "root_cause": "unknown",
-                "suggested_fixes": [],
-            }
-
-            if not result.gemini_edit_success:
-                failure_analysis["failure_stage"] = "gemini_edit"
-                failure_analysis["root_cause"] = "Gemini API call failed"
-                failure_analysis["suggested_fixes"].append(
-                    "Check Gemini API key and rate limits"
-                )
+            return create_orjson_success_response(response_data)
 
-            elif not result.format_success:
-                failure_analysis["failure_stage"] = "formatting_validation"
-                failure_analysis["root_cause"] = "Code formatting or validation failed"
-                failure_analysis["suggested_fixes"].append(
-                    "Check for syntax errors in the edit"
-                )
-                failure_analysis["suggested_fixes"].append(
-                    "Verify the edit follows proper code structure"
-                )
-
-            elif result.quality_score < 0.6:
-                failure_analysis["failure_stage"] = "quality_check"
-                failure_analysis["root_cause"] = (
-                    f"Quality score too low: {result.quality_score:.2f}"
-                )
-                failure_analysis["suggested_fixes"].append(
-                    "Review edit instructions for clarity"
-                )
-                failure_analysis["suggested_fixes"].append(
-                    "Check if the target file has complex dependencies"
-                )
-
-            response_data["failure_analysis"] = failure_analysis
-
-            return create_detailed_error_response(
-                "Edit operation failed quality checks",
-                422,
-                "EditQualityFailure",
-                response_data,
-                "EditPipeline",
-                "quality_validation",
-                settings.WORKING_DIR,
-            )
-
-    except Exception as e:
-        settings = get_settings()
+        response_data["failure_analysis"] = _build_edit_failure(result)
         return create_detailed_error_response(
-            f"Unexpected error in edit operation: {str(e)}",
-            500,
-            "UnexpectedError",
-            {
-                "target_file": (
-                    request.target_file if "request" in locals() else "unknown"
-                ),
-                "exception_type": type(e).__name__,
-                "full_error": str(e),
-            },
+            "Edit operation failed quality checks",
+            422,
+            "EditQualityFailure",
+            response_data,
             "EditPipeline",
-            "edit_operation",
+            "quality_validation",
             settings.WORKING_DIR,
         )
 
 
 @router.get("/edit/stats")
-async def get_edit_stats():
+async def get_edit_stats(
+    edit_pipeline: EditPipeline = Depends(require_edit_pipeline),
+):
     """Get edit pipeline statistics"""
     try:
-        edit_pipeline = get_edit_pipeline()
-        if not edit_pipeline:
-            return create_error_response("Edit pipeline not initialized", 500)
-
         stats = edit_pipeline.get_stats()
-        return create_success_response(stats)
+        return create_orjson_success_response(stats)
 
     except Exception as e:
         return create_error_response(f"Failed to get edit stats: {str(e)}", 500)
@@ -450,33 +550,29 @@ async def get_edit_stats():
 
 @router.post("/read")
 async def read_code_content(
-    file_path: str = Query(..., description="Path to the file"),
-    symbol_name: Optional[str] = Query(None, description="Symbol name to read"),
-    occurrence: int = Query(
-        1, description="Which occurrence of the symbol (default: 1)"
-    ),
-    start_line: Optional[int] = Query(
-        None, description="Start line number (1-indexed)"
-    ),
-    end_line: Optional[int] = Query(None, description="End line number (inclusive)"),
-    with_line_numbers: bool = Query(True, description="Include line numbers in output"),
+    params: Annotated[CodeReadParams, Query()],
+    settings: Settings = Depends(get_settings),
+    search_engine: SemanticSearchEngine = Depends(require_search_engine),
 ):
     """Read code content with enhanced error handling for line ranges"""
-    try:
-        search_engine = get_search_engine()
-        settings = get_settings()
-
-        if not search_engine:
-            return create_detailed_error_response(
-                "Search engine not initialized",
-                500,
-                "ServiceNotAvailable",
-                {"service": "SearchEngine"},
-                "SearchEngine",
-                "initialization",
-                settings.WORKING_DIR,
-            )
-
+    # Line numbers, occurrence and range order are validated by CodeReadParams
+    file_path = params.file_path
+    symbol_name = params.symbol_name
+    occurrence = params.occurrence
+    start_line = params.start_line
+    end_line = params.end_line
+    with_line_numbers = params.with_line_numbers
+    async with error_boundary(
+        "SearchEngine",
+        "read_operation",
+        settings.WORKING_DIR,
+        "Unexpected error in read operation",
+        details=lambda error, error_type: {
+            "file_path": file_path,
+            "exception_type": error_type,
+            "full_error": error,
+        },
+    ):
         # Validate file path
         try:
             await validate_file_path(file_path, settings.WORKING_DIR)
@@ -491,47 +587,20 @@ async def read_code_content(
                 settings.WORKING_DIR,
             )
 
-        # Validate line range parameters
-        if start_line is not None and end_line is not None:
-            if start_line < 1:
-                return create_detailed_error_response(
-                    f"Invalid start_line: {start_line}. Line numbers must be >= 1",
-                    400,
-                    "InvalidLineRange",
-                    {"start_line": start_line, "end_line": end_line},
-                    "SearchEngine",
-                    "line_validation",
-                    settings.WORKING_DIR,
-                )
-
-            if end_line < start_line:
-                return create_detailed_error_response(
-                    f"Invalid line range: end_line ({end_line}) < start_line ({start_line})",
-                    400,
-                    "InvalidLineRange",
-                    {
-                        "start_line": start_line,
-                        "end_line": end_line,
-                        "suggestion": "Ensure end_line >= start_line",
-                    },
-                    "SearchEngine",
-                    "line_validation",
-                    settings.WORKING_DIR,
-                )
-
-        # Validate occurrence parameter
-        if occurrence < 1:
-            return create_detailed_error_response(
-                f"Invalid occurrence: {occurrence}. Must be >= 1",
-                400,
-                "InvalidOccurrence",
-                {"occurrence": occurrence},
-                "SearchEngine",
-                "occurrence_validation",
-                settings.WORKING_DIR,
-            )
-
-        try:
+        async with error_boundary(
+            "SearchEngine",
+            "read_content",
+            settings.WORKING_DIR,
+            "Failed to read content",
+            "ReadContentError",
+            details=lambda error, error_type: {
+                "file_path": file_path,
+                "symbol_name": symbol_name,
+                "start_line": start_line,
+                "end_line": end_line,
+                "read_error": error,
+            },
+        ):
             result = await search_engine.read_symbol_content(
                 file_path=file_path,
                 symbol_name=symbol_name,
@@ -540,25 +609,9 @@ async def read_code_content(
                 end_line=end_line,
                 with_line_numbers=with_line_numbers,
             )
-        except Exception as read_error:
-            return create_detailed_error_response(
-                f"Failed to read content: {str(read_error)}",
-                500,
-                "ReadContentError",
-                {
-                    "file_path": file_path,
-                    "symbol_name": symbol_name,
-                    "start_line": start_line,
-                    "end_line": end_line,
-                    "read_error": str(read_error),
-                },
-                "SearchEngine",
-                "read_content",
-                settings.WORKING_DIR,
-            )
 
         if result.get("success"):
-            return create_success_response(result)
+            return create_orjson_success_response(result)
         else:
             return create_detailed_error_response(
                 result.get("error", "Unknown read error"),
@@ -578,40 +631,42 @@ async def read_code_content(
                 settings.WORKING_DIR,
             )
 
-    except Exception as e:
-        settings = get_settings()
-        return create_detailed_error_response(
-            f"Unexpected error in read operation: {str(e)}",
-            500,
-            "UnexpectedError",
-            {
-                "file_path": file_path,
-                "exception_type": type(e).__name__,
-                "full_error": str(e),
-            },
-            "SearchEngine",
-            "read_operation",
-            settings.WORKING_DIR,
-        )
-
 
 @router.get("/read/{file_path:path}")
 async def read_file_content(
+    http_request: Request,
     file_path: str,
-    start_line: Optional[int] = Query(None, description="Start line number"),
-    end_line: Optional[int] = Query(None, description="End line number"),
+    start_line: Optional[int] = Query(None, description="Start line number", ge=1),
+    end_line: Optional[int] = Query(None, description="End line number", ge=1),
     with_line_numbers: bool = Query(True, description="Include line numbers"),
+    settings: Settings = Depends(get_settings),
+    search_engine: SemanticSearchEngine = Depends(require_search_engine),
 ):
     """Read file content with optional line range"""
     try:
-        search_engine = get_search_engine()
-        settings = get_settings()
-
-        if not search_engine:
-            return create_error_response("Search engine not initialized", 500)
-
         # Validate file path
-        await validate_file_path(file_path, settings.WORKING_DIR)
+        resolved_path = await validate_file_path(file_path, settings.WORKING_DIR)
+
+        # Whole-file plain-text reads are served straight from disk
+        # (sendfile under Starlette) instead of through the JSON envelope
+        raw = (
+            start_line is None
+            and end_line is None
+            and not with_line_numbers
+            and accepts_text(http_request)
+        )
+        etag = await _file_etag(
+            resolved_path, start_line, end_line, with_line_numbers, raw
+        )
+        if etag_matches(http_request, etag):
+            return create_not_modified_response(etag)
+
+        if raw and etag and await aiofiles.os.path.isfile(resolved_path):
+            return FileResponse(
+                resolved_path,
+                media_type="text/plain",
+                headers={"ETag": etag, "Cache-Control": "no-cache"},
+            )
 
         result = await search_engine.read_symbol_content(
             file_path=file_path,
@@ -621,7 +676,11 @@ async def read_file_content(
         )
 
         if result.get("success"):
-            return create_success_response(result)
+            response = create_orjson_success_response(result)
+            if etag:
+                response.headers["ETag"] = etag
+                response.headers["Cache-Control"] = "no-cache"
+            return response
         else:
             return create_error_response(result.get("error", "Unknown error"), 400)
 
@@ -632,11 +691,22 @@ async def read_file_content(
 
 
 @router.post("/file")
-async def file_operations(request: FileRequest):
+async def file_operations(
+    request: FileRequest, settings: Settings = Depends(get_settings)
+):
     """Handle legacy file operations"""
-    try:
-        settings = get_settings()
-
+    async with error_boundary(
+        "FileOperations",
+        request.operation,
+        settings.WORKING_DIR,
+        "File operation failed",
+        "FileOperationError",
+        details=lambda error, error_type: {
+            "operation": request.operation,
+            "file_path": request.file_path,
+            "exception_type": error_type,
+        },
+    ):
         try:
             file_path = await validate_file_path(
                 request.file_path, settings.WORKING_DIR
@@ -655,14 +725,14 @@ async def file_operations(request: FileRequest):
         operation = request.operation.lower()
 
         if operation == "read":
-            if not file_path.exists():
+            if not await aiofiles.os.path.exists(file_path):
                 return create_detailed_error_response(
                     f"File not found: {request.file_path}",
                     404,
                     "FileNotFound",
                     {
                         "file_path": request.file_path,
-                        "resolved_path": str(file_path),
+                        "resolved_path": file_path,
                     },
                     "FileOperations",
                     "read",
@@ -670,51 +740,39 @@ async def file_operations(request: FileRequest):
                 )
 
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
                 # Extract specific lines if requested
+                # FileRequest guarantees 1 <= start_line <= end_line
                 if request.start_line is not None and request.end_line is not None:
-                    lines = content.split("\n")
-                    if request.start_line < 1 or request.end_line < request.start_line:
-                        return create_detailed_error_response(
-                            f"Invalid line range: {request.start_line}-{request.end_line}",
-                            400,
-                            "InvalidLineRange",
-                            {
-                                "start_line": request.start_line,
-                                "end_line": request.end_line,
-                                "total_lines": len(lines),
-                            },
-                            "FileOperations",
-                            "line_range_validation",
-                            settings.WORKING_DIR,
-                        )
-
-                    if request.end_line > len(lines):
+                    content, total_lines = await asyncio.to_thread(
+                        _read_line_range,
+                        file_path,
+                        request.start_line,
+                        request.end_line,
+                    )
+                    if content is None:
                         return create_detailed_error_response(
-                            f"End line {request.end_line} exceeds file length {len(lines)}",
+                            f"End line {request.end_line} exceeds file length {total_lines}",
                             400,
                             "LineRangeExceeded",
                             {
                                 "end_line": request.end_line,
-                                "file_length": len(lines),
-                                "suggestion": f"Use end_line <= {len(lines)}",
+                                "file_length": total_lines,
+                                "suggestion": f"Use end_line <= {total_lines}",
                             },
                             "FileOperations",
                             "line_range_check",
                             settings.WORKING_DIR,
                         )
+                else:
+                    async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
+                        content = await f.read()
 
-                    selected_lines = lines[request.start_line - 1 : request.end_line]
-                    content = "\n".join(selected_lines)
-
-                return create_success_response(
+                return create_orjson_success_response(
                     {
                         "operation": "read",
                         "file_path": request.file_path,
                         "content": content,
-                        "total_lines": len(content.split("\n")),
+                        "total_lines": content.count("\n") + 1,
                         "line_range": (
                             f"{request.start_line}-{request.end_line}"
                             if request.start_line
@@ -723,11 +781,12 @@ async def file_operations(request: FileRequest):
                     }
                 )
             except Exception as e:
+                error = str(e)
                 return create_detailed_error_response(
-                    f"Read error: {str(e)}",
+                    f"Read error: {error}",
                     500,
                     "FileReadError",
-                    {"file_path": request.file_path, "error_details": str(e)},
+                    {"file_path": request.file_path, "error_details": error},
                     "FileOperations",
                     "file_read",
                     settings.WORKING_DIR,
@@ -747,9 +806,10 @@ async def file_operations(request: FileRequest):
                     file_path=request.file_path,
                     save_to_file=True,
                 )
+                _invalidate_directory_listings()
 
                 if result.success:
-                    return create_success_response(
+                    return create_orjson_success_response(
                         {
                             "operation": "write",
                             "file_path": request.file_path,
@@ -763,9 +823,10 @@ async def file_operations(request: FileRequest):
                     )
             else:
                 # Fallback to simple write
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(request.content)
-                return create_success_response(
+                async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
+                    await f.write(request.content)
+                _invalidate_directory_listings()
+                return create_orjson_success_response(
                     {
                         "operation": "write",
                         "file_path": request.file_path,
@@ -774,14 +835,14 @@ async def file_operations(request: FileRequest):
                 )
 
         elif operation == "create":
-            if file_path.exists():
+            if await aiofiles.os.path.exists(file_path):
                 return create_detailed_error_response(
                     f"File already exists: {request.file_path}",
                     409,
                     "FileExists",
                     {
                         "file_path": request.file_path,
-                        "resolved_path": str(file_path),
+                        "resolved_path": file_path,
                         "suggestion": "Use 'write' operation to overwrite or choose a different filename",
                     },
                     "FileOperations",
@@ -790,40 +851,43 @@ async def file_operations(request: FileRequest):
                 )
 
             try:
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+                await aiofiles.os.makedirs(file_path.parent, exist_ok=True)
                 content = request.content or ""
 
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
+                    await f.write(content)
+                _invalidate_directory_listings()
 
-                return create_success_response(
+                return create_orjson_success_response(
                     {
                         "operation": "create",
                         "file_path": request.file_path,
                         "message": "File created successfully",
                         "content_length": len(content),
-                        "lines_written": len(content.split("\n")) if content else 0,
+                        "lines_written": content.count("\n") + 1 if content else 0,
                     }
                 )
             except Exception as e:
+                error = str(e)
                 return create_detailed_error_response(
-                    f"Create error: {str(e)}",
+                    f"Create error: {error}",
                     500,
                     "FileCreateError",
-                    {"file_path": request.file_path, "error_details": str(e)},
+                    {"file_path": request.file_path, "error_details": error},
                     "FileOperations",
                     "file_create",
                     settings.WORKING_DIR,
                 )
 
         elif operation == "delete":
-            if not file_path.exists():
+            if not await aiofiles.os.path.exists(file_path):
                 return create_error_response(
                     f"File not found: {request.file_path}", 404
                 )
 
-            file_path.unlink()
-            return create_success_response(
+            await aiofiles.os.remove(file_path)
+            _invalidate_directory_listings()
+            return create_orjson_success_response(
                 {
                     "operation": "delete",
                     "file_path": request.file_path,
@@ -835,21 +899,3 @@ async def file_operations(request: FileRequest):
             return create_error_response(
                 f"Unsupported file operation: {operation}", 400
             )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        settings = get_settings()
-        return create_detailed_error_response(
-            f"File operation failed: {str(e)}",
-            500,
-            "FileOperationError",
-            {
-                "operation": request.operation,
-                "file_path": request.file_path,
-                "exception_type": type(e).__name__,
-            },
-            "FileOperations",
-            request.operation,
-            settings.WORKING_DIR,
-        )
@@ -5,221 +5,273 @@ Git operations and session management endpoints
 Handles git commands, branch operations, and AI session management
 """
 
-from typing import Optional
+import time
+import asyncio
+import logging
+from functools import partial
+from io import StringIO
+from itertools import islice
+from typing import Awaitable, Callable, Optional
 from pathlib import Path
-from datetime import datetime
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException
 
 from core import get_git_manager
-from core.config import get_settings
+from core.config import Settings, get_settings
+from code_tools.git_manager import GitManager, GitResult
 from schemas.requests import GitOperationRequest, SessionRequest
 from utils import (
+    ORJSONResponse,
     create_success_response,
+    create_orjson_success_response,
     create_error_response,
     create_detailed_error_response,
     validate_file_path,
 )
 
-router1 = APIRouter(prefix="/git", tags=["git"])
+logger = logging.getLogger(__name__)
+
+router1 = APIRouter(
+    prefix="/git", tags=["git"], default_response_class=ORJSONResponse
+)
 router2=APIRouter(prefix="/session",tags=["session"])
 
-@router1.post("")
-async def git_operations(request: GitOperationRequest):
-    """Handle git operations with comprehensive error reporting"""
-    try:
-        git_manager = get_git_manager()
-        settings = get_settings()
+# Branch-name prefixes that mark AI session branches
+_SESSION_PREFIXES = ("ai-session-", "session-")
+
+# /git/tree branch line prefixes keyed by (is_current, is_session)
+_BRANCH_LINE_PREFIXES = {
+    (False, False): "   ├── ",
+    (True, False): "   ├── 👉 ",
+    (False, True): "   ├── 🤖 ",
+    (True, True): "   ├── 👉 🤖 ",
+}
+
+_TREE_HEADER = "🌳 Git Repository Tree View\n" + "=" * 40
+
+_SUPPORTED_GIT_OPERATIONS = [
+    "status",
+    "branches",
+    "log",
+    "diff",
+    "add",
+    "commit",
+    "blame",
+]
+
+
+def _git_manager_unavailable(settings: Settings):
+    """Error response for requests arriving before the git manager exists"""
+    return create_detailed_error_response(
+        "Git manager not initialized - service startup may have failed",
+        500,
+        "ServiceNotAvailable",
+        {"initialization_status": "failed"},
+        "GitManager",
+        "initialization",
+        settings.WORKING_DIR,
+    )
 
-        if not git_manager:
+
+async def _run_git_operation(
+    operation: str,
+    git_manager: GitManager,
+    settings: Settings,
+    run: Callable[[], Awaitable[GitResult]],
+):
+    """
+    Make sure the .codebase repository exists, run one git call and turn
+    its GitResult into an API response
+    """
+    # is_git_repo is a plain attribute set once the repository exists, so
+    # initialization is only attempted until it first succeeds
+    if not git_manager.is_git_repo:
+        init_result = await git_manager.initialize_codebase_repo()
+        if not init_result.success:
             return create_detailed_error_response(
-                "Git manager not initialized - service startup may have failed",
-                500,
-                "ServiceNotAvailable",
-                {"initialization_status": "failed"},
+                f"Cannot initialize .codebase repository: {init_result.error}",
+                400,
+                "GitInitializationError",
+                {
+                    "git_dir": git_manager.git_dir,
+                    "init_output": init_result.output,
+                    "suggested_fix": "Ensure working directory has write permissions and is a valid project directory",
+                },
                 "GitManager",
-                "initialization",
+                "repository_init",
                 settings.WORKING_DIR,
             )
 
+    try:
+        result = await run()
+    except Exception as op_error:
+        error = str(op_error)
+        return create_detailed_error_response(
+            f"Git operation {operation} failed with exception: {error}",
+            500,
+            "GitOperationException",
+            {
+                "operation": operation,
+                "exception_type": type(op_error).__name__,
+                "exception_details": error,
+                "git_dir": git_manager.git_dir,
+            },
+            "GitManager",
+            operation,
+            settings.WORKING_DIR,
+        )
+
+    # Handle operation result
+    if result and result.success:
+        response_data = {
+            "operation": operation,
+            "output": result.output,
+            "data": result.data,
+            "git_dir": git_manager.git_dir,
+            "working_dir": settings.WORKING_DIR,
+        }
+        # log/blame/diff output can be large; skip APIResponse validation
+        return create_orjson_success_response(response_data)
+    elif result:
+        return create_detailed_error_response(
+            f"Git {operation} failed: {result.error or 'Unknown error'}",
+            400 if result.return_code not in [128, 129] else 500,
+            "GitCommandFailed",
+            {
+                "operation": operation,
+                "return_code": result.return_code,
+                "git_output": result.output,
+                "git_error": result.error,
+                "git_dir": git_manager.git_dir,
+                "command_suggestion": f"Try running: cd {settings.WORKING_DIR} && git {operation}",
+            },
+            "GitManager",
+            operation,
+            settings.WORKING_DIR,
+        )
+    else:
+        return create_detailed_error_response(
+            f"Git operation {operation} returned no result",
+            500,
+            "NoResult",
+            {"operation": operation},
+            "GitManager",
+            operation,
+            settings.WORKING_DIR,
+        )
+
+
+@router1.post("")
+async def git_operations(
+    request: GitOperationRequest,
+    settings: Settings = Depends(get_settings),
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
+):
+    """Handle git operations with comprehensive error reporting"""
+    try:
+        if not git_manager:
+            return _git_manager_unavailable(settings)
+
         operation = request.operation.lower()
 
-        # Pre-flight checks
-        if not git_manager.is_git_repo:
-            init_result = await git_manager.initialize_codebase_repo()
-            if not init_result.success:
+        if operation == "status":
+            run = git_manager.get_status
+        elif operation == "branches":
+            run = git_manager.get_branches
+        elif operation == "log":
+            run = partial(
+                git_manager.get_log,
+                max_commits=request.max_results or 10,
+                file_path=request.file_path,
+            )
+        elif operation == "diff":
+            run = partial(
+                git_manager.get_diff,
+                file_path=request.file_path,
+                cached=request.cached or False,
+            )
+        elif operation == "add":
+            if not request.files and not request.file_path:
                 return create_detailed_error_response(
-                    f"Cannot initialize .codebase repository: {init_result.error}",
+                    "Files or file_path required for add operation",
                     400,
-                    "GitInitializationError",
-                    {
-                        "git_dir": str(git_manager.git_dir),
-                        "init_output": init_result.output,
-                        "suggested_fix": "Ensure working directory has write permissions and is a valid project directory",
+                    "MissingParameter",
+                    lambda: {
+                        "required_fields": ["files", "file_path"],
+                        "provided_request": request.model_dump(mode="json"),
                     },
                     "GitManager",
-                    "repository_init",
+                    "add",
                     settings.WORKING_DIR,
                 )
 
-        # Execute operation
-        result = None
-        try:
-            if operation == "status":
-                result = await git_manager.get_status()
-            elif operation == "branches":
-                result = await git_manager.get_branches()
-            elif operation == "log":
-                result = await git_manager.get_log(
-                    max_commits=request.max_results or 10, file_path=request.file_path
-                )
-            elif operation == "diff":
-                result = await git_manager.get_diff(
-                    file_path=request.file_path, cached=request.cached or False
-                )
-            elif operation == "add":
-                if not request.files and not request.file_path:
-                    return create_detailed_error_response(
-                        "Files or file_path required for add operation",
-                        400,
-                        "MissingParameter",
-                        {
-                            "required_fields": ["files", "file_path"],
-                            "provided_request": request.dict(),
-                        },
-                        "GitManager",
-                        "add",
-                        settings.WORKING_DIR,
-                    )
-
-                files_to_add = [
-                    f for f in (request.files or [request.file_path]) if f is not None
-                ]
-                result = await git_manager.add_files(files_to_add)
-
-            elif operation == "commit":
-                if not request.message:
-                    return create_detailed_error_response(
-                        "Commit message required for commit operation",
-                        400,
-                        "MissingParameter",
-                        {
-                            "required_field": "message",
-                            "provided_request": request.dict(),
-                        },
-                        "GitManager",
-                        "commit",
-                        settings.WORKING_DIR,
-                    )
-
-                result = await git_manager.commit(
-                    message=request.message, files=request.files
-                )
+            files_to_add = [
+                f for f in (request.files or [request.file_path]) if f is not None
+            ]
+            run = partial(git_manager.add_files, files_to_add)
 
-            elif operation == "blame":
-                if not request.file_path:
-                    return create_detailed_error_response(
-                        "File path required for blame operation",
-                        400,
-                        "MissingParameter",
-                        {"required_field": "file_path"},
-                        "GitManager",
-                        "blame",
-                        settings.WORKING_DIR,
-                    )
-
-                # Validate file exists
-                try:
-                    await validate_file_path(request.file_path, settings.WORKING_DIR)
-                except HTTPException as e:
-                    return create_detailed_error_response(
-                        f"Invalid file path for blame: {request.file_path}",
-                        400,
-                        "FilePathError",
-                        {"file_path": request.file_path, "validation_error": str(e)},
-                        "GitManager",
-                        "blame",
-                        settings.WORKING_DIR,
-                    )
-
-                result = await git_manager.get_file_blame(request.file_path)
-            else:
+        elif operation == "commit":
+            if not request.message:
                 return create_detailed_error_response(
-                    f"Unsupported git operation: {operation}",
+                    "Commit message required for commit operation",
                     400,
-                    "UnsupportedOperation",
-                    {
-                        "requested_operation": operation,
-                        "supported_operations": [
-                            "status",
-                            "branches",
-                            "log",
-                            "diff",
-                            "add",
-                            "commit",
-                            "blame",
-                        ],
+                    "MissingParameter",
+                    lambda: {
+                        "required_field": "message",
+                        "provided_request": request.model_dump(mode="json"),
                     },
                     "GitManager",
-                    operation,
+                    "commit",
                     settings.WORKING_DIR,
                 )
 
-        except Exception as op_error:
-            return create_detailed_error_response(
-                f"Git operation {operation} failed with exception: {str(op_error)}",
-                500,
-                "GitOperationException",
-                {
-                    "operation": operation,
-                    "exception_type": type(op_error).__name__,
-                    "exception_details": str(op_error),
-                    "git_dir": str(git_manager.git_dir),
-                },
-                "GitManager",
-                operation,
-                settings.WORKING_DIR,
+            run = partial(
+                git_manager.commit, message=request.message, files=request.files
             )
 
-        # Handle operation result
-        if result and result.success:
-            response_data = {
-                "operation": operation,
-                "output": result.output,
-                "data": result.data,
-                "git_dir": str(git_manager.git_dir),
-                "working_dir": settings.WORKING_DIR,
-            }
-            return create_success_response(response_data)
-        elif result:
+        elif operation == "blame":
+            if not request.file_path:
+                return create_detailed_error_response(
+                    "File path required for blame operation",
+                    400,
+                    "MissingParameter",
+                    {"required_field": "file_path"},
+                    "GitManager",
+                    "blame",
+                    settings.WORKING_DIR,
+                )
+
+            # Validate file exists
+            try:
+                await validate_file_path(request.file_path, settings.WORKING_DIR)
+            except HTTPException as e:
+                return create_detailed_error_response(
+                    f"Invalid file path for blame: {request.file_path}",
+                    400,
+                    "FilePathError",
+                    {"file_path": request.file_path, "validation_error": str(e)},
+                    "GitManager",
+                    "blame",
+                    settings.WORKING_DIR,
+                )
+
+            run = partial(git_manager.get_file_blame, request.file_path)
+        else:
             return create_detailed_error_response(
-                f"Git {operation} failed: {result.error or 'Unknown error'}",
-                400 if result.return_code not in [128, 129] else 500,
-                "GitCommandFailed",
+                f"Unsupported git operation: {operation}",
+                400,
+                "UnsupportedOperation",
                 {
-                    "operation": operation,
-                    "return_code": result.return_code,
-                    "git_output": result.output,
-                    "git_error": result.error,
-                    "git_dir": str(git_manager.git_dir),
-                    "command_suggestion": f"Try running: cd {settings.WORKING_DIR} && git {operation}",
+                    "requested_operation": operation,
+                    "supported_operations": _SUPPORTED_GIT_OPERATIONS,
                 },
                 "GitManager",
                 operation,
                 settings.WORKING_DIR,
             )
-        else:
-            return create_detailed_error_response(
-                f"Git operation {operation} returned no result",
-                500,
-                "NoResult",
-                {"operation": operation},
-                "GitManager",
-                operation,
-                settings.WORKING_DIR,
-            )
+
+        return await _run_git_operation(operation, git_manager, settings, run)
 
     except Exception as e:
-        settings = get_settings()
         return create_detailed_error_response(
             f"Unexpected error in git operations: {str(e)}",
             500,
@@ -235,17 +287,32 @@ async def git_operations(request: GitOperationRequest):
         )
 
 
-# Convenience endpoints
+# Convenience endpoints call the git manager directly rather than
+# re-dispatching through git_operations
 @router1.get("/status")
-async def git_status():
+async def git_status(
+    settings: Settings = Depends(get_settings),
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
+):
     """Get git repository status"""
-    return await git_operations(GitOperationRequest(operation="status"))
+    if not git_manager:
+        return _git_manager_unavailable(settings)
+    return await _run_git_operation(
+        "status", git_manager, settings, git_manager.get_status
+    )
 
 
 @router1.get("/branches")
-async def git_branches():
+async def git_branches(
+    settings: Settings = Depends(get_settings),
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
+):
     """Get all git branches"""
-    return await git_operations(GitOperationRequest(operation="branches"))
+    if not git_manager:
+        return _git_manager_unavailable(settings)
+    return await _run_git_operation(
+        "branches", git_manager, settings, git_manager.get_branches
+    )
 
 
 @router1.get("/log")
@@ -254,78 +321,81 @@ async def git_log(
     file_path: Optional[str] = Query(
         None, description="File path for file-specific log"
     ),
+    settings: Settings = Depends(get_settings),
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
 ):
     """Get git commit history"""
-    return await git_operations(
-        GitOperationRequest(
-            operation="log", max_results=max_commits, file_path=file_path
-        )
+    if not git_manager:
+        return _git_manager_unavailable(settings)
+    return await _run_git_operation(
+        "log",
+        git_manager,
+        settings,
+        partial(git_manager.get_log, max_commits=max_commits or 10, file_path=file_path),
     )
 
 
 @router1.post("/tree")
-async def get_git_tree_visualization():
+async def get_git_tree_visualization(
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
+):
     """Get comprehensive git repository tree view"""
     try:
-        git_manager = get_git_manager()
         if not git_manager:
             return create_error_response("Git manager not initialized", 500)
 
-        # Get status and branches for tree view
-        status_result = await git_manager.get_status()
-        branches_result = await git_manager.get_branches()
+        # Get status and branches for tree view; the two are independent
+        status_result, branches_result = await asyncio.gather(
+            git_manager.get_status(), git_manager.get_branches()
+        )
 
-        output = []
-        output.append("🌳 Git Repository Tree View")
-        output.append("=" * 40)
+        # Every line after the fixed header is written with a leading newline,
+        # so the buffer never needs trimming
+        buf = StringIO()
+        w = buf.write
+        w(_TREE_HEADER)
 
         if status_result.success:
             status_data = status_result.data.get("status", {})
             current_branch = status_data.get("current_branch", "unknown")
-            output.append(f"📍 Current Branch: {current_branch}")
+            w(f"\n📍 Current Branch: {current_branch}")
 
             # Show modified files
             modified = status_data.get("modified_files", [])
             if modified:
-                output.append(f"📝 Modified Files ({len(modified)}):")
-                for file in modified[:10]:
-                    output.append(f"   ├── {file}")
+                w(f"\n📝 Modified Files ({len(modified)}):")
+                for file in islice(modified, 10):
+                    w(f"\n   ├── {file}")
                 if len(modified) > 10:
-                    output.append(f"   └── ... and {len(modified) - 10} more")
+                    w(f"\n   └── ... and {len(modified) - 10} more")
 
             # Show untracked files
             untracked = status_data.get("untracked_files", [])
             if untracked:
-                output.append(f"❓ Untracked Files ({len(untracked)}):")
-                for file in untracked[:5]:
-                    output.append(f"   ├── {file}")
+                w(f"\n❓ Untracked Files ({len(untracked)}):")
+                for file in islice(untracked, 5):
+                    w(f"\n   ├── {file}")
                 if len(untracked) > 5:
-                    output.append(f"   └── ... and {len(untracked) - 5} more")
+                    w(f"\n   └── ... and {len(untracked) - 5} more")
 
         if branches_result.success:
             branches = branches_result.data.get("branches", [])
-            output.append(f"🌿 Branches ({len(branches)}):")
+            w(f"\n🌿 Branches ({len(branches)}):")
 
-            for branch in branches[:10]:
-                is_current = branch.get("is_current", False)
-                is_session = branch.get("name", "").startswith(
-                    ("ai-session-", "session-")
-                )
+            for branch in islice(branches, 10):
+                name = branch.get("name", "")
+                is_current = bool(branch.get("is_current", False))
+                is_session = name.startswith(_SESSION_PREFIXES)
+                prefix = _BRANCH_LINE_PREFIXES[is_current, is_session]
 
-                prefix = "├── "
-                if is_current:
-                    prefix += "👉 "
-                if is_session:
-                    prefix += "🤖 "
-
-                output.append(f"   {prefix}{branch.get('name', 'unknown')}")
+                w(f"\n{prefix}{branch.get('name', 'unknown')}")
 
             if len(branches) > 10:
-                output.append(f"   └── ... and {len(branches) - 10} more branches")
+                w(f"\n   └── ... and {len(branches) - 10} more branches")
 
-        tree_output = "\n".join(output)
+        tree_output = buf.getvalue()
 
-        return create_success_response(
+        return create_orjson_success_response(
             {
                 "tree_view": tree_output,
                 "current_branch": (
@@ -343,22 +413,15 @@ async def get_git_tree_visualization():
 
 # Session management endpoints
 @router2.post("")
-async def session_operations(request: SessionRequest):
+async def session_operations(
+    request: SessionRequest,
+    settings: Settings = Depends(get_settings),
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
+):
     """Handle session branch operations"""
     try:
-        git_manager = get_git_manager()
-        settings = get_settings()
-
         if not git_manager:
-            return create_detailed_error_response(
-                "Git manager not initialized - service startup may have failed",
-                500,
-                "ServiceNotAvailable",
-                {"initialization_status": "failed"},
-                "GitManager",
-                "initialization",
-                settings.WORKING_DIR,
-            )
+            return _git_manager_unavailable(settings)
 
         # Pre-flight checks
         if not git_manager.is_git_repo:
@@ -369,7 +432,7 @@ async def session_operations(request: SessionRequest):
                     400,
                     "GitInitializationError",
                     {
-                        "git_dir": str(git_manager.git_dir),
+                        "git_dir": git_manager.git_dir,
                         "init_output": init_result.output,
                         "suggested_fix": "Ensure working directory has write permissions",
                     },
@@ -383,7 +446,7 @@ async def session_operations(request: SessionRequest):
         if operation == "start":
             # Generate session name if not provided
             if not request.session_name:
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                timestamp = time.strftime("%Y%m%d-%H%M%S", time.localtime())
                 request.session_name = f"ai-session-{timestamp}"
 
             result = await git_manager.create_branch(
@@ -508,8 +571,9 @@ async def session_operations(request: SessionRequest):
             result = await git_manager.get_current_branch()
             if result.data.get("current_branch") == request.session_name:
                 switch_result = await git_manager.checkout_branch("master")
-                print(
-                    f"Switched to master branch to delete the session. Result: {switch_result.output}"
+                logger.debug(
+                    "Switched to master branch to delete the session. Result: %s",
+                    switch_result.output,
                 )
 
             result = await git_manager.delete_branch(request.session_name, force=True)
@@ -533,7 +597,6 @@ async def session_operations(request: SessionRequest):
             )
 
     except Exception as e:
-        settings = get_settings()
         return create_detailed_error_response(
             f"Session operation failed: {str(e)}",
             500,
@@ -546,10 +609,11 @@ async def session_operations(request: SessionRequest):
 
 
 @router2.get("/current")
-async def get_current_session():
+async def get_current_session(
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
+):
     """Get current session information"""
     try:
-        git_manager = get_git_manager()
         if not git_manager:
             return create_error_response("Git manager not initialized", 500)
 
@@ -557,9 +621,7 @@ async def get_current_session():
 
         if result.success:
             current_branch = result.data.get("current_branch")
-            is_session = current_branch.startswith(
-                "ai-session-"
-            ) or current_branch.startswith("session-")
+            is_session = current_branch.startswith(_SESSION_PREFIXES)
 
             return create_success_response(
                 {
@@ -583,10 +645,10 @@ async def auto_commit_change(
     operation: str = Query(..., description="Operation performed (write/edit)"),
     purpose: Optional[str] = Query(None, description="Purpose of the change"),
     quality_score: Optional[float] = Query(None, description="Quality score"),
+    git_manager: Optional[GitManager] = Depends(get_git_manager),
 ):
     """Auto-commit a change made by AI"""
     try:
-        git_manager = get_git_manager()
         if not git_manager:
             return create_error_response("Git manager not initialized", 500)
 
@@ -600,11 +662,6 @@ async def auto_commit_change(
                 }
             )
 
-        # Add the file
-        add_result = await git_manager.add_files([file_path])
-        if not add_result.success:
-            return create_error_response(f"Failed to add file: {add_result.error}", 400)
-
         # Create commit message
         file_name = Path(file_path).name
         commit_msg = f"AI: {operation.title()} {file_name}"
@@ -615,8 +672,8 @@ async def auto_commit_change(
         if quality_score:
             commit_msg += f" (Q: {quality_score:.1%})"
 
-        # Commit
-        commit_result = await git_manager.commit(commit_msg)
+        # Stage and commit the file in one git call
+        commit_result = await git_manager.add_and_commit([file_path], commit_msg)
 
         if commit_result.success:
             commit_hash = (
@@ -2,12 +2,13 @@
 Health and status endpoints for system monitoring
 """
 
-import os
+import time
+import asyncio
 from datetime import datetime
+from typing import Optional, Tuple
+import orjson
 from fastapi import APIRouter
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
-from pathlib import Path
+from fastapi.responses import FileResponse, Response
 
 from core import get_settings, get_services_status
 from core.dependencies import (
@@ -17,68 +18,129 @@ from core.dependencies import (
     get_memory_manager,
     get_git_manager,
 )
-from utils import create_success_response
+from utils import create_success_response, create_error_response, probe_directory
 
 router = APIRouter(tags=["health"])
 
 
+# The static parts of the /health and /status envelopes are encoded once;
+# handlers only serialize the fields that change between requests
+_HEALTH_PREFIX = b'{"result":{"status":"healthy","working_directory":'
+_STATUS_PREFIX = (
+    b'{"result":{"server":"FastAPI Codebase Manager","version":"1.0.0",'
+    b'"working_directory":'
+)
+_STATUS_FEATURES = orjson.dumps(
+    [
+        "semantic_search",
+        "intelligent_write",
+        "ai_assisted_edit",
+        "memory_system",
+        "git_operations",
+        "file_management",
+    ]
+)
+
+
+def _dumps(value) -> bytes:
+    """Serialize a dynamic field the way ORJSONResponse would"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _json_response(result_body: bytes) -> Response:
+    """Close a pre-built result object in the standard response envelope"""
+    return Response(
+        content=result_body
+        + b'},"timestamp":'
+        + orjson.dumps(datetime.now())
+        + b',"success":true}',
+        media_type="application/json",
+    )
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
     settings = get_settings()
     services = get_services_status()
 
-    return create_success_response(
-        {
-            "status": "healthy",
-            "working_directory": settings.WORKING_DIR,
-            "components": services,
-            "timestamp": datetime.now().isoformat(),
-        }
+    return _json_response(
+        _HEALTH_PREFIX
+        + _dumps(settings.WORKING_DIR)
+        + b',"components":'
+        + _dumps(services)
+        + b',"timestamp":'
+        + _dumps(datetime.now().isoformat())
     )
 
 
-@router.get("/status")
-async def get_status():
-    """Get detailed server status"""
-    settings = get_settings()
+# Component stats are read from SQLite on every call; /status is polled by
+# dashboards and monitors, so the encoded stats are reused for a short time
+_STATS_TTL = 0.5
+_stats_lock = asyncio.Lock()
+_stats_cache: Optional[Tuple[float, tuple, bytes]] = None
 
-    status_info = {
-        "server": "FastAPI Codebase Manager",
-        "version": "1.0.0",
-        "working_directory": settings.WORKING_DIR,
-        "features": [
-            "semantic_search",
-            "intelligent_write",
-            "ai_assisted_edit",
-            "memory_system",
-            "git_operations",
-            "file_management",
-        ],
-    }
-
-    # Add component statistics
-    search_engine = get_search_engine()
-    if search_engine:
-        status_info["search_stats"] = search_engine.get_stats()
 
-    write_pipeline = get_write_pipeline()
+def _encode_component_stats(components: tuple) -> bytes:
+    """Collect and encode the stats of each available component"""
+    search_engine, write_pipeline, edit_pipeline, memory_manager, git_manager = (
+        components
+    )
+    parts = []
+    if search_engine:
+        parts += (b',"search_stats":', _dumps(search_engine.get_stats()))
     if write_pipeline:
-        status_info["write_pipeline_stats"] = write_pipeline.get_stats()
-
-    edit_pipeline = get_edit_pipeline()
+        parts += (b',"write_pipeline_stats":', _dumps(write_pipeline.get_stats()))
     if edit_pipeline:
-        status_info["edit_pipeline_stats"] = edit_pipeline.get_stats()
-
-    memory_manager = get_memory_manager()
+        parts += (b',"edit_pipeline_stats":', _dumps(edit_pipeline.get_stats()))
     if memory_manager:
-        status_info["memory_stats"] = memory_manager.get_stats().dict()
-
-    git_manager = get_git_manager()
+        parts += (b',"memory_stats":', _dumps(memory_manager.get_stats().dict()))
     if git_manager:
-        status_info["git_stats"] = git_manager.get_stats()
+        parts += (b',"git_stats":', _dumps(git_manager.get_stats()))
+    return b"".join(parts)
+
+
+async def _cached_component_stats() -> bytes:
+    """
+    Encoded component stats, recomputed at most every _STATS_TTL seconds
+
+    The cache is tied to the current component instances, so a service
+    swap (e.g. a working-directory change) is picked up immediately. The
+    stats are gathered off the event loop since several hit SQLite.
+    """
+    global _stats_cache
+    components = (
+        get_search_engine(),
+        get_write_pipeline(),
+        get_edit_pipeline(),
+        get_memory_manager(),
+        get_git_manager(),
+    )
+    async with _stats_lock:
+        cached = _stats_cache
+        if (
+            cached is not None
+            and cached[0] > time.monotonic()
+            and cached[1] == components
+        ):
+            return cached[2]
+        encoded = await asyncio.to_thread(_encode_component_stats, components)
+        _stats_cache = (time.monotonic() + _STATS_TTL, components, encoded)
+        return encoded
+
+
+@router.get("/status")
+async def get_status():
+    """Get detailed server status"""
+    settings = get_settings()
 
-    return create_success_response(status_info)
+    return _json_response(
+        _STATUS_PREFIX
+        + _dumps(settings.WORKING_DIR)
+        + b',"features":'
+        + _STATUS_FEATURES
+        + await _cached_component_stats()
+    )
 
 
 @router.get("/")
@@ -87,44 +149,24 @@ async def read_index():
     return FileResponse("templates/index.html")
 
 
-# Static file routes for templates
-@router.get("/templates/components/{file_path:path}")
-async def serve_component(file_path: str):
-    """Serve HTML component files"""
-    component_path = Path("templates/components") / file_path
-    if component_path.exists() and component_path.suffix == ".html":
-        return FileResponse(component_path)
-    return {"error": "Component not found"}
-
-
-@router.get("/static/{file_type}/{file_path:path}")
-async def serve_static(file_type: str, file_path: str):
-    """Serve static JS/CSS files"""
-    static_path = Path(f"templates/static/{file_type}") / file_path
-    if static_path.exists():
-        return FileResponse(static_path)
-    return {"error": "Static file not found"}
-
-
 @router.get("/working-directory")
 async def get_working_directory():
     """Get current working directory and service status"""
     try:
         settings = get_settings()
         services = get_services_status()
+        probe = await probe_directory(settings.WORKING_DIR)
 
         return create_success_response(
             {
                 "working_directory": settings.WORKING_DIR,
                 "services_status": services,
-                "directory_exists": os.path.exists(settings.WORKING_DIR),
-                "directory_readable": os.access(settings.WORKING_DIR, os.R_OK),
-                "directory_writable": os.access(settings.WORKING_DIR, os.W_OK),
+                "directory_exists": probe.exists,
+                "directory_readable": probe.readable,
+                "directory_writable": probe.writable,
             }
         )
     except Exception as e:
-        from utils import create_error_response
-
         return create_error_response(
             f"Failed to get working directory info: {str(e)}", 500
         )
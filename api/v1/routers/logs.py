@@ -3,8 +3,21 @@ Logging and monitoring endpoints
 Handles system logs, performance metrics, and monitoring
 """
 
-from typing import Optional, List
+import time
+from collections import defaultdict, deque
+from itertools import count, islice
+from typing import (
+    Any,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 from datetime import datetime
+import psutil
 from fastapi import APIRouter, Query
 
 from core import (
@@ -14,32 +27,98 @@ from core import (
     get_write_pipeline,
     get_edit_pipeline,
 )
-from schemas.common import LogLevel, SystemLog
-from utils import create_success_response, create_error_response
+from schemas.common import LogLevel
+from utils import (
+    ORJSONResponse,
+    create_success_response,
+    create_orjson_success_response,
+    create_error_response,
+)
+
+router = APIRouter(
+    prefix="/logs", tags=["logs"], default_response_class=ORJSONResponse
+)
+
+# cpu_percent(interval=None) reports usage since its previous call; prime it
+# so the first /monitoring/performance request already has a baseline
+psutil.cpu_percent(interval=None)
+
 
-router = APIRouter(prefix="/logs", tags=["logs"])
+class LogRecord(NamedTuple):
+    """A stored log entry with its API representation built once"""
 
+    seq: int
+    timestamp: datetime
+    level: LogLevel
+    component_lower: str
+    payload: Dict[str, Any]
 
-# Global log storage
-system_logs: List[SystemLog] = []
+
+# Global log storage; the deque drops the oldest entry once full
+MAX_SYSTEM_LOGS = 1000
+system_logs: Deque[LogRecord] = deque(maxlen=MAX_SYSTEM_LOGS)
+
+# Per-component and per-level views of the same records, so filtered
+# queries only walk matching entries. They are bounded like system_logs but
+# evict independently; records older than system_logs[0] are skipped via seq
+_log_seq = count()
+_logs_by_component: DefaultDict[str, Deque[LogRecord]] = defaultdict(
+    lambda: deque(maxlen=MAX_SYSTEM_LOGS)
+)
+_logs_by_level: DefaultDict[LogLevel, Deque[LogRecord]] = defaultdict(
+    lambda: deque(maxlen=MAX_SYSTEM_LOGS)
+)
 
 
 def add_system_log(
     level: LogLevel, component: str, message: str, details: Optional[dict] = None
 ) -> None:
     """Add a log entry to the system logs"""
-    log_entry = SystemLog(
-        timestamp=datetime.now(),
+    # Built directly rather than through the SystemLog model; appends are
+    # on request paths and the fields need no validation beyond the level
+    timestamp = datetime.now()
+    level = LogLevel(level)
+    record = LogRecord(
+        seq=next(_log_seq),
+        timestamp=timestamp,
         level=level,
-        component=component,
-        message=message,
-        details=details or {},
+        component_lower=component.lower(),
+        payload={
+            "timestamp": timestamp.isoformat(),
+            "level": level,
+            "component": component,
+            "message": message,
+            "details": dict(details) if details else {},
+        },
     )
-    system_logs.append(log_entry)
-
-    # Keep only last 1000 logs
-    if len(system_logs) > 1000:
-        system_logs.pop(0)
+    system_logs.append(record)
+    _logs_by_component[record.component_lower].append(record)
+    _logs_by_level[record.level].append(record)
+
+
+def _clear_system_logs() -> None:
+    """Drop all stored logs and their per-component/per-level views"""
+    system_logs.clear()
+    _logs_by_component.clear()
+    _logs_by_level.clear()
+
+
+def _iter_matching(
+    candidates: Sequence[LogRecord],
+    oldest_seq: int,
+    level: Optional[LogLevel],
+    component_lower: Optional[str],
+    since: Optional[datetime],
+) -> Iterator[Dict[str, Any]]:
+    """Yield matching log payloads newest-first, stopping at since/oldest_seq"""
+    for log in reversed(candidates):
+        if log.seq < oldest_seq or (since and log.timestamp < since):
+            return
+        if level and log.level != level:
+            continue
+        if component_lower and log.component_lower != component_lower:
+            continue
+        yield log.payload
 
 
 @router.get("")
@@ -53,38 +132,29 @@ async def get_system_logs(
 ):
     """Get system logs with filtering options"""
     try:
-        filtered_logs = system_logs.copy()
-
-        # Apply filters
-        if level:
-            filtered_logs = [log for log in filtered_logs if log.level == level]
-
-        if component:
-            filtered_logs = [
-                log
-                for log in filtered_logs
-                if log.component.lower() == component.lower()
-            ]
-
-        if since:
-            filtered_logs = [log for log in filtered_logs if log.timestamp >= since]
-
-        # Sort by timestamp (newest first) and limit
-        filtered_logs.sort(key=lambda x: x.timestamp, reverse=True)
-        filtered_logs = filtered_logs[:limit]
+        # Entries are appended in timestamp order, so walking newest-first
+        # needs no sort, stops at `since` and stops once `limit` is reached
+        component_lower = component.lower() if component else None
+
+        # Walk the narrowest view that covers the filters
+        if component_lower:
+            candidates = _logs_by_component.get(component_lower, ())
+        elif level:
+            candidates = _logs_by_level.get(level, ())
+        else:
+            candidates = system_logs
+        oldest_seq = system_logs[0].seq if system_logs else 0
+
+        filtered_logs = list(
+            islice(
+                _iter_matching(candidates, oldest_seq, level, component_lower, since),
+                max(limit, 0),
+            )
+        )
 
-        return create_success_response(
+        return create_orjson_success_response(
             {
-                "logs": [
-                    {
-                        "timestamp": log.timestamp.isoformat(),
-                        "level": log.level,
-                        "component": log.component,
-                        "message": log.message,
-                        "details": log.details,
-                    }
-                    for log in filtered_logs
-                ],
+                "logs": filtered_logs,
                 "total_logs": len(system_logs),
                 "filtered_count": len(filtered_logs),
             }
@@ -98,8 +168,7 @@ async def get_system_logs(
 async def clear_system_logs():
     """Clear all system logs"""
     try:
-        global system_logs
-        system_logs.clear()
+        _clear_system_logs()
 
         add_system_log(LogLevel.INFO, "system", "System logs cleared via API")
 
@@ -114,21 +183,36 @@ async def clear_system_logs():
         return create_error_response(f"Failed to clear logs: {str(e)}", 500)
 
 
+# Service availability flags reported by /monitoring/performance
+_SERVICE_GETTERS = (
+    ("search_engine_active", get_search_engine),
+    ("memory_system_active", get_memory_manager),
+    ("git_manager_active", get_git_manager),
+    ("write_pipeline_active", get_write_pipeline),
+    ("edit_pipeline_active", get_edit_pipeline),
+)
+
+
 @router.get("/monitoring/performance")
 async def get_performance_metrics():
     """Get system performance metrics"""
     try:
-        import psutil
-        import time
-
-        # Basic system metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Basic system metrics; non-blocking CPU usage since the previous call
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
-        # Application-specific metrics
+        # Application-specific metrics; oneshot() reads the process info
+        # once for all of the calls below
         process = psutil.Process()
-        app_memory = process.memory_info().rss / 1024 / 1024  # MB
+        with process.oneshot():
+            app_memory = process.memory_info().rss / 1024 / 1024  # MB
+            create_time = process.create_time()
+            try:
+                active_connections = len(process.net_connections())
+            except (psutil.AccessDenied, AttributeError):
+                # net_connections() needs psutil 6.0+
+                active_connections = 0
 
         metrics = {
             "system": {
@@ -140,22 +224,16 @@ async def get_performance_metrics():
             },
             "application": {
                 "memory_usage_mb": app_memory,
-                "uptime_seconds": time.time() - process.create_time(),
-                "active_connections": (
-                    len(process.connections()) if hasattr(process, "connections") else 0
-                ),
+                "uptime_seconds": time.time() - create_time,
+                "active_connections": active_connections,
             },
             "services": {
-                "search_engine_active": get_search_engine() is not None,
-                "memory_system_active": get_memory_manager() is not None,
-                "git_manager_active": get_git_manager() is not None,
-                "write_pipeline_active": get_write_pipeline() is not None,
-                "edit_pipeline_active": get_edit_pipeline() is not None,
+                key: getter() is not None for key, getter in _SERVICE_GETTERS
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
         }
 
-        return create_success_response(metrics)
+        return create_orjson_success_response(metrics)
 
     except Exception as e:
         return create_error_response(
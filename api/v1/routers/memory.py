@@ -8,7 +8,12 @@ from fastapi import APIRouter, Query, HTTPException
 
 from core import get_memory_manager
 from core.config import get_settings
-from memory_system.models import MemoryRequest, MemorySearchRequest
+from memory_system.models import (
+    MemoryRequest,
+    MemorySearchRequest,
+    MemorySortField,
+    SortOrder,
+)
 from memory_system.api_endpoints import (
     store_memory_endpoint,
     search_memories_endpoint,
@@ -17,12 +22,16 @@ from memory_system.api_endpoints import (
     update_memory_endpoint,
 )
 from utils import (
+    ORJSONResponse,
     create_success_response,
+    create_orjson_success_response,
     create_error_response,
     create_detailed_error_response,
 )
 
-router = APIRouter(prefix="/memory", tags=["memory"])
+router = APIRouter(
+    prefix="/memory", tags=["memory"], default_response_class=ORJSONResponse
+)
 
 
 @router.post("/store")
@@ -94,38 +103,20 @@ async def update_memory(memory_id: int, updates: Dict[str, Any]):
                 settings.WORKING_DIR,
             )
 
-        # Validate memory_id exists
-        try:
-            search_result = await memory_manager.search_memories(
-                query="*", max_results=1, filters={"id": memory_id}
-            )
-
-            if not search_result or not search_result.get("memories"):
-                return create_detailed_error_response(
-                    f"Memory with ID {memory_id} not found",
-                    404,
-                    "MemoryNotFound",
-                    {
-                        "memory_id": memory_id,
-                        "suggestion": "Use memory search to find existing memory IDs",
-                    },
-                    "MemorySystem",
-                    "memory_lookup",
-                    settings.WORKING_DIR,
-                )
-
-        except Exception as lookup_error:
+        result = await update_memory_endpoint(memory_manager, memory_id, updates)
+        if result.get("found") is False:
             return create_detailed_error_response(
-                f"Error looking up memory {memory_id}: {str(lookup_error)}",
-                500,
-                "MemoryLookupError",
-                {"memory_id": memory_id, "lookup_error": str(lookup_error)},
+                f"Memory with ID {memory_id} not found",
+                404,
+                "MemoryNotFound",
+                {
+                    "memory_id": memory_id,
+                    "suggestion": "Use memory search to find existing memory IDs",
+                },
                 "MemorySystem",
                 "memory_lookup",
                 settings.WORKING_DIR,
             )
-
-        result = await update_memory_endpoint(memory_manager, memory_id, updates)
         return result
 
     except HTTPException:
@@ -172,7 +163,11 @@ async def archive_memory(memory_id: int):
         if not memory_manager:
             return create_error_response("Memory system not initialized", 500)
 
-        await update_memory_endpoint(memory_manager, memory_id, {"status": "archived"})
+        result = await update_memory_endpoint(
+            memory_manager, memory_id, {"status": "archived"}
+        )
+        if result.get("found") is False:
+            return create_error_response(f"Memory {memory_id} not found", 404)
 
         return create_success_response(f"Memory {memory_id} archived successfully")
 
@@ -189,10 +184,10 @@ async def list_all_memories(
     importance_max: Optional[int] = Query(5, description="Maximum importance level"),
     limit: int = Query(50, description="Maximum memories to return", le=200),
     offset: int = Query(0, description="Offset for pagination"),
-    sort_by: str = Query(
-        "timestamp", description="Sort field (timestamp, importance, category)"
+    sort_by: MemorySortField = Query(
+        MemorySortField.TIMESTAMP, description="Sort field"
     ),
-    sort_order: str = Query("desc", description="Sort order (asc, desc)"),
+    sort_order: SortOrder = Query(SortOrder.DESC, description="Sort order"),
 ):
     """List memories with advanced filtering and pagination"""
     try:
@@ -200,48 +195,44 @@ async def list_all_memories(
         if not memory_manager:
             return create_error_response("Memory system not initialized", 500)
 
-        # Build search request
+        # Filtering, ordering and pagination all happen in the store
         search_request = MemorySearchRequest(
             query=None,
             category=category,
-            min_importance=importance_min,
+            min_importance=importance_min or 1,
+            max_importance=importance_max or None,
             max_results=limit,
             include_archived=False,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            offset=offset,
         )
 
-        results = await memory_manager.search_memories_advanced(search_request)
-
-        # Apply additional filtering
-        memories = results.get("memories", [])
-
-        if importance_max:
-            memories = [m for m in memories if m.get("importance", 1) <= importance_max]
+        memories, total_count = await memory_manager.list_memories(search_request)
 
-        # Sort memories
-        if sort_by == "importance":
-            memories.sort(
-                key=lambda x: x.get("importance", 1), reverse=(sort_order == "desc")
-            )
-        elif sort_by == "category":
-            memories.sort(
-                key=lambda x: x.get("category", ""), reverse=(sort_order == "desc")
-            )
-        else:  # timestamp
-            memories.sort(
-                key=lambda x: x.get("timestamp", ""), reverse=(sort_order == "desc")
-            )
-
-        # Apply pagination
-        paginated_memories = memories[offset : offset + limit]
-
-        return create_success_response(
+        return create_orjson_success_response(
             {
-                "memories": paginated_memories,
-                "total_count": len(memories),
-                "returned_count": len(paginated_memories),
+                "memories": [
+                    {
+                        "id": memory.id,
+                        "category": memory.category.value,
+                        "subcategory": memory.subcategory,
+                        "content": memory.content,
+                        "importance": memory.importance.value,
+                        "timestamp": memory.timestamp,
+                        "tags": memory.tags,
+                        "context": memory.context,
+                        "related_files": memory.related_files,
+                        "status": memory.status,
+                        "verified": memory.verified,
+                    }
+                    for memory in memories
+                ],
+                "total_count": total_count,
+                "returned_count": len(memories),
                 "offset": offset,
                 "limit": limit,
-                "has_more": len(memories) > offset + limit,
+                "has_more": total_count > offset + len(memories),
             }
         )
 
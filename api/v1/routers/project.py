@@ -3,9 +3,14 @@ Project and directory operation endpoints
 Handles project context, directory listing, and tree views
 """
 
+import os
+import time
+from typing import Any, Callable, Dict, Tuple
+
 from fastapi import APIRouter, Query
 
 from core import get_project_manager
+from schemas import ContextOperation
 from utils import (
     create_success_response,
     create_error_response
@@ -13,11 +18,102 @@ from utils import (
 
 router = APIRouter(prefix="/project", tags=["project"])
 
+# Directory scans are reused for short bursts of polling
+CONTEXT_CACHE_TTL = 2.0
+_context_cache: Dict[tuple, Tuple[float, Any, Any]] = {}
+
+
+def _cached_context(project_manager, key: tuple, build: Callable[[], Any]) -> Any:
+    """
+    Return build() for key, reusing a result younger than CONTEXT_CACHE_TTL
+
+    Entries are tied to the project manager instance and the working
+    directory's mtime, so a working-directory switch or a top-level change
+    invalidates them straight away; deeper edits show up once the TTL lapses.
+    """
+    try:
+        mtime = os.stat(project_manager.working_dir).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    cache_key = (key, mtime)
+    now = time.monotonic()
+    cached = _context_cache.get(cache_key)
+    if cached is not None and cached[0] > now and cached[1] is project_manager:
+        return cached[2]
+
+    value = build()
+    for stale in [k for k, entry in _context_cache.items() if entry[0] <= now]:
+        del _context_cache[stale]
+    _context_cache[cache_key] = (now + CONTEXT_CACHE_TTL, project_manager, value)
+    return value
+
+
+def _context_summary(project_manager, info: Dict[str, Any]) -> Dict[str, str]:
+    """Summary block shared by the info and structure operations"""
+    return {
+        "total_files": info["total_files"],
+        "total_size": project_manager.format_size(info["total_size"]),
+        "total_lines": f"{info['total_lines']:,}",
+    }
+
+
+def _cached_info(project_manager) -> Dict[str, Any]:
+    return _cached_context(
+        project_manager, ("info",), project_manager.get_project_info
+    )
+
+
+def _info_context(project_manager, max_depth: int, include_hidden: bool):
+    info = _cached_info(project_manager)
+    return {
+        "operation": "info",
+        "working_directory": info["working_directory"],
+        "summary": _context_summary(project_manager, info),
+        "project_files": info["project_files"],
+        "file_types": info["top_file_types"],
+        "detailed_info": info,
+    }
+
+
+def _structure_context(project_manager, max_depth: int, include_hidden: bool):
+    structure = _cached_context(
+        project_manager,
+        ("structure", max_depth, include_hidden),
+        lambda: project_manager.get_project_structure(max_depth, include_hidden),
+    )
+    info = _cached_info(project_manager)
+    return {
+        "operation": "structure",
+        "max_depth": max_depth,
+        "include_hidden": include_hidden,
+        "summary": _context_summary(project_manager, info),
+        "tree_structure": structure,
+    }
+
+
+def _dependencies_context(project_manager, max_depth: int, include_hidden: bool):
+    deps = _cached_context(
+        project_manager, ("dependencies",), project_manager.get_dependencies_info
+    )
+    return {
+        "operation": "dependencies",
+        "dependency_files": list(deps.keys()),
+        "dependencies": deps,
+    }
+
+
+_CONTEXT_HANDLERS: Dict[ContextOperation, Callable[..., Dict[str, Any]]] = {
+    ContextOperation.INFO: _info_context,
+    ContextOperation.STRUCTURE: _structure_context,
+    ContextOperation.DEPENDENCIES: _dependencies_context,
+}
+
 
 @router.get("/context")
 async def get_project_context(
-    operation: str = Query(
-        "info", description="Context operation: info, structure, dependencies"
+    operation: ContextOperation = Query(
+        ContextOperation.INFO, description="Context operation"
     ),
     max_depth: int = Query(5, description="Maximum depth for structure"),
     include_hidden: bool = Query(False, description="Include hidden files"),
@@ -28,59 +124,10 @@ async def get_project_context(
         if not project_manager:
             return create_error_response("Project manager not initialized", 500)
 
-        if operation == "info":
-            info = project_manager.get_project_info()
-
-            result = {
-                "operation": "info",
-                "working_directory": info["working_directory"],
-                "summary": {
-                    "total_files": info["total_files"],
-                    "total_size": project_manager.format_size(info["total_size"]),
-                    "total_lines": f"{info['total_lines']:,}",
-                },
-                "project_files": info["project_files"],
-                "file_types": info["top_file_types"],
-                "detailed_info": info,
-            }
-
-            return create_success_response(result)
-
-        elif operation == "structure":
-            structure = project_manager.get_project_structure(max_depth, include_hidden)
-            info = project_manager.get_project_info()
-
-            result = {
-                "operation": "structure",
-                "max_depth": max_depth,
-                "include_hidden": include_hidden,
-                "summary": {
-                    "total_files": info["total_files"],
-                    "total_size": project_manager.format_size(info["total_size"]),
-                    "total_lines": f"{info['total_lines']:,}",
-                },
-                "tree_structure": structure,
-            }
-
-            return create_success_response(result)
-
-        elif operation == "dependencies":
-            deps = project_manager.get_dependencies_info()
-
-            result = {
-                "operation": "dependencies",
-                "dependency_files": list(deps.keys()),
-                "dependencies": deps,
-            }
-
-            return create_success_response(result)
-
-        else:
-            return create_error_response(
-                f"Unknown operation: {operation}. Valid: info, structure, dependencies",
-                400,
-            )
+        result = _CONTEXT_HANDLERS[operation](
+            project_manager, max_depth, include_hidden
+        )
+        return create_success_response(result)
 
     except Exception as e:
         return create_error_response(f"Failed to get project context: {str(e)}", 500)
-
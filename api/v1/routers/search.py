@@ -10,12 +10,28 @@ from core import get_search_engine
 from core.config import get_settings
 from semantic_search.models import SearchRequest
 from utils import (
+    ORJSONResponse,
     create_success_response,
+    create_orjson_success_response,
     create_error_response,
     validate_file_path,
 )
 
-router = APIRouter(prefix="/search", tags=["search"])
+router = APIRouter(
+    prefix="/search", tags=["search"], default_response_class=ORJSONResponse
+)
+
+# SearchResult fields returned by the semantic search endpoint
+_SEARCH_RESULT_FIELDS = {
+    "file_path",
+    "symbol_name",
+    "chunk_type",
+    "line_start",
+    "line_end",
+    "signature",
+    "docstring",
+    "relevance_score",
+}
 
 
 @router.post("")
@@ -28,23 +44,11 @@ async def search_codebase(request: SearchRequest):
 
         results = await search_engine.search(request)
 
-        # Format results for API response
-        formatted_results = []
-        for result in results:
-            formatted_results.append(
-                {
-                    "file_path": result.file_path,
-                    "symbol_name": result.symbol_name,
-                    "chunk_type": result.chunk_type,
-                    "line_start": result.line_start,
-                    "line_end": result.line_end,
-                    "signature": result.signature,
-                    "docstring": result.docstring,
-                    "relevance_score": result.relevance_score,
-                }
-            )
+        formatted_results = [
+            result.model_dump(include=_SEARCH_RESULT_FIELDS) for result in results
+        ]
 
-        return create_success_response(
+        return create_orjson_success_response(
             {
                 "query": request.query,
                 "search_type": request.search_type,
@@ -146,18 +150,17 @@ async def text_search(
         results = await search_engine.search(request)
 
         # Format results for API response
-        formatted_results = []
-        for result in results:
-            formatted_results.append(
-                {
-                    "file_path": result.file_path,
-                    "line_number": result.line_start,
-                    "content": result.chunk_type,  # Contains the matched line content
-                    "match_type": "text",
-                }
-            )
+        formatted_results = [
+            {
+                "file_path": result.file_path,
+                "line_number": result.line_start,
+                "content": result.content,
+                "match_type": "text",
+            }
+            for result in results
+        ]
 
-        return create_success_response(
+        return create_orjson_success_response(
             {
                 "query": query,
                 "search_type": "text",
@@ -204,21 +207,20 @@ async def symbol_search(
         results = await search_engine.search(request)
 
         # Format results for API response
-        formatted_results = []
-        for result in results:
-            formatted_results.append(
-                {
-                    "file_path": result.file_path,
-                    "symbol_name": result.symbol_name,
-                    "symbol_type": result.chunk_type,
-                    "line_start": result.line_start,
-                    "line_end": result.line_end,
-                    "signature": result.signature,
-                    "relevance_score": result.relevance_score,
-                }
-            )
+        formatted_results = [
+            {
+                "file_path": result.file_path,
+                "symbol_name": result.symbol_name,
+                "symbol_type": result.chunk_type,
+                "line_start": result.line_start,
+                "line_end": result.line_end,
+                "signature": result.signature,
+                "relevance_score": result.relevance_score,
+            }
+            for result in results
+        ]
 
-        return create_success_response(
+        return create_orjson_success_response(
             {
                 "query": query,
                 "search_type": search_type,
@@ -2,47 +2,71 @@
 Static file serving for templates and components
 """
 
-from pathlib import Path
-from fastapi import APIRouter
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.staticfiles import StaticFiles
 
 router = APIRouter(tags=["static"])
 
+# Assets may be reused for a minute before the browser revalidates them;
+# the dashboard page is always revalidated so UI changes show up at once
+ASSET_CACHE_CONTROL = "public, max-age=60"
+PAGE_CACHE_CONTROL = "no-cache"
 
-@router.get("/")
-async def serve_dashboard():
-    """Serve the main dashboard index.html"""
-    return FileResponse("templates/index.html")
-
-
-@router.get("/templates/components/{file_path:path}")
-async def serve_component(file_path: str):
-    """Serve HTML component files"""
-    component_path = Path("templates/components") / file_path
 
-    if component_path.exists() and component_path.suffix == ".html":
-        return FileResponse(component_path)
+class CachingStaticFiles(StaticFiles):
+    """
+    StaticFiles that adds a Cache-Control header to file responses
 
-    return HTMLResponse(content="<div>Component not found</div>", status_code=404)
+    StaticFiles already sends ETag/Last-Modified and answers matching
+    If-None-Match/If-Modified-Since requests with an empty 304.
+    """
 
+    def __init__(self, *, cache_control: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cache_control = cache_control
 
-@router.get("/static/js/{file_path:path}")
-async def serve_javascript(file_path: str):
-    """Serve JavaScript files"""
-    js_path = Path("templates/static/js") / file_path
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("cache-control", self.cache_control)
+        return response
 
-    if js_path.exists() and js_path.suffix == ".js":
-        return FileResponse(js_path, media_type="application/javascript")
 
-    return HTMLResponse(content="// File not found", status_code=404)
+# The dashboard page goes through the same lookup as the mounted assets
+_templates = CachingStaticFiles(
+    directory="templates", check_dir=False, cache_control=PAGE_CACHE_CONTROL
+)
 
 
-@router.get("/static/css/{file_path:path}")
-async def serve_css(file_path: str):
-    """Serve CSS files"""
-    css_path = Path("templates/static/css") / file_path
-
-    if css_path.exists() and css_path.suffix == ".css":
-        return FileResponse(css_path, media_type="text/css")
-
-    return HTMLResponse(content="/* File not found */", status_code=404)
+@router.get("/")
+async def serve_dashboard(request: Request):
+    """Serve the main dashboard index.html"""
+    return await _templates.get_response("index.html", request.scope)
+
+
+def mount_static_files(app: FastAPI) -> None:
+    """
+    Mount the dashboard components and JS/CSS assets
+
+    StaticFiles answers conditional requests (ETag/Last-Modified, 304) and
+    keeps lookups inside the mounted directory. The directories are relative
+    to the server's working directory like the dashboard page above, so
+    they are not required to exist at startup.
+    """
+    app.mount(
+        "/templates/components",
+        CachingStaticFiles(
+            directory="templates/components",
+            check_dir=False,
+            cache_control=ASSET_CACHE_CONTROL,
+        ),
+        name="components",
+    )
+    app.mount(
+        "/static",
+        CachingStaticFiles(
+            directory="templates/static",
+            check_dir=False,
+            cache_control=ASSET_CACHE_CONTROL,
+        ),
+        name="static",
+    )
@@ -3,7 +3,6 @@ Working directory management endpoints
 Handles working directory validation, changes, and reinitialization
 """
 
-import os
 from pathlib import Path
 from fastapi import APIRouter
 
@@ -15,6 +14,8 @@ from utils import (
     create_success_response,
     create_error_response,
     create_detailed_error_response,
+    invalidate_directory_probes,
+    probe_directory,
 )
 
 router = APIRouter(prefix="/working-directory", tags=["working-directory"])
@@ -26,14 +27,15 @@ async def get_working_directory():
     try:
         settings = get_settings()
         services = get_services_status()
+        probe = await probe_directory(settings.WORKING_DIR)
 
         return create_success_response(
             {
                 "working_directory": settings.WORKING_DIR,
                 "services_status": services,
-                "directory_exists": os.path.exists(settings.WORKING_DIR),
-                "directory_readable": os.access(settings.WORKING_DIR, os.R_OK),
-                "directory_writable": os.access(settings.WORKING_DIR, os.W_OK),
+                "directory_exists": probe.exists,
+                "directory_readable": probe.readable,
+                "directory_writable": probe.writable,
             }
         )
     except Exception as e:
@@ -76,8 +78,12 @@ async def change_working_directory(request: WorkingDirectoryRequest):
                 settings.WORKING_DIR,
             )
 
+        # One stat/access probe answers the existence, type and permission
+        # checks below
+        probe = await probe_directory(new_dir)
+
         # Check if directory exists
-        if not new_dir_path.exists():
+        if not probe.exists:
             return create_detailed_error_response(
                 f"Directory does not exist: {new_dir}",
                 404,
@@ -93,14 +99,14 @@ async def change_working_directory(request: WorkingDirectoryRequest):
             )
 
         # Check if it's actually a directory
-        if not new_dir_path.is_dir():
+        if not probe.is_directory:
             return create_detailed_error_response(
                 f"Path is not a directory: {new_dir}",
                 400,
                 "NotADirectory",
                 {
                     "requested_path": new_dir,
-                    "path_type": "file" if new_dir_path.is_file() else "unknown",
+                    "path_type": "file" if probe.is_file else "unknown",
                 },
                 "WorkingDirectoryManager",
                 "directory_check",
@@ -108,7 +114,7 @@ async def change_working_directory(request: WorkingDirectoryRequest):
             )
 
         # Check permissions
-        if not os.access(new_dir, os.R_OK):
+        if not probe.readable:
             return create_detailed_error_response(
                 f"Directory is not readable: {new_dir}",
                 403,
@@ -119,7 +125,7 @@ async def change_working_directory(request: WorkingDirectoryRequest):
                 settings.WORKING_DIR,
             )
 
-        if not os.access(new_dir, os.W_OK):
+        if not probe.writable:
             return create_detailed_error_response(
                 f"Directory is not writable: {new_dir}",
                 403,
@@ -149,6 +155,7 @@ async def change_working_directory(request: WorkingDirectoryRequest):
         try:
             # Reinitialize all services
             await reinitialize_services(new_dir)
+            invalidate_directory_probes(old_working_dir, new_dir)
 
             return create_success_response(
                 {
@@ -227,21 +234,23 @@ async def validate_working_directory(request: WorkingDirectoryRequest):
             validation["errors"].append(f"Invalid path: {str(e)}")
             return create_success_response(validation)
 
-        validation["exists"] = new_dir_path.exists()
+        probe = await probe_directory(str(new_dir_path))
+
+        validation["exists"] = probe.exists
         if not validation["exists"]:
             validation["errors"].append("Directory does not exist")
             return create_success_response(validation)
 
-        validation["is_directory"] = new_dir_path.is_dir()
+        validation["is_directory"] = probe.is_directory
         if not validation["is_directory"]:
             validation["errors"].append("Path is not a directory")
             return create_success_response(validation)
 
-        validation["readable"] = os.access(str(new_dir_path), os.R_OK)
+        validation["readable"] = probe.readable
         if not validation["readable"]:
             validation["errors"].append("Directory is not readable")
 
-        validation["writable"] = os.access(str(new_dir_path), os.W_OK)
+        validation["writable"] = probe.writable
         if not validation["writable"]:
             validation["errors"].append("Directory is not writable")
 
@@ -1,9 +1,11 @@
 """Base chunker interface"""
 
+import asyncio
 import hashlib
 from abc import ABC, abstractmethod
 from typing import List
 from pathlib import Path
+from semantic_search.file_hash import file_sha1
 from semantic_search.models import ChunkData
 
 
@@ -30,19 +32,23 @@ class BaseChunker(ABC):
         """Extract specific lines from content"""
         lines = content.split("\n")
         return "\n".join(lines[start_line - 1 : end_line])
+
+    def _extract_from_lines(
+        self, lines: List[str], start_line: int, end_line: int
+    ) -> str:
+        """Extract specific lines from an already split file"""
+        return "\n".join(lines[start_line - 1 : end_line])
+
     def calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA1 hash of file content"""
-        try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha1(f.read()).hexdigest()
-        except Exception:
-            return ""
+        return file_sha1(file_path)
     
-    @abstractmethod
     async def chunk_file(self, file_path: str, content: str) -> List[ChunkData]:
+        """Chunk file content in a worker thread"""
+        # Parsing is CPU-bound, so it runs off the event loop
+        return await asyncio.to_thread(self._chunk_content, file_path, content)
+
+    @abstractmethod
+    def _chunk_content(self, file_path: str, content: str) -> List[ChunkData]:
         """Chunk file content - implemented by subclasses"""
-        # Calculate file hash
-        # file_hash = self.calculate_file_hash(file_path)
-        
-        # This will be implemented by subclasses, but they should use the file_hash
-        raise NotImplementedError("Subclasses must implement chunk_file")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement _chunk_content")
\ No newline at end of file
@@ -2,10 +2,28 @@
 
 import re
 import json
-from typing import List, Optional, Match
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Match
 from .base import BaseChunker
 from semantic_search.models import ChunkData
 
+_NEWLINE = re.compile("\n")
+_BRACE = re.compile("[{}]")
+
+# Every keyword a construct pattern can start with
+_CONSTRUCT_KEYWORDS = (
+    "export",
+    "async",
+    "function",
+    "const",
+    "let",
+    "var",
+    "abstract",
+    "class",
+    "interface",
+    "import",
+)
+
 
 class JSChunker(BaseChunker):
     """Regex-based JavaScript/TypeScript chunker"""
@@ -34,43 +52,104 @@ class JSChunker(BaseChunker):
             re.MULTILINE,
         )
 
-    async def chunk_file(self, file_path: str, content: str) -> List[ChunkData]:
+        # All of the above as one alternation, so a file is scanned once.
+        # The alternatives start with different keywords, so at most one
+        # can match at a position; lastgroup names the construct found.
+        # The leading keyword lookahead rejects most positions before any
+        # alternative is tried
+        self._construct_patterns = {
+            "function": self.function_pattern,
+            "arrow_function": self.arrow_function_pattern,
+            "class": self.class_pattern,
+            "interface": self.interface_pattern,
+            "import": self.import_pattern,
+        }
+        self.combined_pattern = re.compile(
+            f"(?={'|'.join(_CONSTRUCT_KEYWORDS)})(?:"
+            + "|".join(
+                f"(?P<{name}>{pattern.pattern})"
+                for name, pattern in self._construct_patterns.items()
+            )
+            + ")",
+            re.MULTILINE,
+        )
+
+    def _scan_constructs(self, content: str) -> Dict[str, List[Match]]:
+        """
+        Find every construct in one pass, grouped by kind in file order
+
+        Each hit is re-matched with its own pattern at the same offset so
+        callers get the usual group numbering.
+        """
+        found: Dict[str, List[Match]] = {
+            name: [] for name in self._construct_patterns
+        }
+        for match in self.combined_pattern.finditer(content):
+            kind = match.lastgroup
+            own_match = self._construct_patterns[kind].match(content, match.start())
+            if own_match:
+                found[kind].append(own_match)
+        return found
+
+    def _chunk_content(self, file_path: str, content: str) -> List[ChunkData]:
         """Extract chunks from JavaScript/TypeScript file"""
         try:
             chunks = []
             lines = content.split("\n")
+            # Offsets of every newline, so positions map to line numbers
+            # with a binary search instead of counting through the prefix
+            newlines = [m.start() for m in _NEWLINE.finditer(content)]
+            # Offsets of every brace, so block ends are found by walking
+            # braces only rather than every character
+            braces = [m.start() for m in _BRACE.finditer(content)]
+
+            constructs = self._scan_constructs(content)
 
             # File overview
-            file_overview = self._create_file_overview(content, file_path, lines)
+            file_overview = self._create_file_overview(constructs, file_path, lines)
             chunks.append(file_overview)
 
             # Find functions
-            for match in self.function_pattern.finditer(content):
+            for match in constructs["function"]:
                 chunk = self._create_function_chunk(
-                    match, content, file_path, lines, "function"
+                    match,
+                    content,
+                    file_path,
+                    lines,
+                    newlines,
+                    braces,
+                    "function",
                 )
                 if chunk:
                     chunks.append(chunk)
 
             # Find arrow functions
-            for match in self.arrow_function_pattern.finditer(content):
+            for match in constructs["arrow_function"]:
                 chunk = self._create_function_chunk(
-                    match, content, file_path, lines, "arrow_function"
+                    match,
+                    content,
+                    file_path,
+                    lines,
+                    newlines,
+                    braces,
+                    "arrow_function",
                 )
                 if chunk:
                     chunks.append(chunk)
 
             # Find classes
-            for match in self.class_pattern.finditer(content):
-                chunk = self._create_class_chunk(match, content, file_path, lines)
+            for match in constructs["class"]:
+                chunk = self._create_class_chunk(
+                    match, content, file_path, lines, newlines, braces
+                )
                 if chunk:
                     chunks.append(chunk)
 
             # Find interfaces (TypeScript)
             if file_path.endswith((".ts", ".tsx")):
-                for match in self.interface_pattern.finditer(content):
+                for match in constructs["interface"]:
                     chunk = self._create_interface_chunk(
-                        match, content, file_path, lines
+                        match, content, file_path, lines, newlines, braces
                     )
                     if chunk:
                         chunks.append(chunk)
@@ -92,33 +171,21 @@ class JSChunker(BaseChunker):
             ]
 
     def _create_file_overview(
-        self, content: str, file_path: str, lines: List[str]
+        self, constructs: Dict[str, List[Match]], file_path: str, lines: List[str]
     ) -> ChunkData:
         """Create file overview chunk"""
-        imports = []
-        functions = []
-        classes = []
-        interfaces = []
-
         # Extract imports
-        for match in self.import_pattern.finditer(content):
-            module = match.group(4)
-            imports.append(module)
+        imports = [match.group(4) for match in constructs["import"]]
 
         # Extract function names
-        for match in self.function_pattern.finditer(content):
-            functions.append(match.group(3))
-
-        for match in self.arrow_function_pattern.finditer(content):
-            functions.append(match.group(3))
+        functions = [match.group(3) for match in constructs["function"]]
+        functions += [match.group(3) for match in constructs["arrow_function"]]
 
         # Extract class names
-        for match in self.class_pattern.finditer(content):
-            classes.append(match.group(3))
+        classes = [match.group(3) for match in constructs["class"]]
 
         # Extract interface names (TypeScript)
-        for match in self.interface_pattern.finditer(content):
-            interfaces.append(match.group(2))
+        interfaces = [match.group(2) for match in constructs["interface"]]
 
         file_type = (
             "typescript" if file_path.endswith((".ts", ".tsx")) else "javascript"
@@ -151,25 +218,18 @@ class JSChunker(BaseChunker):
         content: str,
         file_path: str,
         lines: List[str],
+        newlines: List[int],
+        braces: List[int],
         func_type: str,
     ) -> Optional[ChunkData]:
         """Create function chunk"""
         start_pos = match.start()
-        line_start = content[:start_pos].count("\n") + 1
+        line_start = bisect_left(newlines, start_pos) + 1
 
         # Find function end by matching braces
-        brace_count = 0
-        pos = match.end() - 1  # Start from the opening brace
-        while pos < len(content):
-            if content[pos] == "{":
-                brace_count += 1
-            elif content[pos] == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    break
-            pos += 1
+        pos = self._find_block_end(content, braces, match.end() - 1)
 
-        line_end = content[: pos + 1].count("\n") + 1
+        line_end = bisect_right(newlines, pos) + 1
 
         # Extract function name
         if func_type == "function":
@@ -178,7 +238,7 @@ class JSChunker(BaseChunker):
             func_name = match.group(3)
 
         # Extract function content
-        func_content = self._extract_content_lines(content, line_start, line_end)
+        func_content = self._extract_from_lines(lines, line_start, line_end)
 
         # Extract signature (first line)
         signature = lines[line_start - 1].strip()
@@ -199,25 +259,22 @@ class JSChunker(BaseChunker):
         )
 
     def _create_class_chunk(
-        self, match: Match, content: str, file_path: str, lines: List[str]
+        self,
+        match: Match,
+        content: str,
+        file_path: str,
+        lines: List[str],
+        newlines: List[int],
+        braces: List[int],
     ) -> Optional[ChunkData]:
         """Create class chunk"""
         start_pos = match.start()
-        line_start = content[:start_pos].count("\n") + 1
+        line_start = bisect_left(newlines, start_pos) + 1
 
         # Find class end by matching braces
-        brace_count = 0
-        pos = match.end() - 1
-        while pos < len(content):
-            if content[pos] == "{":
-                brace_count += 1
-            elif content[pos] == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    break
-            pos += 1
+        pos = self._find_block_end(content, braces, match.end() - 1)
 
-        line_end = content[: pos + 1].count("\n") + 1
+        line_end = bisect_right(newlines, pos) + 1
 
         class_name = match.group(3)
         signature = lines[line_start - 1].strip()
@@ -244,30 +301,27 @@ class JSChunker(BaseChunker):
         )
 
     def _create_interface_chunk(
-        self, match: Match, content: str, file_path: str, lines: List[str]
+        self,
+        match: Match,
+        content: str,
+        file_path: str,
+        lines: List[str],
+        newlines: List[int],
+        braces: List[int],
     ) -> Optional[ChunkData]:
         """Create interface chunk (TypeScript)"""
         start_pos = match.start()
-        line_start = content[:start_pos].count("\n") + 1
+        line_start = bisect_left(newlines, start_pos) + 1
 
         # Find interface end
-        brace_count = 0
-        pos = match.end() - 1
-        while pos < len(content):
-            if content[pos] == "{":
-                brace_count += 1
-            elif content[pos] == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    break
-            pos += 1
+        pos = self._find_block_end(content, braces, match.end() - 1)
 
-        line_end = content[: pos + 1].count("\n") + 1
+        line_end = bisect_right(newlines, pos) + 1
 
         interface_name = match.group(2)
         signature = lines[line_start - 1].strip()
 
-        interface_content = self._extract_content_lines(content, line_start, line_end)
+        interface_content = self._extract_from_lines(lines, line_start, line_end)
 
         return ChunkData(
             chunk_id=self._generate_chunk_id(file_path, interface_name, line_start),
@@ -280,6 +334,25 @@ class JSChunker(BaseChunker):
             signature=signature,
         )
 
+    @staticmethod
+    def _find_block_end(content: str, braces: List[int], start: int) -> int:
+        """
+        Offset of the brace closing the block that starts at or after start
+
+        Walks only the brace offsets from start on. Returns len(content)
+        when the block is never closed.
+        """
+        depth = 0
+        for i in range(bisect_left(braces, start), len(braces)):
+            pos = braces[i]
+            if content[pos] == "{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+        return len(content)
+
     def _extract_jsdoc(self, lines: List[str], func_line: int) -> Optional[str]:
         """Extract JSDoc comment above function"""
         # Look backwards for JSDoc comment
@@ -2,10 +2,61 @@
 
 import ast
 import json
-from typing import List, Optional,Union
+from typing import Iterator, List, Optional, Sequence, Union
 from .base import BaseChunker
 from semantic_search.models import ChunkData
 
+# Definitions that get their own chunks
+_DEFINITION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# Compound statements whose bodies still belong to the enclosing scope,
+# e.g. a function defined under "if TYPE_CHECKING:" or in a try block
+_BLOCK_NODES = (
+    ast.If,
+    ast.Try,
+    ast.With,
+    ast.AsyncWith,
+    ast.For,
+    ast.AsyncFor,
+    ast.While,
+) + ((ast.TryStar,) if hasattr(ast, "TryStar") else ())
+
+
+def _scope_definitions(
+    body: Sequence[ast.stmt],
+) -> Iterator[Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]]:
+    """Yield the functions and classes defined directly in a scope body"""
+    for node in body:
+        if isinstance(node, _DEFINITION_NODES):
+            yield node
+        elif isinstance(node, _BLOCK_NODES):
+            yield from _scope_definitions(node.body)
+            yield from _scope_definitions(getattr(node, "orelse", ()))
+            yield from _scope_definitions(getattr(node, "finalbody", ()))
+            for handler in getattr(node, "handlers", ()):
+                yield from _scope_definitions(handler.body)
+
+
+def _source_text(lines: List[str], node: ast.expr) -> str:
+    """
+    Source text of an expression, sliced from the already split file
+
+    Single-line expressions (nearly all annotations and bases) are cut out
+    by their column offsets; anything else falls back to ast.unparse.
+    """
+    lineno = node.lineno
+    end_col = node.end_col_offset
+    if lineno == node.end_lineno and end_col is not None and 0 < lineno <= len(lines):
+        line = lines[lineno - 1]
+        if line.isascii():
+            text = line[node.col_offset : end_col]
+        else:
+            # Column offsets count UTF-8 bytes, not characters
+            text = line.encode()[node.col_offset : end_col].decode(errors="replace")
+        if text:
+            return text
+    return ast.unparse(node)
+
 
 class PythonChunker(BaseChunker):
     """AST-based Python code chunker"""
@@ -14,30 +65,37 @@ class PythonChunker(BaseChunker):
         super().__init__()
         self.supported_extensions = {".py"}
 
-    async def chunk_file(self, file_path: str, content: str) -> List[ChunkData]:
+    def _chunk_content(self, file_path: str, content: str) -> List[ChunkData]:
         """Extract chunks from Python file"""
         try:
             tree = ast.parse(content, filename=file_path)
             chunks = []
+            # Split once; every chunk slices its lines from this list
+            lines = content.split("\n")
 
             # File overview chunk
-            file_overview = self._create_file_overview(tree, file_path, content)
+            file_overview = self._create_file_overview(tree, file_path, lines)
             chunks.append(file_overview)
 
-            # Function and class chunks
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Only top-level functions or class methods
-                    chunk = self._create_function_chunk(node, file_path, content)
+            # Module-level functions and classes, plus the methods of those
+            # classes; function bodies are never descended into
+            for node in _scope_definitions(tree.body):
+                if isinstance(node, ast.ClassDef):
+                    chunk = self._create_class_chunk(node, file_path, lines)
                     if chunk:
                         chunks.append(chunk)
 
-                elif isinstance(node, ast.ClassDef):
-                    # Top-level classes only
-                    if node.col_offset == 0:
-                        chunk = self._create_class_chunk(node, file_path, content)
-                        if chunk:
-                            chunks.append(chunk)
+                    for item in _scope_definitions(node.body):
+                        if not isinstance(item, ast.ClassDef):
+                            chunk = self._create_function_chunk(
+                                item, file_path, lines
+                            )
+                            if chunk:
+                                chunks.append(chunk)
+                else:
+                    chunk = self._create_function_chunk(node, file_path, lines)
+                    if chunk:
+                        chunks.append(chunk)
 
             return chunks
 
@@ -56,7 +114,7 @@ class PythonChunker(BaseChunker):
             ]
 
     def _create_file_overview(
-        self, tree: ast.Module, file_path: str, content: str
+        self, tree: ast.Module, file_path: str, lines: List[str]
     ) -> ChunkData:
         """Create file-level overview chunk"""
         imports = []
@@ -81,7 +139,7 @@ class PythonChunker(BaseChunker):
             "imports": imports,
             "functions": functions,
             "classes": classes,
-            "total_lines": len(content.split("\n")),
+            "total_lines": len(lines),
         }
 
         return ChunkData(
@@ -90,12 +148,12 @@ class PythonChunker(BaseChunker):
             chunk_type="file_overview",
             symbol_name="file_overview",
             line_start=1,
-            line_end=len(content.split("\n")),
+            line_end=len(lines),
             content=json.dumps(overview_content, indent=2),
         )
 
     def _create_function_chunk(
-        self, node: Union[ast.FunctionDef,ast.AsyncFunctionDef], file_path: str, content: str
+        self, node: Union[ast.FunctionDef,ast.AsyncFunctionDef], file_path: str, lines: List[str]
     ) -> Optional[ChunkData]:
         """Create chunk for function/method"""
         if not node.lineno or not node.end_lineno:
@@ -107,15 +165,16 @@ class PythonChunker(BaseChunker):
             node.body
             and isinstance(node.body[0], ast.Expr)
             and isinstance(node.body[0].value, ast.Constant)
+            and isinstance(node.body[0].value.value, str)
         ):
             docstring = node.body[0].value.value
 
         # Build signature
-        signature = self._build_function_signature(node)
+        signature = self._build_function_signature(node, lines)
 
         # Extract function content
-        func_content = self._extract_content_lines(
-            content, node.lineno, node.end_lineno
+        func_content = self._extract_from_lines(
+            lines, node.lineno, node.end_lineno
         )
 
         return ChunkData(
@@ -131,7 +190,7 @@ class PythonChunker(BaseChunker):
         )
 
     def _create_class_chunk(
-        self, node: ast.ClassDef, file_path: str, content: str
+        self, node: ast.ClassDef, file_path: str, lines: List[str]
     ) -> Optional[ChunkData]:
         """Create chunk for class"""
         if not node.lineno or not node.end_lineno:
@@ -143,6 +202,7 @@ class PythonChunker(BaseChunker):
             node.body
             and isinstance(node.body[0], ast.Expr)
             and isinstance(node.body[0].value, ast.Constant)
+            and isinstance(node.body[0].value.value, str)
         ):
             docstring = node.body[0].value.value
 
@@ -153,11 +213,7 @@ class PythonChunker(BaseChunker):
                 methods.append(item.name)
 
         # Build signature with inheritance
-        bases = (
-            [ast.unparse(base) for base in node.bases]
-            if hasattr(ast, "unparse")
-            else []
-        )
+        bases = [_source_text(lines, base) for base in node.bases]
         signature = f"class {node.name}"
         if bases:
             signature += f"({', '.join(bases)})"
@@ -182,15 +238,17 @@ class PythonChunker(BaseChunker):
             docstring=str(docstring),
         )
 
-    def _build_function_signature(self, node: Union[ast.FunctionDef,ast.AsyncFunctionDef]) -> str:
+    def _build_function_signature(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], lines: List[str]
+    ) -> str:
         """Build function signature string"""
         args = []
 
         # Regular arguments
         for arg in node.args.args:
             arg_str = arg.arg
-            if hasattr(ast, "unparse") and arg.annotation:
-                arg_str += f": {ast.unparse(arg.annotation)}"
+            if arg.annotation:
+                arg_str += f": {_source_text(lines, arg.annotation)}"
             args.append(arg_str)
 
         # Add defaults handling could go here
@@ -198,7 +256,7 @@ class PythonChunker(BaseChunker):
         signature = f"def {node.name}({', '.join(args)})"
 
         # Return type
-        if hasattr(ast, "unparse") and node.returns:
-            signature += f" -> {ast.unparse(node.returns)}"
+        if node.returns:
+            signature += f" -> {_source_text(lines, node.returns)}"
 
         return signature
@@ -10,6 +10,9 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 import logging
 
+import aiofiles
+import aiofiles.os
+
 from .gemini_client import GeminiClient
 from .write_pipeline import WritePipeline
 
@@ -335,12 +338,12 @@ class EditPipeline:
                 # Assume relative to current working directory
                 path = Path(os.getenv('WORKING_DIR', '.'))/file_path
 
-            if not path.exists():
+            if not await aiofiles.os.path.exists(path):
                 logger.error(f"File not found: {file_path}")
                 return ""
 
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
+            async with aiofiles.open(path, "r", encoding="utf-8") as f:
+                return await f.read()
 
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
@@ -356,10 +359,10 @@ class EditPipeline:
                 path = Path.cwd() / file_path
 
             # Ensure parent directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.makedirs(path.parent, exist_ok=True)
 
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
+            async with aiofiles.open(path, "w", encoding="utf-8") as f:
+                await f.write(content)
 
             logger.info(f"File saved: {file_path}")
             return True
@@ -5,17 +5,36 @@ Handles git operations and provides structured output for LLM context
 """
 
 import os
+import re
+import asyncio
 import subprocess
+from collections import OrderedDict
+from functools import partial
 
 # import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable, Awaitable
 from datetime import datetime
 import logging
-from dataclasses import dataclass, asdict
+from copy import deepcopy
+from dataclasses import dataclass, asdict, replace
 
 logger = logging.getLogger(__name__)
 
+# Summary line printed by git commit, capturing the abbreviated hash
+_COMMIT_SUMMARY_RE = re.compile(r"\[[^\]]*?([0-9a-f]{7,40})\]")
+
+# Blame results kept per (file_path, HEAD sha, mtime_ns, size)
+BLAME_CACHE_SIZE = 512
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode git output like subprocess text mode, with universal newlines"""
+    text = data.decode()
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
 @dataclass
 class GitStatus:
@@ -94,6 +113,9 @@ class GitManager:
         print(f"   self.git_dir: {self.git_dir}")
         print(f"   git_dir exists: {self.git_dir.exists()}")
         print(f"   current working directory: {working_dir}")
+        # Probed once per manager and only flipped by initialize_codebase_repo,
+        # so the per-operation checks never stat .codebase again; the repo
+        # root is working_dir itself, so no rev-parse --show-toplevel is needed
         self.is_git_repo = self._is_git_repository()
         self.stats = {
             "total_operations": 0,
@@ -102,6 +124,12 @@ class GitManager:
             "commits_made": 0,
             "last_operation": None,
         }
+        self._blame_cache: "OrderedDict[tuple, GitResult]" = OrderedDict()
+        # HEAD commit as last seen through this manager, None until resolved.
+        # Commits record the new hash and branch switches or merges reset it,
+        # so blame cache lookups do not spawn git rev-parse every time
+        self._head: Optional[str] = None
+        self._inflight: Dict[tuple, "asyncio.Task[GitResult]"] = {}
     async def initialize_codebase_repo(self) -> GitResult:
         """Initialize a new .codebase repository"""
         try:
@@ -156,6 +184,28 @@ class GitManager:
         except Exception:
             return False
 
+    async def _single_flight(
+        self, key: tuple, run: Callable[[], Awaitable[GitResult]]
+    ) -> GitResult:
+        """
+        Share one in-flight git call between concurrent identical requests
+
+        Callers arriving while a call for the same key is running await its
+        result instead of spawning another subprocess. The shared task is
+        shielded so one caller being cancelled does not cancel the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
+
+            def _done(finished: "asyncio.Task[GitResult]") -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
     async def _run_git_command(self, args: List[str], timeout: int = 30) -> GitResult:
         """Run a git command and return structured result"""
         try:
@@ -166,30 +216,42 @@ class GitManager:
             print("🔍 Git Command Debug:")
             print(f"   Command: git --git-dir={self.git_dir} --work-tree={self.working_dir} {' '.join(args)}")
             print(f"   CWD: {self.working_dir}")
-            result = subprocess.run(
-                ["git", "--git-dir", str(self.git_dir), "--work-tree", str(self.working_dir)] + args,
+            # The event loop reads both pipes itself, so no worker thread is
+            # tied up per command and independent git calls still overlap
+            process = await asyncio.create_subprocess_exec(
+                "git", "--git-dir", str(self.git_dir), "--work-tree", str(self.working_dir), *args,
                 cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            print(f"   Return code: {result.returncode}")
-            print(f"   Stdout: {result.stdout}")
-            print(f"   Stderr: {result.stderr}")
-            if result.returncode == 0:
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                    process.communicate(), timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise subprocess.TimeoutExpired(args, timeout)
+
+            stdout = _decode_output(stdout_bytes)
+            stderr = _decode_output(stderr_bytes)
+            print(f"   Return code: {process.returncode}")
+            print(f"   Stdout: {stdout}")
+            print(f"   Stderr: {stderr}")
+            if process.returncode == 0:
                 self.stats["successful_operations"] += 1
                 return GitResult(
                     success=True,
-                    output=result.stdout.strip() if result.stdout else "",
-                    return_code=result.returncode,
+                    output=stdout.strip() if stdout else "",
+                    return_code=process.returncode,
                 )
             else:
                 self.stats["failed_operations"] += 1
                 return GitResult(
                     success=False,
-                    output=result.stdout.strip() if result.stdout else "",
-                    error=result.stderr.strip() if result.stderr else "",
-                    return_code=result.returncode,
+                    output=stdout.strip() if stdout else "",
+                    error=stderr.strip() if stderr else "",
+                    return_code=process.returncode,
                 )
 
         except subprocess.TimeoutExpired:
@@ -207,6 +269,10 @@ class GitManager:
 
     async def get_status(self) -> GitResult:
         """Get comprehensive git status"""
+        return await self._single_flight(("status",), self._get_status)
+
+    async def _get_status(self) -> GitResult:
+        """Run and parse git status; callers go through get_status"""
         if not self.is_git_repo:
             init_result = await self.initialize_codebase_repo()
             if not init_result.success:
@@ -294,6 +360,10 @@ class GitManager:
 
     async def get_branches(self) -> GitResult:
         """Get all branches with information"""
+        return await self._single_flight(("branches",), self._get_branches)
+
+    async def _get_branches(self) -> GitResult:
+        """Run and parse git branch; callers go through get_branches"""
         if not self.is_git_repo:
             return GitResult(
                 success=False,
@@ -497,13 +567,40 @@ class GitManager:
             result = await self._run_git_command(args)
 
             if result.success:
-                self.stats["commits_made"] += 1
+                await self._record_commit(result)
+
+            return result
+
+        except Exception as e:
+            return GitResult(
+                success=False,
+                output="error has occured",
+                error=f"Failed to commit: {str(e)}",
+            )
 
-                # Get commit hash
-                hash_result = await self._run_git_command(["rev-parse", "HEAD"])
-                if hash_result.success and hash_result.output:
-                    result.data = {"commit_hash": hash_result.output[:7]}
+    async def add_and_commit(self, files: List[str], message: str) -> GitResult:
+        """
+        Commit the given files in a single git invocation
 
+        Uses ``git commit --only``, which stages and commits just these paths.
+        Paths git does not know yet cannot be committed that way, so untracked
+        files fall back to an explicit add followed by commit.
+        """
+        if not self.is_git_repo:
+            return GitResult(
+                success=False, output="no git repo found", error="Not a git repository"
+            )
+
+        try:
+            result = await self._run_git_command(
+                ["commit", "--only", "-m", message, "--", *files]
+            )
+            if result.success:
+                await self._record_commit(result)
+                return result
+
+            if "did not match any file" in (result.error or ""):
+                return await self.commit(message=message, files=files)
             return result
 
         except Exception as e:
@@ -513,14 +610,55 @@ class GitManager:
                 error=f"Failed to commit: {str(e)}",
             )
 
+    async def _record_commit(self, result: GitResult) -> None:
+        """Count a successful commit and attach its short hash to result"""
+        self.stats["commits_made"] += 1
+
+        # git commit prints "[branch (root-commit) abc1234] message"
+        match = _COMMIT_SUMMARY_RE.match(result.output)
+        if match:
+            self._head = match.group(1)
+            result.data = {"commit_hash": match.group(1)[:7]}
+            return
+
+        self._head = None
+        hash_result = await self._run_git_command(["rev-parse", "HEAD"])
+        if hash_result.success and hash_result.output:
+            self._head = hash_result.output
+            result.data = {"commit_hash": hash_result.output[:7]}
+
+    async def _get_head(self) -> Optional[str]:
+        """HEAD commit, running git rev-parse only when it is not known"""
+        if self._head is None:
+            head_result = await self._run_git_command(["rev-parse", "HEAD"])
+            if head_result.success and head_result.output:
+                self._head = head_result.output
+        return self._head
+
     async def get_file_blame(self, file_path: str) -> GitResult:
         """Get line-by-line file history (blame)"""
+        return await self._single_flight(
+            ("blame", file_path), partial(self._get_file_blame, file_path)
+        )
+
+    async def _get_file_blame(self, file_path: str) -> GitResult:
+        """Run or reuse a cached blame; callers go through get_file_blame"""
         if not self.is_git_repo:
             return GitResult(
                 success=False, output="no git repo found", error="Not a git repository"
             )
 
         try:
+            # Blame only changes with a new commit or an edit to the file, so
+            # repeat requests are served from the cache
+            cache_key = await self._blame_cache_key(file_path)
+            if cache_key is not None:
+                cached = self._blame_cache.get(cache_key)
+                if cached is not None:
+                    self._blame_cache.move_to_end(cache_key)
+                    # Callers may modify the result; the cached one stays intact
+                    return replace(cached, data=deepcopy(cached.data))
+
             args = ["blame", "--line-porcelain", file_path]
             result = await self._run_git_command(args)
 
@@ -535,6 +673,13 @@ class GitManager:
 
                 result.data = {"authors": authors, "file_path": file_path}
 
+            if result.success and cache_key is not None:
+                self._blame_cache[cache_key] = replace(
+                    result, data=deepcopy(result.data)
+                )
+                if len(self._blame_cache) > BLAME_CACHE_SIZE:
+                    self._blame_cache.popitem(last=False)
+
             return result
 
         except Exception as e:
@@ -544,6 +689,17 @@ class GitManager:
                 error=f"Failed to get blame for {file_path}: {str(e)}",
             )
 
+    async def _blame_cache_key(self, file_path: str) -> Optional[tuple]:
+        """Cache key for a blame of file_path, or None if it cannot be built"""
+        head = await self._get_head()
+        if head is None:
+            return None
+        try:
+            stat = await asyncio.to_thread(os.stat, self.working_dir / file_path)
+        except OSError:
+            return None
+        return (file_path, head, stat.st_mtime_ns, stat.st_size)
+
     def _parse_log_output(self, output: str) -> List[GitCommit]:
         """Parse git log output into structured commits"""
         commits = []
@@ -693,6 +849,8 @@ class GitManager:
             args.append(branch_name)
             
             result = await self._run_git_command(args)
+            if result.success:
+                self._head = None
             return result
             
         except Exception as e:
@@ -750,6 +908,8 @@ class GitManager:
                 args.extend(['-m', message])
             
             result = await self._run_git_command(args)
+            if result.success:
+                self._head = None
             return result
             
         except Exception as e:
@@ -759,12 +919,39 @@ class GitManager:
                 error=f"Failed to merge branch {branch_name}: {str(e)}"
             )
     
+    def _read_head_branch(self) -> Optional[str]:
+        """
+        Branch name from .codebase/HEAD, matching git branch --show-current
+
+        Returns "" for a detached HEAD and None if HEAD cannot be read.
+        """
+        try:
+            head = (self.git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):]
+        if head.startswith("ref: "):
+            return None
+        return ""
+
     async def get_current_branch(self) -> GitResult:
         """Get current branch name"""
         if not self.is_git_repo:
             return GitResult(success=False,output="no git repo found", error="Not a git repository")
         
         try:
+            # HEAD is a one-line file naming the checked-out branch, so it is
+            # read directly; git is only run if the file cannot be used
+            current_branch = self._read_head_branch()
+            if current_branch is not None:
+                return GitResult(
+                    success=True,
+                    output=current_branch,
+                    return_code=0,
+                    data={'current_branch': current_branch},
+                )
+
             result = await self._run_git_command(['branch', '--show-current'])
             if result.success:
                 current_branch = result.output.strip()
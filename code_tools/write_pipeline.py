@@ -1,9 +1,13 @@
 """Write pipeline that orchestrates code formatting and dependency checking"""
 
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass
 
+import aiofiles
+import aiofiles.os
+
 from .formatter import CodeFormatter, FormatResult
 from .dependency_checker import DependencyChecker, DependencyCheckResult
 from semantic_search.core import SemanticSearchEngine
@@ -41,13 +45,15 @@ class WritePipeline:
     async def process_write(
         self,
         content: str,
-        file_path: str,
+        file_path: Union[str, os.PathLike],
         purpose: Optional[str] = None,
         language: Optional[str] = None,
         save_to_file: bool = True,
     ) -> WriteResult:
         """Process code through the complete write pipeline"""
 
+        # Formatter argv, index keys and WriteResult all use the str form
+        file_path = os.fspath(file_path)
         original_content = content
         errors = []
         warnings = []
@@ -288,11 +294,11 @@ class WritePipeline:
         file_obj = Path(file_path)
 
         # Create parent directories if they don't exist
-        file_obj.parent.mkdir(parents=True, exist_ok=True)
+        await aiofiles.os.makedirs(file_obj.parent, exist_ok=True)
 
         # Write file
-        with open(file_obj, "w", encoding="utf-8") as f:
-            f.write(content)
+        async with aiofiles.open(file_obj, "w", encoding="utf-8") as f:
+            await f.write(content)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get pipeline statistics"""
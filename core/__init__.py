@@ -4,6 +4,7 @@ Core application components
 
 from core.config import Settings, get_settings
 from core.lifespan import lifespan, reinitialize_services
+from core.middleware import BodySizeLimitMiddleware
 from core.dependencies import (
     get_search_engine,
     get_write_pipeline,
@@ -12,6 +13,10 @@ from core.dependencies import (
     get_git_manager,
     get_project_manager,
     get_directory_lister,
+    require_search_engine,
+    require_write_pipeline,
+    require_edit_pipeline,
+    require_directory_lister,
     get_services_status,
 )
 
@@ -20,6 +25,7 @@ __all__ = [
     "get_settings",
     "lifespan",
     "reinitialize_services",
+    "BodySizeLimitMiddleware",
     "get_search_engine",
     "get_write_pipeline",
     "get_edit_pipeline",
@@ -27,5 +33,9 @@ __all__ = [
     "get_git_manager",
     "get_project_manager",
     "get_directory_lister",
+    "require_search_engine",
+    "require_write_pipeline",
+    "require_edit_pipeline",
+    "require_directory_lister",
     "get_services_status",
 ]
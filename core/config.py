@@ -4,6 +4,7 @@ Application configuration and settings
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -27,6 +28,11 @@ class Settings:
         # HTTP Configuration
         self.HTTP_TIMEOUT = 30.0
 
+        # Request bodies above this size are rejected with 413 before they
+        # are buffered; large enough for any write/edit payload the request
+        # models accept
+        self.MAX_REQUEST_BODY_BYTES = 64 * 1024 * 1024
+
         # CORS Configuration
         self.CORS_ORIGINS = ["*"]
         self.CORS_CREDENTIALS = True
@@ -42,6 +48,12 @@ class Settings:
 settings = Settings()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get settings instance"""
+    """
+    Get settings instance
+
+    Cached for use with Depends(get_settings). Working-directory changes
+    mutate the shared instance in place, so the cached value stays current.
+    """
     return settings
@@ -4,6 +4,7 @@ Manages global service instances and provides dependency injection
 """
 
 from typing import Optional
+from fastapi import HTTPException, status
 from semantic_search import SemanticSearchEngine
 from semantic_search.directory_lister import DirectoryLister
 from code_tools import WritePipeline, EditPipeline
@@ -99,6 +100,66 @@ def get_directory_lister() -> Optional[DirectoryLister]:
     return _directory_lister
 
 
+def require_search_engine() -> SemanticSearchEngine:
+    """
+    Dependency returning the search engine
+
+    Raises:
+        HTTPException: 503 if the search engine is not initialized
+    """
+    if _search_engine is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search engine not initialized",
+        )
+    return _search_engine
+
+
+def require_write_pipeline() -> WritePipeline:
+    """
+    Dependency returning the write pipeline
+
+    Raises:
+        HTTPException: 503 if the write pipeline is not initialized
+    """
+    if _write_pipeline is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Write pipeline not initialized",
+        )
+    return _write_pipeline
+
+
+def require_edit_pipeline() -> EditPipeline:
+    """
+    Dependency returning the edit pipeline
+
+    Raises:
+        HTTPException: 503 if the edit pipeline is not initialized
+    """
+    if _edit_pipeline is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Edit pipeline not initialized",
+        )
+    return _edit_pipeline
+
+
+def require_directory_lister() -> DirectoryLister:
+    """
+    Dependency returning the directory lister
+
+    Raises:
+        HTTPException: 503 if the directory lister is not initialized
+    """
+    if _directory_lister is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Directory lister not initialized",
+        )
+    return _directory_lister
+
+
 def get_services_status() -> dict:
     """Get status of all services"""
     return {
@@ -0,0 +1,64 @@
+"""
+ASGI middleware for the FastAPI application
+"""
+
+from fastapi import HTTPException
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 413 Content Too Large (named REQUEST_ENTITY_TOO_LARGE in older Starlette)
+_TOO_LARGE_STATUS = 413
+_TOO_LARGE_DETAIL = "Request body too large"
+_TOO_LARGE_BODY = b'{"error":"Request body too large","success":false}'
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies larger than max_bytes
+
+    Requests announcing a larger Content-Length get a 413 before any of the
+    body is read. Chunked bodies are counted as they stream in and abort
+    with a 413 HTTPException once they cross the limit, so oversized
+    payloads are never fully buffered.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    too_large = int(value) > self.max_bytes
+                except ValueError:
+                    too_large = False
+                if too_large:
+                    response = Response(
+                        content=_TOO_LARGE_BODY,
+                        status_code=_TOO_LARGE_STATUS,
+                        media_type="application/json",
+                    )
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(
+                        status_code=_TOO_LARGE_STATUS,
+                        detail=_TOO_LARGE_DETAIL,
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
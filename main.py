@@ -3,15 +3,19 @@ FastAPI Codebase Manager - Main Entry Point
 Clean, maintainable entry point with modular router architecture
 """
 
+import os
 import logging
 import argparse
+from functools import lru_cache
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
-from core import lifespan, get_settings
-from api.v1.routers import all_routers
+from core import lifespan, get_settings, BodySizeLimitMiddleware
+from api.v1.routers import all_routers, mount_static_files
+from utils import DetailedAPIError, ORJSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +23,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The unhandled-exception payload never varies, so it is encoded once
+_INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal server error", "success": False})
+
+
+@lru_cache(maxsize=256)
+def _encode_error_body(detail: str) -> bytes:
+    """
+    Encode an HTTPException payload
+
+    Most details are constants (e.g. "Write pipeline not initialized"), so
+    each distinct message is serialized once and reused.
+    """
+    return orjson.dumps({"error": detail, "success": False})
+
 
 def create_app() -> FastAPI:
     """
@@ -35,6 +53,7 @@ def create_app() -> FastAPI:
         description=settings.API_DESCRIPTION,
         version=settings.API_VERSION,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -46,33 +65,46 @@ def create_app() -> FastAPI:
         allow_headers=settings.CORS_HEADERS,
     )
 
+    # Reject oversized request bodies before they are buffered
+    app.add_middleware(
+        BodySizeLimitMiddleware, max_bytes=settings.MAX_REQUEST_BODY_BYTES
+    )
+
     # Register all routers
     for router in all_routers:
         app.include_router(router)
         logger.info(f"✅ Registered router: {router.tags}")
 
+    # Dashboard components and assets
+    mount_static_files(app)
+
     # Exception handlers
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request, exc: HTTPException):
         """Handle HTTP exceptions"""
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "error": exc.detail,
-                "success": False,
-            },
+        if isinstance(exc.detail, str):
+            body = _encode_error_body(exc.detail)
+        else:
+            body = orjson.dumps(
+                {"error": exc.detail, "success": False}, default=str
+            )
+        return Response(
+            content=body, status_code=exc.status_code, media_type="application/json"
         )
 
+    @app.exception_handler(DetailedAPIError)
+    async def detailed_api_error_handler(request, exc: DetailedAPIError):
+        """Render errors raised from an error_boundary"""
+        return exc.to_response()
+
     @app.exception_handler(Exception)
     async def general_exception_handler(request, exc: Exception):
         """Handle general exceptions"""
         logger.error(f"Unhandled exception: {exc}", exc_info=True)
-        return JSONResponse(
+        return Response(
+            content=_INTERNAL_ERROR_BODY,
             status_code=500,
-            content={
-                "error": "Internal server error",
-                "success": False,
-            },
+            media_type="application/json",
         )
 
     logger.info("🚀 FastAPI app created successfully")
@@ -97,8 +129,6 @@ def main():
 
     # Update working directory if provided
     if args.working_dir:
-        import os
-
         settings = get_settings()
         settings.update_working_directory(os.path.abspath(args.working_dir))
         logger.info(f"📁 Using working directory: {settings.WORKING_DIR}")
@@ -113,6 +143,8 @@ def main():
 
     logger.info(f"🚀 Starting FastAPI server on {args.host}:{args.port}")
 
+    # loop/http "auto" pick uvloop and httptools when installed
+    # (uvicorn[standard]) and fall back to asyncio/h11 otherwise
     uvicorn.run(
         "main:app",
         host=args.host,
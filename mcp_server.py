@@ -1974,16 +1974,19 @@ async def list_directory_tool(
 
             if tree_format:
                 # Tree format
+                format_size = data.get("directory_lister", {}).get("format_size", lambda x: f"{x}B")
                 for item in items:
-                    prefix = item.get("tree_prefix", "")
-                    name = item.get("name", "Unknown")
+                    get = item.get
+                    prefix = get("tree_prefix", "")
+                    name = get("name", "Unknown")
                     
-                    if item.get("error"):
-                        output.append(f"{prefix}❌ {name} - {item['error']}")
+                    error = get("error")
+                    if error:
+                        output.append(f"{prefix}❌ {name} - {error}")
                         continue
                     
                     # Format based on type
-                    if item.get("is_directory", False):
+                    if get("is_directory", False):
                         output.append(f"{prefix}📁 {name}/")
                     else:
                         line = f"{prefix}📄 {name}"
@@ -1992,15 +1995,17 @@ async def list_directory_tool(
                             # Add file metadata
                             metadata_parts = []
                             
-                            if item.get("size"):
-                                size_formatted = data.get("directory_lister", {}).get("format_size", lambda x: f"{x}B")(item["size"])
-                                metadata_parts.append(size_formatted)
+                            size = get("size")
+                            if size:
+                                metadata_parts.append(format_size(size))
                             
-                            if item.get("line_count"):
-                                metadata_parts.append(f"{item['line_count']} lines")
+                            line_count = get("line_count")
+                            if line_count:
+                                metadata_parts.append(f"{line_count} lines")
                             
-                            if item.get("file_type"):
-                                metadata_parts.append(item["file_type"])
+                            file_type = get("file_type")
+                            if file_type:
+                                metadata_parts.append(file_type)
                             
                             if metadata_parts:
                                 line += f" ({', '.join(metadata_parts)})"
@@ -2020,11 +2025,14 @@ async def list_directory_tool(
                 if files:
                     output.append("📄 Files:")
                     for item in files:
-                        name = item.get('name', 'Unknown')
-                        if show_metadata and item.get('size'):
-                            size_str = f" ({item['size']} bytes"
-                            if item.get('line_count'):
-                                size_str += f", {item['line_count']} lines"
+                        get = item.get
+                        name = get('name', 'Unknown')
+                        size = get('size')
+                        if show_metadata and size:
+                            size_str = f" ({size} bytes"
+                            line_count = get('line_count')
+                            if line_count:
+                                size_str += f", {line_count} lines"
                             size_str += ")"
                             name += size_str
                         output.append(f"   {name}")
@@ -147,12 +147,12 @@ def get_memory_stats_endpoint(memory_manager: MemoryManager):
 async def update_memory_endpoint(
     memory_manager: MemoryManager, memory_id: int, updates: Dict[str, Any]
 ):
-    """Update existing memory"""
+    """Update existing memory, returning {"found": False} if it does not exist"""
     try:
         updated_memory = await memory_manager.update_memory(memory_id, **updates)
 
         if not updated_memory:
-            raise HTTPException(status_code=404, detail=f"Memory {memory_id} not found")
+            return {"found": False, "success": False}
 
         return {
             "result": {
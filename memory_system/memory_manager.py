@@ -4,8 +4,9 @@ import sqlite3
 import json
 import uuid
 import numpy as np
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 from sentence_transformers import SentenceTransformer
 from enum import Enum
@@ -19,8 +20,18 @@ from .models import (
     ContextSummary,
     MemoryCategory,
     MemoryImportance,
+    MemorySortField,
+    SortOrder,
 )
 
+# ORDER BY fragments for list_memories
+_SORT_COLUMNS = {
+    MemorySortField.TIMESTAMP: "timestamp",
+    MemorySortField.IMPORTANCE: "importance",
+    MemorySortField.CATEGORY: "category",
+}
+_SORT_DIRECTIONS = {SortOrder.ASC: "ASC", SortOrder.DESC: "DESC"}
+
 
 class MemoryManager:
     """Manages Claude's memories with SQLite storage and semantic search"""
@@ -187,6 +198,23 @@ class MemoryManager:
             embedding_vector=embedding_vector,
         )
 
+    def _select_memory(
+        self, conn: sqlite3.Connection, memory_id: int
+    ) -> Optional[Memory]:
+        """Fetch one memory by primary key on an open connection"""
+        row = conn.execute(
+            "SELECT * FROM memories WHERE id = ? LIMIT 1", (memory_id,)
+        ).fetchone()
+        return self._memory_from_row(row) if row else None
+
+    async def get_memory_by_id(self, memory_id: int) -> Optional[Memory]:
+        """Get a single memory by id without going through search"""
+        conn = sqlite3.connect(self.metadata_db)
+        try:
+            return self._select_memory(conn, memory_id)
+        finally:
+            conn.close()
+
     async def store_memory(self, request: MemoryRequest) -> Memory:
         """Store a new memory"""
         if not self.embedding_model:
@@ -225,28 +253,17 @@ class MemoryManager:
         conn.commit()
 
         # Retrieve the created memory
-        cursor = conn.execute(
-            """
-            SELECT * FROM memories WHERE id = ?
-        """,
-            (memory_id,),
-        )
-
-        row = cursor.fetchone()
+        memory = self._select_memory(conn, memory_id)
         conn.close()
 
-        return self._memory_from_row(row)
+        if memory is None:
+            raise RuntimeError(f"Stored memory {memory_id} could not be read back")
+        return memory
 
-    async def search_memories(self, request: MemorySearchRequest) -> List[MemoryResult]:
-        """Search memories using semantic search and filters"""
-        if not self.embedding_model:
-            await self.initialize()
-
-        conn = sqlite3.connect(self.metadata_db)
-
-        # Build SQL query with filters
-        sql_parts = ["SELECT * FROM memories WHERE status = 'active'"]
-        params = []
+    def _build_filters(self, request: MemorySearchRequest) -> Tuple[str, List]:
+        """Build the WHERE clause and parameters for a search request"""
+        sql_parts = ["status = 'active'"]
+        params: List = []
 
         if not request.include_archived:
             sql_parts.append("AND status != 'archived'")
@@ -263,14 +280,60 @@ class MemoryManager:
             sql_parts.append("AND importance >= ?")
             params.append(request.min_importance.value)
 
+        if request.max_importance:
+            sql_parts.append("AND importance <= ?")
+            params.append(request.max_importance.value)
+
         if request.recent_days:
             cutoff_date = datetime.now() - timedelta(days=request.recent_days)
             sql_parts.append("AND timestamp >= ?")
             params.append(cutoff_date.isoformat())
 
+        return " ".join(sql_parts), params
+
+    async def list_memories(
+        self, request: MemorySearchRequest
+    ) -> Tuple[List[Memory], int]:
+        """
+        List memories matching the request filters, sorted and paginated
+
+        Ordering, offset and limit (max_results) are applied by SQLite, and
+        the total number of matches comes from a COUNT(*) on the same filter.
+        """
+        where, params = self._build_filters(request)
+        sort_column = _SORT_COLUMNS[request.sort_by]
+        direction = _SORT_DIRECTIONS[request.sort_order]
+
+        conn = sqlite3.connect(self.metadata_db)
+        try:
+            total_count = conn.execute(
+                f"SELECT COUNT(*) FROM memories WHERE {where}", params
+            ).fetchone()[0]
+            rows = conn.execute(
+                f"""
+                SELECT * FROM memories WHERE {where}
+                ORDER BY {sort_column} {direction}, id {direction}
+                LIMIT ? OFFSET ?
+            """,
+                [*params, request.max_results, request.offset],
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [self._memory_from_row(row) for row in rows], total_count
+
+    async def search_memories(self, request: MemorySearchRequest) -> List[MemoryResult]:
+        """Search memories using semantic search and filters"""
+        if not self.embedding_model:
+            await self.initialize()
+
+        conn = sqlite3.connect(self.metadata_db)
+
+        # Build SQL query with filters
+        where, params = self._build_filters(request)
+
         # Execute base query
-        sql = " ".join(sql_parts)
-        cursor = conn.execute(sql, params)
+        cursor = conn.execute(f"SELECT * FROM memories WHERE {where}", params)
         rows = cursor.fetchall()
         conn.close()
 
@@ -300,7 +363,7 @@ class MemoryManager:
                     )
 
             # Sort by relevance and limit
-            results.sort(key=lambda x: x.relevance_score or 0, reverse=True)
+            results.sort(key=attrgetter("relevance_score"), reverse=True)
             return results[: request.max_results]
 
         # Return without semantic ranking
@@ -384,7 +447,7 @@ class MemoryManager:
 
         params.append(memory_id)
 
-        conn.execute(
+        cursor = conn.execute(
             f"""
             UPDATE memories 
             SET {', '.join(set_parts)}
@@ -395,12 +458,16 @@ class MemoryManager:
 
         conn.commit()
 
+        # The UPDATE already tells us whether the memory exists
+        if cursor.rowcount == 0:
+            conn.close()
+            return None
+
         # Retrieve updated memory
-        cursor = conn.execute("SELECT * FROM memories WHERE id = ?", (memory_id,))
-        row = cursor.fetchone()
+        memory = self._select_memory(conn, memory_id)
         conn.close()
 
-        return self._memory_from_row(row) if row else None
+        return memory
 
     def get_stats(self) -> MemoryStats:
         """Get memory system statistics"""
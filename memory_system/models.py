@@ -29,6 +29,21 @@ class MemoryImportance(int, Enum):
     MINIMAL = 1  # Archive level
 
 
+class MemorySortField(str, Enum):
+    """Fields memory listings can be ordered by"""
+
+    TIMESTAMP = "timestamp"
+    IMPORTANCE = "importance"
+    CATEGORY = "category"
+
+
+class SortOrder(str, Enum):
+    """Listing sort direction"""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
 class Memory(BaseModel):
     """Core memory data model"""
 
@@ -73,11 +88,17 @@ class MemorySearchRequest(BaseModel):
     category: Optional[MemoryCategory] = None
     subcategory: Optional[str] = None
     min_importance: MemoryImportance = MemoryImportance.MINIMAL
-    max_results: int = Field(10, ge=1, le=50)
+    max_importance: Optional[MemoryImportance] = None
+    max_results: int = Field(10, ge=1, le=200)
     include_archived: bool = False
     tags: List[str] = Field(default_factory=list)
     recent_days: Optional[int] = None  # Only recent memories
 
+    # Listing order and pagination (ignored when a query ranks by relevance)
+    sort_by: MemorySortField = MemorySortField.TIMESTAMP
+    sort_order: SortOrder = SortOrder.DESC
+    offset: int = Field(0, ge=0)
+
 
 class MemoryResult(BaseModel):
     """Search result with memory and relevance"""
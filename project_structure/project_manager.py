@@ -5,6 +5,7 @@ Provides detailed project tree with line counts, file sizes, and metadata
 
 import os
 import fnmatch
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -261,7 +262,7 @@ class ProjectStructureManager:
             'total_size': total_size,
             'total_lines': total_lines,
             'project_files': project_files,
-            'top_file_types': sorted(file_types.items(), key=lambda x: x[1], reverse=True)[:10]
+            'top_file_types': sorted(file_types.items(), key=itemgetter(1), reverse=True)[:10]
         }
     
     def get_project_structure(self, max_depth: int = 5, include_hidden: bool = False) -> str:
@@ -9,9 +9,12 @@ from schemas.requests import (
     GitOperationRequest,
     SessionRequest,
     WorkingDirectoryRequest,
+    DirListParams,
+    EnhancedTreeParams,
+    CodeReadParams,
 )
 from schemas.responses import APIResponse
-from schemas.common import LogLevel, SystemLog
+from schemas.common import LogLevel, SystemLog, ContextOperation
 
 __all__ = [
     "WriteRequest",
@@ -20,7 +23,11 @@ __all__ = [
     "GitOperationRequest",
     "SessionRequest",
     "WorkingDirectoryRequest",
+    "DirListParams",
+    "EnhancedTreeParams",
+    "CodeReadParams",
     "APIResponse",
     "LogLevel",
     "SystemLog",
+    "ContextOperation",
 ]
@@ -18,6 +18,14 @@ class LogLevel(str, Enum):
     CRITICAL = "critical"
 
 
+class ContextOperation(str, Enum):
+    """Project context operations"""
+
+    INFO = "info"
+    STRUCTURE = "structure"
+    DEPENDENCIES = "dependencies"
+
+
 class SystemLog(BaseModel):
     """System log entry model"""
 
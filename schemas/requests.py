@@ -3,14 +3,30 @@ Request models for API endpoints
 """
 
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+def _check_line_range(start_line: Optional[int], end_line: Optional[int]) -> None:
+    """Raise ValueError if both bounds are given and end_line < start_line"""
+    if start_line is not None and end_line is not None and end_line < start_line:
+        raise ValueError(
+            f"Invalid line range: end_line ({end_line}) < start_line ({start_line})"
+        )
+
+
+# Largest code payload (in characters) accepted by a single write
+MAX_WRITE_CONTENT_LENGTH = 10 * 1024 * 1024
 
 
 class WriteRequest(BaseModel):
     """Request model for write operations"""
 
     file_path: str = Field(..., description="Path to file to write")
-    content: str = Field(..., description="Code content to write")
+    content: str = Field(
+        ...,
+        description="Code content to write",
+        max_length=MAX_WRITE_CONTENT_LENGTH,
+    )
     purpose: Optional[str] = Field(None, description="Purpose/description of the code")
     language: Optional[str] = Field(
         None, description="Programming language (python, javascript, typescript)"
@@ -45,13 +61,22 @@ class FileRequest(BaseModel):
     operation: str = Field(..., description="File operation")
     file_path: str = Field(..., description="Path to file")
     content: Optional[str] = Field(None, description="File content")
-    start_line: Optional[int] = Field(None, description="Start line number")
-    end_line: Optional[int] = Field(None, description="End line number")
+    start_line: Optional[int] = Field(None, description="Start line number", ge=1)
+    end_line: Optional[int] = Field(None, description="End line number", ge=1)
+
+    @model_validator(mode="after")
+    def check_line_range(self) -> "FileRequest":
+        """Reject ranges that end before they start"""
+        _check_line_range(self.start_line, self.end_line)
+        return self
 
 
 class GitOperationRequest(BaseModel):
     """Request model for git operations"""
 
+    # Parsed once by FastAPI and never re-validated; unknown keys are dropped
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     operation: str = Field(
         ...,
         description="Git operation (status, branches, log, diff, commit, add, blame)",
@@ -72,6 +97,9 @@ class GitOperationRequest(BaseModel):
 class SessionRequest(BaseModel):
     """Request model for session operations"""
 
+    # Parsed once by FastAPI and never re-validated; unknown keys are dropped
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     operation: str = Field(
         ..., description="Session operation (start, end, switch, list, merge, delete)"
     )
@@ -86,3 +114,62 @@ class WorkingDirectoryRequest(BaseModel):
     """Request model for working directory changes"""
 
     working_directory: str = Field(..., description="New working directory path")
+
+
+class DirListParams(BaseModel):
+    """Query parameters for directory listing"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    directory_path: str = Field(
+        ".", description="Directory path relative to working directory"
+    )
+    max_depth: int = Field(2, description="Maximum depth to traverse", ge=0, le=10)
+    include_hidden: bool = Field(
+        False, description="Include hidden files and directories"
+    )
+    show_metadata: bool = Field(
+        True, description="Include file metadata (size, lines, etc.)"
+    )
+    respect_gitignore: bool = Field(
+        True, description="Filter based on .gitignore patterns"
+    )
+    files_only: bool = Field(False, description="Show only files, not directories")
+    dirs_only: bool = Field(False, description="Show only directories, not files")
+
+
+class EnhancedTreeParams(BaseModel):
+    """Query parameters for the enhanced directory tree"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_depth: int = Field(3, description="Maximum depth", ge=1, le=10)
+    include_hidden: bool = Field(False, description="Include hidden files")
+    show_sizes: bool = Field(True, description="Show file sizes")
+    show_git_status: bool = Field(True, description="Show git status indicators")
+    stream: bool = Field(
+        False, description="Stream the tree as NDJSON, one line per item"
+    )
+
+
+class CodeReadParams(BaseModel):
+    """Query parameters for reading code by symbol or line range"""
+
+    file_path: str = Field(..., description="Path to the file")
+    symbol_name: Optional[str] = Field(None, description="Symbol name to read")
+    occurrence: int = Field(
+        1, description="Which occurrence of the symbol (default: 1)", ge=1
+    )
+    start_line: Optional[int] = Field(
+        None, description="Start line number (1-indexed)", ge=1
+    )
+    end_line: Optional[int] = Field(
+        None, description="End line number (inclusive)", ge=1
+    )
+    with_line_numbers: bool = Field(True, description="Include line numbers in output")
+
+    @model_validator(mode="after")
+    def check_line_range(self) -> "CodeReadParams":
+        """Reject ranges that end before they start"""
+        _check_line_range(self.start_line, self.end_line)
+        return self
@@ -169,19 +169,25 @@ class SemanticSearchEngine:
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 content = f.read()
 
-            # Calculate file hash for change detection
-            file_hash = self.enhanced_search.calculate_sha1(file_path)
+            # Calculate file hash for change detection; with a chunker it
+            # runs alongside parsing, both in worker threads
+            hashing = asyncio.to_thread(
+                self.enhanced_search.calculate_sha1, file_path
+            )
 
             # Find appropriate chunker
             for chunker in self.chunkers:
                 if chunker.can_handle(file_path):
-                    chunks = await chunker.chunk_file(file_path, content)
+                    chunks, file_hash = await asyncio.gather(
+                        chunker.chunk_file(file_path, content), hashing
+                    )
                     # Add file hash to chunks
                     for chunk in chunks:
                         chunk.file_hash = file_hash
                     return chunks
 
             # No specific chunker found, create basic chunk
+            file_hash = await hashing
             return [
                 ChunkData(
                     chunk_id=f"{file_path}:1",
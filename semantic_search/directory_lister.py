@@ -3,97 +3,209 @@ Directory listing functionality with depth control and metadata
 """
 
 import os
+import re
+import time
+import hashlib
 import fnmatch
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, NamedTuple, Optional, Tuple, Union
 from datetime import datetime
 
+import orjson
+
+
+# Listing cache bounds: entries are keyed on the full option tuple plus the
+# target directory's mtime, and expire after a short TTL so nested changes
+# (which do not bump the top-level mtime) are picked up quickly.
+LISTING_CACHE_SIZE = 256
+LISTING_CACHE_TTL = 5.0
+
+# Subdirectories are read ahead on a small pool so scandir latency (network
+# filesystems, cold caches) overlaps; tiny fan-outs are scanned inline.
+SCAN_WORKERS = 16
+PARALLEL_SCAN_MIN_DIRS = 2
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
+
+class GitignoreMatcher:
+    """
+    gitignore patterns precompiled for DirectoryLister.should_ignore
+
+    Applies the lister's matching rules with one combined regex per rule
+    instead of an fnmatch call per pattern:
+    - "dir/" patterns match by path prefix or glob against "path/"
+    - other patterns glob against the relative path or the entry name
+    - slash-free patterns also match any literal path component
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        dir_patterns = [p for p in patterns if p.endswith('/')]
+        file_patterns = [p for p in patterns if not p.endswith('/')]
+        self._dir_prefixes = tuple(p.rstrip('/') for p in dir_patterns)
+        self._dir_regex = self._compile(dir_patterns)
+        self._file_regex = self._compile(file_patterns)
+        self._component_names = frozenset(p for p in file_patterns if '/' not in p)
+
+    @staticmethod
+    def _compile(patterns: List[str]) -> Optional["re.Pattern[str]"]:
+        if not patterns:
+            return None
+        return re.compile('|'.join(
+            fnmatch.translate(os.path.normcase(p)) for p in patterns
+        ))
+
+    def matches(self, rel_str: str, name: str) -> bool:
+        """Check a '/'-separated path relative to the working dir"""
+        if self._dir_prefixes and rel_str.startswith(self._dir_prefixes):
+            return True
+        if self._dir_regex and self._dir_regex.match(os.path.normcase(rel_str + '/')):
+            return True
+        if self._file_regex and (
+            self._file_regex.match(os.path.normcase(rel_str))
+            or self._file_regex.match(os.path.normcase(name))
+        ):
+            return True
+        if self._component_names and not self._component_names.isdisjoint(rel_str.split('/')):
+            return True
+        return False
+
+
+_EMPTY_GITIGNORE = GitignoreMatcher(())
+
+
+@lru_cache(maxsize=32)
+def _compile_gitignore(gitignore_path: str, mtime_ns: int) -> Tuple[Tuple[str, ...], GitignoreMatcher]:
+    """Read and compile a .gitignore; cached per (path, mtime) so edits are picked up"""
+    patterns = []
+    try:
+        with open(gitignore_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    patterns.append(line)
+    except Exception:
+        pass
+    return tuple(patterns), GitignoreMatcher(patterns)
+
+
+class DirItem(NamedTuple):
+    """Render view of a listing item with the fields the tree formatters use"""
+    name: str
+    path: str
+    is_directory: bool
+    size: Optional[int]
+    line_count: int
+    tree_prefix: str
+    file_count: int
+
 
 class DirectoryLister:
     """Directory listing with gitignore support and metadata"""
     
     def __init__(self, working_dir: str):
         self.working_dir = Path(working_dir)
-        self._gitignore_patterns = None
+        self._listing_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any], str]]" = OrderedDict()
+        self._listing_cache_lock = threading.Lock()
+        self._listing_key_locks: Dict[Tuple, threading.Lock] = {}
+        self._scan_executor = ThreadPoolExecutor(
+            max_workers=SCAN_WORKERS, thread_name_prefix="dirscan"
+        )
     
     def load_gitignore_patterns(self) -> List[str]:
         """Load gitignore patterns from .gitignore file"""
-        if self._gitignore_patterns is not None:
-            return self._gitignore_patterns
-            
+        patterns, _ = self._load_gitignore()
+        return list(patterns)
+
+    def load_gitignore_matcher(self) -> "GitignoreMatcher":
+        """Load the compiled matcher for the .gitignore file"""
+        _, matcher = self._load_gitignore()
+        return matcher
+
+    def _load_gitignore(self) -> Tuple[Tuple[str, ...], "GitignoreMatcher"]:
+        """Patterns and compiled matcher, refreshed when .gitignore changes"""
         gitignore_path = self.working_dir / '.gitignore'
-        patterns = []
-        
-        if gitignore_path.exists():
-            try:
-                with open(gitignore_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            patterns.append(line)
-            except Exception:
-                pass
-        
-        self._gitignore_patterns = patterns
-        return patterns
+        try:
+            mtime_ns = os.stat(gitignore_path).st_mtime_ns
+        except OSError:
+            return (), _EMPTY_GITIGNORE
+        return _compile_gitignore(str(gitignore_path), mtime_ns)
     
-    def should_ignore(self, path: Path, gitignore_patterns: List[str] = []) -> bool:
+    def should_ignore(
+        self,
+        path: Path,
+        gitignore_patterns: Union[List[str], "GitignoreMatcher", None] = None,
+        entry: Optional[os.DirEntry] = None,
+    ) -> bool:
         """Check if path should be ignored based on gitignore patterns"""
         if gitignore_patterns is None:
-            gitignore_patterns = self.load_gitignore_patterns()
+            matcher = self.load_gitignore_matcher()
+        elif isinstance(gitignore_patterns, GitignoreMatcher):
+            matcher = gitignore_patterns
+        else:
+            matcher = GitignoreMatcher(gitignore_patterns)
         
         # Default ignore patterns
         ignore_dirs = {'.git', '__pycache__', 'node_modules', '.venv', 'venv', 'dist', 'build', '.pytest_cache'}
         ignore_files = {'.DS_Store', '.env', 'Thumbs.db', '.pyc'}
         
         # Check if it's a default ignored directory
-        if path.is_dir() and path.name in ignore_dirs:
+        if path.name in ignore_dirs and (entry.is_dir() if entry is not None else path.is_dir()):
             return True
         
         # Check if it's a default ignored file
-        if path.is_file() and (path.name in ignore_files or path.suffix == '.pyc'):
+        if (path.name in ignore_files or path.suffix == '.pyc') and (
+            entry.is_file() if entry is not None else path.is_file()
+        ):
             return True
         
         # Check gitignore patterns
         try:
             rel_path = path.relative_to(self.working_dir)
             rel_str = str(rel_path).replace(os.sep, '/')
-            
-            for pattern in gitignore_patterns:
-                # Handle directory patterns
-                if pattern.endswith('/'):
-                    if rel_str.startswith(pattern.rstrip('/')) or fnmatch.fnmatch(rel_str + '/', pattern):
-                        return True
-                # Handle file patterns
-                elif fnmatch.fnmatch(rel_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                    return True
-                # Handle parent directory matches
-                elif '/' not in pattern and pattern in rel_str.split('/'):
-                    return True
+            return matcher.matches(rel_str, path.name)
         except ValueError:
             # Path is not relative to working directory
             pass
         
         return False
     
-    def get_file_metadata(self, path: Path) -> Dict[str, Any]:
-        """Get metadata for a file or directory"""
+    def get_file_metadata(
+        self, path: Path, entry: Optional[os.DirEntry] = None
+    ) -> Dict[str, Any]:
+        """
+        Get metadata for a file or directory
+
+        When the scandir entry for path is passed, its cached type and stat
+        information are used instead of fresh stat calls.
+        """
         try:
-            stat = path.stat()
+            if entry is not None:
+                stat = entry.stat()
+                is_dir = entry.is_dir()
+                is_file = entry.is_file()
+            else:
+                stat = path.stat()
+                is_dir = path.is_dir()
+                is_file = path.is_file()
             metadata = {
                 'name': path.name,
                 'path': str(path.relative_to(self.working_dir)),
-                'is_directory': path.is_dir(),
-                'size': stat.st_size if path.is_file() else 0,
+                'is_directory': is_dir,
+                'size': stat.st_size if is_file else 0,
                 'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 'permissions': oct(stat.st_mode)[-3:],
             }
             
             # Add line count for code files
-            if path.is_file() and self.is_code_file(path):
+            if is_file and self.is_code_file(path):
                 metadata['line_count'] = self.count_lines(path)
                 metadata['file_type'] = 'code'
-            elif path.is_file():
+            elif is_file:
                 metadata['file_type'] = 'text' if self.is_text_file(path) else 'binary'
             else:
                 metadata['file_type'] = 'directory'
@@ -101,13 +213,14 @@ class DirectoryLister:
             return metadata
         
         except (OSError, PermissionError):
+            is_dir = entry.is_dir() if entry is not None else path.is_dir()
             return {
                 'name': path.name,
                 'path': str(path.relative_to(self.working_dir)),
-                'is_directory': path.is_dir(),
+                'is_directory': is_dir,
                 'size': 0,
                 'error': 'Permission denied or file not accessible',
-                'file_type': 'directory' if path.is_dir() else 'unknown'
+                'file_type': 'directory' if is_dir else 'unknown'
             }
     
     def is_code_file(self, path: Path) -> bool:
@@ -164,19 +277,171 @@ class DirectoryLister:
         if size_bytes == 0:
             return "0 B"
         
-        units = ['B', 'KB', 'MB', 'GB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        
+        # Each unit is 10 bits wide, so bit_length picks it without a loop
+        unit_index = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
         if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.1f} {units[unit_index]}"
+            return f"{size_bytes} B"
+        return f"{size_bytes / (1 << (10 * unit_index)):.1f} {SIZE_UNITS[unit_index]}"
     
+    def _scan_directory(self, directory: Path) -> List[Tuple[Path, os.DirEntry]]:
+        """
+        Read one directory, returning (path, scandir entry) pairs in tree order
+
+        The entries cache their type and stat results, so the filters and
+        metadata below reuse them rather than issuing new stat calls.
+        """
+        with os.scandir(directory) as it:
+            entries = [(Path(entry.path), entry) for entry in it]
+        entries.sort(key=lambda e: (not e[1].is_dir(), e[1].name.lower()))
+        return entries
+
+    @staticmethod
+    def as_dir_items(items: List[Dict[str, Any]]) -> List[DirItem]:
+        """Convert listing item dicts to DirItem tuples for attribute access"""
+        return [
+            DirItem(
+                name=item['name'],
+                path=item.get('path', item['name']),
+                is_directory=item.get('is_directory', False),
+                size=item.get('size'),
+                line_count=item.get('line_count', 0),
+                tree_prefix=item.get('tree_prefix', ''),
+                file_count=item.get('file_count', 0),
+            )
+            for item in items
+        ]
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached directory listings (call after writing to the tree)"""
+        with self._listing_cache_lock:
+            self._listing_cache.clear()
+
+    def _get_cached_listing(self, key: Tuple) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return (listing, fingerprint) for key if present and not expired"""
+        with self._listing_cache_lock:
+            entry = self._listing_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result, fingerprint = entry
+            if time.monotonic() - stored_at > LISTING_CACHE_TTL:
+                del self._listing_cache[key]
+                return None
+            self._listing_cache.move_to_end(key)
+            return result, fingerprint
+
+    def _store_cached_listing(self, key: Tuple, result: Dict[str, Any]) -> None:
+        """Store a listing with its content fingerprint, evicting LRU entries"""
+        fingerprint = hashlib.blake2b(
+            orjson.dumps(result, default=str), digest_size=16
+        ).hexdigest()
+        with self._listing_cache_lock:
+            self._listing_cache[key] = (time.monotonic(), result, fingerprint)
+            self._listing_cache.move_to_end(key)
+            while len(self._listing_cache) > LISTING_CACHE_SIZE:
+                self._listing_cache.popitem(last=False)
+
+    def _listing_cache_key(
+        self,
+        directory_path: str,
+        max_depth: int,
+        include_hidden: bool,
+        show_metadata: bool,
+        respect_gitignore: bool,
+        files_only: bool,
+        dirs_only: bool,
+    ) -> Optional[Tuple]:
+        """Build the cache key for a listing, or None if the target can't be stat'ed"""
+        target_dir = self.working_dir if directory_path == "." else self.working_dir / directory_path
+        try:
+            mtime_ns = os.stat(target_dir).st_mtime_ns
+        except OSError:
+            return None
+        return (
+            str(target_dir), max_depth, include_hidden, show_metadata,
+            respect_gitignore, files_only, dirs_only, mtime_ns,
+        )
+
+    def cached_listing_fingerprint(
+        self,
+        directory_path: str = ".",
+        max_depth: int = 2,
+        include_hidden: bool = False,
+        show_metadata: bool = True,
+        respect_gitignore: bool = True,
+        files_only: bool = False,
+        dirs_only: bool = False
+    ) -> Optional[str]:
+        """
+        Content fingerprint of a fresh cached listing, without walking
+
+        Returns None when the listing is not cached (or has expired). The
+        fingerprint hashes the listing itself, so a re-walk of an unchanged
+        tree yields the same value.
+        """
+        key = self._listing_cache_key(
+            directory_path, max_depth, include_hidden, show_metadata,
+            respect_gitignore, files_only, dirs_only,
+        )
+        if key is None:
+            return None
+        entry = self._get_cached_listing(key)
+        return entry[1] if entry is not None else None
+
+    def list_directory_cached(
+        self,
+        directory_path: str = ".",
+        max_depth: int = 2,
+        include_hidden: bool = False,
+        show_metadata: bool = True,
+        respect_gitignore: bool = True,
+        files_only: bool = False,
+        dirs_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Cached variant of list_directory
+
+        Results are keyed on all listing options plus the target directory's
+        st_mtime_ns, so a changed top-level directory always misses. Concurrent
+        callers for the same key wait for a single walk instead of each walking
+        the tree. The returned dict is a shallow copy; treat items as read-only.
+        """
+        options = dict(
+            directory_path=directory_path,
+            max_depth=max_depth,
+            include_hidden=include_hidden,
+            show_metadata=show_metadata,
+            respect_gitignore=respect_gitignore,
+            files_only=files_only,
+            dirs_only=dirs_only,
+        )
+        key = self._listing_cache_key(**options)
+        if key is None:
+            # Let list_directory produce the usual error payload
+            return self.list_directory(**options)
+
+        entry = self._get_cached_listing(key)
+        if entry is not None:
+            return dict(entry[0])
+
+        with self._listing_cache_lock:
+            key_lock = self._listing_key_locks.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                entry = self._get_cached_listing(key)
+                if entry is not None:
+                    result = entry[0]
+                else:
+                    result = self.list_directory(**options)
+                    if "error" in result:
+                        return result
+                    self._store_cached_listing(key, result)
+        finally:
+            with self._listing_cache_lock:
+                self._listing_key_locks.pop(key, None)
+
+        return dict(result)
+
     def list_directory(
         self, 
         directory_path: str = ".",
@@ -211,7 +476,7 @@ class DirectoryLister:
                     return {"error": f"Path is not a directory: {directory_path}"}
             
             # Load gitignore patterns if needed
-            gitignore_patterns = self.load_gitignore_patterns() if respect_gitignore else []
+            gitignore_patterns = self.load_gitignore_matcher() if respect_gitignore else None
             
             # Collect directory contents
             items = []
@@ -219,35 +484,56 @@ class DirectoryLister:
             total_dirs = 0
             total_size = 0
             
-            def collect_items(current_dir: Path, current_depth: int, prefix: str = ""):
+            def collect_items(
+                current_dir: Path,
+                current_depth: int,
+                prefix: str = "",
+                pending: Optional[Future] = None,
+            ):
                 nonlocal total_files, total_dirs, total_size
                 
                 if current_depth > max_depth:
                     return
                 
                 try:
-                    entries = list(current_dir.iterdir())
-                    entries.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
+                    entries = pending.result() if pending is not None else self._scan_directory(current_dir)
                     
-                    for i, entry in enumerate(entries):
+                    visible = []
+                    for i, (entry, dir_entry) in enumerate(entries):
                         # Skip hidden files if not requested
                         if not include_hidden and entry.name.startswith('.'):
                             continue
                         
                         # Skip ignored files/dirs if respecting gitignore
-                        if respect_gitignore and self.should_ignore(entry, gitignore_patterns):
+                        if respect_gitignore and self.should_ignore(entry, gitignore_patterns, dir_entry):
                             continue
                         
+                        is_dir = dir_entry.is_dir()
+                        
                         # Apply file/dir only filters
-                        if files_only and entry.is_dir():
+                        if files_only and is_dir:
                             continue
-                        if dirs_only and entry.is_file():
+                        if dirs_only and not is_dir:
                             continue
                         
+                        visible.append((i, entry, dir_entry, is_dir))
+                    
+                    # Read ahead the subdirectories we will recurse into; the
+                    # walk below still consumes them in tree order
+                    prefetched = {}
+                    if current_depth < max_depth:
+                        child_dirs = [entry for _, entry, _, is_dir in visible if is_dir]
+                        if len(child_dirs) >= PARALLEL_SCAN_MIN_DIRS:
+                            prefetched = {
+                                child: self._scan_executor.submit(self._scan_directory, child)
+                                for child in child_dirs
+                            }
+                    
+                    for i, entry, dir_entry, is_dir in visible:
                         # Get metadata
-                        metadata = self.get_file_metadata(entry) if show_metadata else {
+                        metadata = self.get_file_metadata(entry, dir_entry) if show_metadata else {
                             'name': entry.name,
-                            'is_directory': entry.is_dir()
+                            'is_directory': is_dir
                         }
                         
                         # Add tree structure indicators
@@ -265,16 +551,16 @@ class DirectoryLister:
                         items.append(metadata)
                         
                         # Update counters
-                        if entry.is_file():
+                        if not is_dir:
                             total_files += 1
                             total_size += metadata.get('size', 0)
                         else:
                             total_dirs += 1
                         
                         # Recurse into subdirectories
-                        if entry.is_dir() and current_depth < max_depth:
+                        if is_dir and current_depth < max_depth:
                             next_prefix = prefix + ("    " if is_last else "│   ")
-                            collect_items(entry, current_depth + 1, next_prefix)
+                            collect_items(entry, current_depth + 1, next_prefix, prefetched.get(entry))
                 
                 except PermissionError:
                     items.append({
@@ -5,13 +5,22 @@ Integrates with existing semantic search system
 
 import re
 import os
+import io
 import fnmatch
-import hashlib
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from .file_hash import file_sha1
 from .models import SearchRequest, SearchResult
 
 
+@lru_cache(maxsize=256)
+def compile_search_pattern(pattern: str, case_sensitive: bool) -> "re.Pattern[str]":
+    """Compile a text-search regex once; invalid patterns raise re.error"""
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+
 class SymbolMatcher:
     """Symbol pattern matching and detection"""
     
@@ -136,7 +145,7 @@ class TextSearcher:
         # Compile search pattern
         if use_regex:
             try:
-                search_pattern = re.compile(query, 0 if case_sensitive else re.IGNORECASE)
+                search_pattern = compile_search_pattern(query, case_sensitive)
             except re.error:
                 return []  # Invalid regex
         else:
@@ -159,7 +168,15 @@ class TextSearcher:
                 
                 try:
                     with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        lines = f.readlines()
+                        text = f.read()
+                    
+                    # Plain-text queries can rule out a whole file at once
+                    if not use_regex and search_query not in (
+                        text if case_sensitive else text.lower()
+                    ):
+                        continue
+                    
+                    lines = io.StringIO(text).readlines()
                     
                     for line_num, line in enumerate(lines, 1):
                         found = False
@@ -282,7 +299,7 @@ class FuzzySymbolSearch:
             ))
         
         # Sort by relevance score
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
+        results.sort(key=attrgetter("relevance_score"), reverse=True)
         
         return results[:max_results]
 
@@ -298,11 +315,7 @@ class EnhancedSearchManager:
     
     def calculate_sha1(self, file_path: str) -> str:
         """Calculate SHA1 hash of file"""
-        try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha1(f.read()).hexdigest()
-        except Exception:
-            return ""
+        return file_sha1(file_path)
     
     def list_symbols_in_file(self, file_path: str) -> List[Dict[str, Any]]:
         """List all symbols in a specific file"""
@@ -373,6 +386,7 @@ class EnhancedSearchManager:
                     docstring=None,
                     relevance_score=1.0,
                     chunk_type='text_match',
+                    content=result['content'],
                 ))
             
             return results
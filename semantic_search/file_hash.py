@@ -0,0 +1,61 @@
+"""Content hashes used for index change detection"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+
+# Most recently hashed files, keyed by path and validated against their stat
+FILE_HASH_CACHE_SIZE = 4096
+
+_file_hashes: "OrderedDict[str, Tuple[Tuple[int, int, int], str]]" = OrderedDict()
+# Hashing runs in worker threads during indexing
+_file_hashes_lock = threading.Lock()
+
+
+def clear_file_hashes() -> None:
+    """Forget every cached file hash"""
+    with _file_hashes_lock:
+        _file_hashes.clear()
+
+
+def _sha1_digest(file_path: str) -> str:
+    """Stream a file through SHA1"""
+    # hashlib.file_digest reads through a fixed-size buffer and hashes
+    # without holding the GIL, so large files are never read whole
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
+def file_sha1(file_path: str) -> str:
+    """
+    SHA1 hex digest of a file's content, or "" if it cannot be read
+
+    Digests are reused while the file's mtime, size and inode are
+    unchanged, so re-indexing an untouched tree costs one stat per file.
+    SHA1 is kept because stored index hashes are compared against it.
+    """
+    try:
+        st = os.stat(file_path)
+        stat_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        with _file_hashes_lock:
+            entry = _file_hashes.get(file_path)
+            if entry is not None and entry[0] == stat_key:
+                _file_hashes.move_to_end(file_path)
+                return entry[1]
+
+        digest = _sha1_digest(file_path)
+    except Exception:
+        with _file_hashes_lock:
+            _file_hashes.pop(file_path, None)
+        return ""
+
+    with _file_hashes_lock:
+        _file_hashes[file_path] = (stat_key, digest)
+        _file_hashes.move_to_end(file_path)
+        while len(_file_hashes) > FILE_HASH_CACHE_SIZE:
+            _file_hashes.popitem(last=False)
+    return digest
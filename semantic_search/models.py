@@ -40,6 +40,7 @@ class SearchResult(BaseModel):
     docstring: Optional[str] = None
     relevance_score: float
     chunk_type: str
+    content: Optional[str] = None  # Matched line for text search
 
 
 class SymbolInfo(BaseModel):
@@ -0,0 +1,168 @@
+"""
+Tree rendering for directory listings
+
+Turns DirItem rows into the text trees served by the /directory endpoints.
+The module only depends on the standard library and DirItem and is fully
+annotated, so it can be compiled ahead of time with mypyc
+(``mypyc semantic_search/tree_renderer.py``); the compiled extension is
+picked up by the normal import and the pure-Python version remains the
+fallback.
+"""
+
+import os
+import posixpath
+from typing import Callable, Dict, Final, List, Set, Tuple
+
+from .directory_lister import DirItem
+
+
+# File-type icons for the enhanced tree, keyed by lowercased extension
+TYPE_INDICATORS: Final[Dict[str, str]] = {
+    ".py": "🐍",
+    ".js": "🟨",
+    ".ts": "🔷",
+    ".html": "🌐",
+    ".css": "🎨",
+    ".json": "📋",
+    ".md": "📝",
+    ".txt": "📄",
+    ".yml": "⚙️",
+    ".yaml": "⚙️",
+}
+DEFAULT_ICON: Final[str] = "📄"
+
+# (unit, shift) pairs for compact sizes; each unit is 10 bits wider
+COMPACT_UNITS: Final[Tuple[Tuple[str, int], ...]] = (
+    ("B", 0),
+    ("KB", 10),
+    ("MB", 20),
+    ("GB", 30),
+)
+
+# Pre-encoded line endings for the byte-rendered plain tree
+_DIRECTORY_SUFFIX: Final[bytes] = b"/  # directory"
+_FILE_SUFFIX: Final[bytes] = b"  # file"
+
+
+def format_compact_size(size: int) -> str:
+    """Format a size as whole B/KB/MB/GB for the enhanced tree"""
+    # Sizes strictly above 1024**n use unit n; (size - 1) keeps exact powers
+    # of 1024 in the smaller unit
+    unit, shift = COMPACT_UNITS[
+        min(max((size - 1).bit_length() - 1, 0) // 10, len(COMPACT_UNITS) - 1)
+    ]
+    return f"{size >> shift}{unit}"
+
+
+def dirty_directories(git_status: Dict[str, str]) -> Set[str]:
+    """
+    Collect every directory that contains a changed path
+
+    Built once per request so marking directories is a set lookup rather
+    than a prefix scan over all changed files. Untracked directories are
+    reported by git with a trailing slash and count as dirty themselves.
+    """
+    dirty: Set[str] = set()
+    for file_path in git_status:
+        if file_path.endswith("/"):
+            parent = file_path.rstrip("/")
+        else:
+            parent = posixpath.dirname(file_path)
+        while parent and parent not in dirty:
+            dirty.add(parent)
+            parent = posixpath.dirname(parent)
+    return dirty
+
+
+def render_enhanced_line(
+    item: DirItem,
+    git_status: Dict[str, str],
+    dirty_dirs: Set[str],
+    show_sizes: bool,
+    show_git_status: bool,
+) -> str:
+    """Render one enhanced tree line with icon, git indicator and size"""
+    prefix: str = item.tree_prefix
+    name: str = item.name
+
+    git_indicator = ""
+    if show_git_status:
+        status = git_status.get(item.path, "")
+        if not status and item.is_directory and item.path in dirty_dirs:
+            status = "*"
+        if status:
+            git_indicator = f"[{status}] "
+
+    if item.is_directory:
+        count_info = f" ({item.file_count} items)" if item.file_count else ""
+        return f"{prefix}📁 {git_indicator}{name}/{count_info}"
+
+    size_info = ""
+    if show_sizes and item.size is not None:
+        size_info = f" [{format_compact_size(item.size)}]"
+
+        if item.line_count:
+            size_info += f" ({item.line_count} lines)"
+
+    ext = os.path.splitext(name)[1].lower()
+    icon = TYPE_INDICATORS.get(ext, DEFAULT_ICON)
+    return f"{prefix}{icon} {git_indicator}{name}{size_info}"
+
+
+def render_enhanced(
+    dir_items: List[DirItem],
+    git_status: Dict[str, str],
+    dirty_dirs: Set[str],
+    show_sizes: bool,
+    show_git_status: bool,
+) -> str:
+    """Render the full enhanced tree"""
+    return "\n".join(
+        [
+            render_enhanced_line(
+                item, git_status, dirty_dirs, show_sizes, show_git_status
+            )
+            for item in dir_items
+        ]
+    )
+
+
+def render_tree(dir_items: List[DirItem], format_size: Callable[[int], str]) -> str:
+    """Render the plain annotated tree, formatting sizes with format_size"""
+    tree_lines: List[str] = []
+    append = tree_lines.append
+    for item in dir_items:
+        if item.is_directory:
+            append(f"{item.tree_prefix}{item.name}/  # directory")
+        else:
+            size_info = f" [{format_size(item.size)}]" if item.size else ""
+            line_info = f" ({item.line_count} lines)" if item.line_count else ""
+            append(f"{item.tree_prefix}{item.name}{size_info}{line_info}  # file")
+    return "\n".join(tree_lines)
+
+
+def render_tree_bytes(
+    dir_items: List[DirItem], format_size: Callable[[int], str]
+) -> bytes:
+    """
+    Render the plain annotated tree straight to UTF-8 bytes
+
+    Same output as render_tree(...).encode(), but written into a single
+    buffer so no per-line strings or joined copy are kept around.
+    """
+    buf = bytearray()
+    write = buf.extend
+    for i, item in enumerate(dir_items):
+        if i:
+            write(b"\n")
+        write(item.tree_prefix.encode())
+        write(item.name.encode())
+        if item.is_directory:
+            write(_DIRECTORY_SUFFIX)
+            continue
+        if item.size:
+            write(f" [{format_size(item.size)}]".encode())
+        if item.line_count:
+            write(f" ({item.line_count} lines)".encode())
+        write(_FILE_SUFFIX)
+    return bytes(buf)
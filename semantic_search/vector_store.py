@@ -2,10 +2,10 @@
 
 import sqlite3
 import numpy as np
-import hashlib
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 import faiss
+from .file_hash import file_sha1
 from .models import ChunkData, SearchResult
 
 
@@ -85,11 +85,7 @@ class VectorStore:
 
     def calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA1 hash of file content"""
-        try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha1(f.read()).hexdigest()
-        except Exception:
-            return ""
+        return file_sha1(file_path)
 
     def has_file_changed(self, file_path: str) -> bool:
         """Check if file has changed since last indexing"""
@@ -0,0 +1,109 @@
+"""Tests for the scope-based Python chunker"""
+
+import asyncio
+import json
+import textwrap
+
+import semantic_search  # noqa: F401  (must be imported before chunkers)
+from chunkers import PythonChunker
+
+
+def _chunk(source: str):
+    source = textwrap.dedent(source)
+    return asyncio.run(PythonChunker().chunk_file("module.py", source))
+
+
+def _symbols(chunks, chunk_type: str):
+    return [chunk.symbol_name for chunk in chunks if chunk.chunk_type == chunk_type]
+
+
+def test_stub_class_without_string_docstring():
+    chunks = _chunk(
+        """
+        from typing import TYPE_CHECKING
+
+        if TYPE_CHECKING:
+            class Proto: ...
+        """
+    )
+
+    (proto,) = [chunk for chunk in chunks if chunk.symbol_name == "Proto"]
+    assert json.loads(proto.content)["docstring"] is None
+
+
+def test_stub_function_without_string_docstring():
+    chunks = _chunk(
+        """
+        def stub(): ...
+        """
+    )
+
+    (stub,) = [chunk for chunk in chunks if chunk.symbol_name == "stub"]
+    assert stub.docstring == "None"
+
+
+def test_classes_under_blocks_get_chunks():
+    chunks = _chunk(
+        """
+        import sys
+
+        if sys.platform == "win32":
+            class WindowsOnly:
+                pass
+        else:
+            class Posix:
+                pass
+
+        try:
+            import fast
+        except ImportError:
+            class Fallback:
+                def run(self):
+                    pass
+        """
+    )
+
+    assert _symbols(chunks, "class") == ["WindowsOnly", "Posix", "Fallback"]
+    assert _symbols(chunks, "function") == ["run"]
+
+
+def test_definitions_under_with_blocks_get_chunks():
+    chunks = _chunk(
+        """
+        with open(__file__) as f:
+            def read():
+                pass
+        """
+    )
+
+    assert _symbols(chunks, "function") == ["read"]
+
+
+def test_nested_functions_are_not_chunked():
+    chunks = _chunk(
+        """
+        def outer():
+            def inner():
+                pass
+            return inner
+        """
+    )
+
+    assert _symbols(chunks, "function") == ["outer"]
+
+
+def test_methods_of_nested_classes_are_not_chunked():
+    chunks = _chunk(
+        """
+        class Outer:
+            class Config:
+                def nested_method(self):
+                    pass
+
+            def method(self):
+                pass
+        """
+    )
+
+    assert _symbols(chunks, "class") == ["Outer"]
+    assert _symbols(chunks, "function") == ["method"]
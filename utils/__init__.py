@@ -2,14 +2,44 @@
 Utility functions for API operations
 """
 
-from utils.validation import validate_file_path
-from utils.responses import create_success_response, create_error_response
-from utils.errors import create_detailed_error_response, add_system_log
+from utils.validation import (
+    validate_file_path,
+    clear_validated_paths,
+    invalidate_directory_probes,
+    probe_directory,
+    DirectoryProbe,
+)
+from utils.responses import (
+    ORJSONResponse,
+    create_success_response,
+    create_orjson_success_response,
+    create_error_response,
+    etag_matches,
+    create_not_modified_response,
+    accepts_text,
+)
+from utils.errors import (
+    DetailedAPIError,
+    create_detailed_error_response,
+    error_boundary,
+    add_system_log,
+)
 
 __all__ = [
     "validate_file_path",
+    "clear_validated_paths",
+    "invalidate_directory_probes",
+    "probe_directory",
+    "DirectoryProbe",
+    "ORJSONResponse",
     "create_success_response",
+    "create_orjson_success_response",
     "create_error_response",
+    "etag_matches",
+    "create_not_modified_response",
+    "accepts_text",
+    "DetailedAPIError",
     "create_detailed_error_response",
+    "error_boundary",
     "add_system_log",
 ]
@@ -2,16 +2,21 @@
 Error handling and detailed error response utilities
 """
 
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator, Callable, Union
 from datetime import datetime
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 
+from schemas.common import SystemLog, LogLevel
+from utils.responses import ORJSONResponse
+
 
 def create_detailed_error_response(
     message: str,
     status_code: int = 400,
     error_type: str = "ValidationError",
-    details: Optional[Dict[str, Any]] = None,
+    details: Optional[Union[Dict[str, Any], Callable[[], Dict[str, Any]]]] = None,
     component: str = "Unknown",
     operation: str = "Unknown",
     working_dir: Optional[str] = None,
@@ -23,7 +28,8 @@ def create_detailed_error_response(
         message: Error message
         status_code: HTTP status code
         error_type: Type of error (ValidationError, FileNotFound, etc.)
-        details: Additional error details
+        details: Additional error details, or a callable building them so
+            expensive context (e.g. a request dump) is only computed here
         component: Component where error occurred
         operation: Operation being performed
         working_dir: Current working directory
@@ -31,6 +37,8 @@ def create_detailed_error_response(
     Returns:
         JSONResponse with comprehensive error information
     """
+    if callable(details):
+        details = details()
     error_details = details or {}
     error_details.update(
         {
@@ -44,7 +52,7 @@ def create_detailed_error_response(
     if working_dir:
         error_details["working_directory"] = working_dir
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": message,
@@ -56,6 +64,121 @@ def create_detailed_error_response(
     )
 
 
+class DetailedAPIError(Exception):
+    """
+    Error carrying the arguments of create_detailed_error_response
+
+    Raised by error_boundary and turned into the detailed JSON error by the
+    application's exception handler (see to_response).
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        error_type: str,
+        details: Optional[Dict[str, Any]],
+        component: str,
+        operation: str,
+        working_dir: Optional[str] = None,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.error_type = error_type
+        self.details = details
+        self.component = component
+        self.operation = operation
+        self.working_dir = working_dir
+
+    def to_response(self) -> JSONResponse:
+        """Render the error with create_detailed_error_response"""
+        return create_detailed_error_response(
+            self.message,
+            self.status_code,
+            self.error_type,
+            self.details,
+            self.component,
+            self.operation,
+            self.working_dir,
+        )
+
+
+@asynccontextmanager
+async def error_boundary(
+    component: str,
+    operation: str,
+    working_dir: Optional[str],
+    message: str,
+    error_type: str = "UnexpectedError",
+    details: Optional[Callable[[str, str], Dict[str, Any]]] = None,
+    status_code: int = 500,
+) -> AsyncIterator[None]:
+    """
+    Convert unexpected exceptions in the block into a DetailedAPIError
+
+    HTTPException and DetailedAPIError (e.g. from a nested boundary) pass
+    through unchanged. The error details are only built when an exception
+    occurs, and the exception text and type name are computed once for both
+    the message and the details.
+
+    Args:
+        component: Component where error occurred
+        operation: Operation being performed
+        working_dir: Current working directory
+        message: Error message prefix; the exception text is appended
+        error_type: Type of error reported to the client
+        details: Builds the details dict from (error text, exception type
+            name); defaults to exception_type and full_error
+        status_code: HTTP status code
+
+    Raises:
+        DetailedAPIError: For any other exception raised in the block
+    """
+    try:
+        yield
+    except (HTTPException, DetailedAPIError):
+        raise
+    except Exception as e:
+        error_text = str(e)
+        exception_type = type(e).__name__
+        if details is None:
+            error_details = {"exception_type": exception_type, "full_error": error_text}
+        else:
+            error_details = details(error_text, exception_type)
+        raise DetailedAPIError(
+            f"{message}: {error_text}",
+            status_code,
+            error_type,
+            error_details,
+            component,
+            operation,
+            working_dir,
+        ) from e
+
+
+# Debug hints, checked by component first and then by error type
+_COMPONENT_DEBUG_HINTS: Dict[str, str] = {
+    "GitManager": "Check if .codebase directory exists and is properly initialized. Verify file paths are within working directory.",
+    "EditPipeline": "Verify target file exists and is readable. Check if Gemini API key is set. Ensure file has proper syntax.",
+    "WritePipeline": "Verify file path permissions and syntax. Check if dependencies can be resolved.",
+    "MemorySystem": "Check if memory database is initialized and accessible.",
+    "SearchEngine": "Verify search index is built and up to date. Check file patterns and search queries.",
+    "FileOperations": "Ensure file paths are valid and within working directory. Check file permissions.",
+}
+
+_ERROR_TYPE_DEBUG_HINTS: Dict[str, str] = {
+    "FileNotFound": "Verify file path is correct and file exists within the working directory.",
+    "InitializationError": "Check if all required components are properly initialized during startup.",
+    "PermissionDenied": "Ensure you have read/write permissions for the specified path.",
+    "ValidationError": "Check that all required parameters are provided with correct types.",
+}
+
+_DEFAULT_DEBUG_HINT = (
+    "Check server logs for more details. Verify all required services are running."
+)
+
+
 def _get_debug_help(error_type: str, component: str, operation: str) -> str:
     """
     Provide debugging hints based on error context
@@ -68,34 +191,11 @@ def _get_debug_help(error_type: str, component: str, operation: str) -> str:
     Returns:
         Debug help message string
     """
-    debug_hints = {
-        "GitManager": "Check if .codebase directory exists and is properly initialized. Verify file paths are within working directory.",
-        "EditPipeline": "Verify target file exists and is readable. Check if Gemini API key is set. Ensure file has proper syntax.",
-        "WritePipeline": "Verify file path permissions and syntax. Check if dependencies can be resolved.",
-        "MemorySystem": "Check if memory database is initialized and accessible.",
-        "SearchEngine": "Verify search index is built and up to date. Check file patterns and search queries.",
-        "FileOperations": "Ensure file paths are valid and within working directory. Check file permissions.",
-    }
-
-    error_hints = {
-        "FileNotFound": "Verify file path is correct and file exists within the working directory.",
-        "InitializationError": "Check if all required components are properly initialized during startup.",
-        "PermissionDenied": "Ensure you have read/write permissions for the specified path.",
-        "ValidationError": "Check that all required parameters are provided with correct types.",
-    }
-
-    # Component-specific hint
-    if component in debug_hints:
-        return debug_hints[component]
-
-    # Error type-specific hint
-    if error_type in error_hints:
-        return error_hints[error_type]
-
-    # Default hint
-    return (
-        "Check server logs for more details. Verify all required services are running."
-    )
+    # Component-specific hint, then error type-specific hint, then default
+    hint = _COMPONENT_DEBUG_HINTS.get(component)
+    if hint is None:
+        hint = _ERROR_TYPE_DEBUG_HINTS.get(error_type, _DEFAULT_DEBUG_HINT)
+    return hint
 
 
 def add_system_log(
@@ -115,8 +215,6 @@ def add_system_log(
         details: Additional log details
         log_list: List to append logs to (optional, for testing)
     """
-    from schemas.common import SystemLog, LogLevel
-
     log_entry = SystemLog(
         timestamp=datetime.now(),
         level=LogLevel(level),
@@ -2,13 +2,28 @@
 Response helper functions for API endpoints
 """
 
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional
 from datetime import datetime
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
 
 from schemas.responses import APIResponse
 
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson
+
+    Returning this directly from a handler bypasses FastAPI's
+    jsonable_encoder pass; values orjson does not know (e.g. Path) fall
+    back to str().
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 def create_success_response(result: Union[str, Dict[str, Any]]) -> APIResponse:
     """
     Create successful API response
@@ -22,6 +37,26 @@ def create_success_response(result: Union[str, Dict[str, Any]]) -> APIResponse:
     return APIResponse(result=result, success=True)
 
 
+def create_orjson_success_response(
+    result: Union[str, Dict[str, Any]]
+) -> ORJSONResponse:
+    """
+    Create successful API response serialized directly with orjson
+
+    Same envelope as create_success_response, for large payloads where
+    model validation and jsonable_encoder dominate response time.
+
+    Args:
+        result: Response data (string or dict)
+
+    Returns:
+        ORJSONResponse with success=True
+    """
+    return ORJSONResponse(
+        content={"result": result, "timestamp": datetime.now(), "success": True}
+    )
+
+
 def create_error_response(message: str, status_code: int = 400) -> JSONResponse:
     """
     Create error response
@@ -33,7 +68,7 @@ def create_error_response(message: str, status_code: int = 400) -> JSONResponse:
     Returns:
         JSONResponse with error details
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": message,
@@ -41,3 +76,57 @@ def create_error_response(message: str, status_code: int = 400) -> JSONResponse:
             "timestamp": datetime.now().isoformat(),
         },
     )
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """
+    Check the request's If-None-Match header against etag
+
+    Uses weak comparison (RFC 9110), so W/ prefixes on either side are
+    ignored.
+
+    Args:
+        request: Incoming request
+        etag: Current entity tag, or None if the resource has none
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def create_not_modified_response(etag: str) -> Response:
+    """
+    Create a bodyless 304 response for a matching conditional GET
+
+    Args:
+        etag: Entity tag echoed back to the client
+
+    Returns:
+        Response with status 304 and the ETag header
+    """
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def accepts_text(request: Request) -> bool:
+    """
+    Check whether the client asked for text/plain rather than JSON
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        True if the Accept header names text/plain but not application/json
+    """
+    accept = request.headers.get("accept", "")
+    return "text/plain" in accept and "application/json" not in accept
@@ -3,14 +3,124 @@ Utility functions for path validation and file operations
 """
 
 import os
+import stat
+import threading
+import time
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
 from fastapi import HTTPException, status
 
 
+# The resolved working directory is reused for a short time so each request
+# only resolves the requested path. Requested paths themselves are resolved
+# every time: callers reopen them, so a symlink swapped in under the working
+# directory must never be followed on the strength of an earlier check
+WORKING_DIR_CACHE_SIZE = 16
+WORKING_DIR_TTL = 30.0
+
+# Inputs that always mean the working directory itself
+_WORKING_DIR_ALIASES = frozenset({".", "", "./"})
+
+_resolved_working_dirs: "OrderedDict[str, Tuple[float, Path]]" = OrderedDict()
+# Misses are resolved in worker threads
+_resolved_working_dirs_lock = threading.Lock()
+
+# Directory access probes are reused briefly; permissions rarely change
+# between the status polls that ask for them
+DIRECTORY_PROBE_CACHE_SIZE = 64
+DIRECTORY_PROBE_TTL = 1.0
+
+
+
+class DirectoryProbe(NamedTuple):
+    """What a single stat/access probe found out about a path"""
+
+    exists: bool
+    is_directory: bool
+    is_file: bool
+    readable: bool
+    writable: bool
+
+
+_MISSING_PATH = DirectoryProbe(False, False, False, False, False)
+
+_directory_probes: "OrderedDict[str, Tuple[float, DirectoryProbe]]" = OrderedDict()
+
+
+def clear_validated_paths() -> None:
+    """Drop all cached working-directory resolutions"""
+    with _resolved_working_dirs_lock:
+        _resolved_working_dirs.clear()
+
+
+def invalidate_directory_probes(*paths: str) -> None:
+    """Forget cached probes for paths, e.g. after a working-directory change"""
+    for path in paths:
+        _directory_probes.pop(path, None)
+
+
+def _cached_working_dir(working_dir: str) -> Optional[Path]:
+    """Return the cached resolved working directory if not expired"""
+    with _resolved_working_dirs_lock:
+        entry = _resolved_working_dirs.get(working_dir)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > WORKING_DIR_TTL:
+            del _resolved_working_dirs[working_dir]
+            return None
+        _resolved_working_dirs.move_to_end(working_dir)
+        return entry[1]
+
+
+def _resolve_working_dir(working_dir: str) -> Path:
+    """Resolve working_dir, reusing a recent result (blocking on a miss)"""
+    working_path = _cached_working_dir(working_dir)
+    if working_path is not None:
+        return working_path
+
+    working_path = Path(working_dir).resolve()
+    with _resolved_working_dirs_lock:
+        _resolved_working_dirs[working_dir] = (time.monotonic(), working_path)
+        _resolved_working_dirs.move_to_end(working_dir)
+        while len(_resolved_working_dirs) > WORKING_DIR_CACHE_SIZE:
+            _resolved_working_dirs.popitem(last=False)
+    return working_path
+
+
+def _resolve_within(file_path: str, working_dir: str) -> Path:
+    """
+    Resolve file_path against working_dir (blocking)
+
+    Raises:
+        HTTPException: If the resolved path is outside the working directory
+    """
+    working_path = _resolve_working_dir(working_dir)
+    if file_path == ".":
+        abs_path = working_path
+    elif os.path.isabs(file_path):
+        abs_path = Path(file_path).resolve()
+    else:
+        abs_path = Path(working_dir) / file_path
+        abs_path = abs_path.resolve()
+
+    # Ensure path is within working directory
+    if not str(abs_path).startswith(str(working_path)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: path outside working directory",
+        )
+    return abs_path
+
+
 async def validate_file_path(file_path: str, working_dir: str) -> Path:
     """
     Validate and resolve file path within working directory
 
+    The working directory's resolution is cached for WORKING_DIR_TTL
+    seconds; file_path itself is resolved and checked on every call.
+
     Args:
         file_path: Path to validate
         working_dir: Working directory to check against
@@ -21,22 +131,16 @@ async def validate_file_path(file_path: str, working_dir: str) -> Path:
     Raises:
         HTTPException: If path is invalid or outside working directory
     """
+    if file_path in _WORKING_DIR_ALIASES:
+        file_path = "."
+        # The working directory needs no containment check
+        working_path = _cached_working_dir(working_dir)
+        if working_path is not None:
+            return working_path
+
     try:
-        if os.path.isabs(file_path):
-            abs_path = Path(file_path).resolve()
-        else:
-            abs_path = Path(working_dir) / file_path
-            abs_path = abs_path.resolve()
-
-        # Ensure path is within working directory
-        working_path = Path(working_dir).resolve()
-        if not str(abs_path).startswith(str(working_path)):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: path outside working directory",
-            )
-
-        return abs_path
+        # resolve() stats every path component; keep it off the event loop
+        return await asyncio.to_thread(_resolve_within, file_path, working_dir)
     except HTTPException:
         raise
     except Exception as e:
@@ -44,3 +148,58 @@ async def validate_file_path(file_path: str, working_dir: str) -> Path:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid file path: {str(e)}",
         )
+
+
+def _probe_directory(path: str) -> DirectoryProbe:
+    """
+    Probe path with one stat and, usually, one access call (blocking)
+
+    Type comes from the stat mode. Read and write permission are checked
+    together; only when that fails are they checked separately to tell
+    which one is missing.
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return _MISSING_PATH
+
+    if os.access(path, os.R_OK | os.W_OK):
+        readable = writable = True
+    else:
+        # Readable here implies the combined check failed on write
+        readable = os.access(path, os.R_OK)
+        writable = False if readable else os.access(path, os.W_OK)
+    return DirectoryProbe(
+        exists=True,
+        is_directory=stat.S_ISDIR(st.st_mode),
+        is_file=stat.S_ISREG(st.st_mode),
+        readable=readable,
+        writable=writable,
+    )
+
+
+async def probe_directory(path: str) -> DirectoryProbe:
+    """
+    Check whether a directory exists and is readable and writable
+
+    The probe runs in a worker thread so a slow filesystem does not stall
+    the event loop, and results are cached per path for
+    DIRECTORY_PROBE_TTL seconds.
+
+    Args:
+        path: Directory to probe
+
+    Returns:
+        DirectoryProbe with existence, type and permission flags
+    """
+    entry = _directory_probes.get(path)
+    if entry is not None and time.monotonic() - entry[0] <= DIRECTORY_PROBE_TTL:
+        _directory_probes.move_to_end(path)
+        return entry[1]
+
+    result = await asyncio.to_thread(_probe_directory, path)
+    _directory_probes[path] = (time.monotonic(), result)
+    _directory_probes.move_to_end(path)
+    while len(_directory_probes) > DIRECTORY_PROBE_CACHE_SIZE:
+        _directory_probes.popitem(last=False)
+    return result